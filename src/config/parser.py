@@ -199,6 +199,218 @@ def _compile_safe_function(expr: str):
     return f
 
 
+def funktion_aus_ausdruck(expr: str):
+    """
+    Öffentlicher Zugang zum geprüften Funktionsbau (gleiche Grammatik wie f_expr und g_expr).
+
+    Parameter:
+        expr (str): Funktionsausdruck, z.B. "sin(x)" oder "x**2"
+
+    Rückgabe:
+        callable: Funktion f(x) für float oder np.ndarray (ValueError bei unerlaubten Ausdrücken)
+    """
+    return _compile_safe_function(expr)
+
+
+def konstantenwert(name: str) -> float:
+    """
+    Liefert den Wert einer in Funktionsausdrücken erlaubten Konstante (z.B. "pi" oder "e").
+
+    Parameter:
+        name (str): Name der Konstante
+
+    Rückgabe:
+        float: Wert der Konstante (ValueError bei unbekanntem Namen)
+    """
+    if name not in _ALLOWED_CONSTS:
+        raise ValueError(f"Unbekannte Konstante {name!r}")
+    return float(_ALLOWED_CONSTS[name])
+
+
+# ============================================================
+# 3b) Symbolische Ableitung eines Funktionsausdrucks
+#     Wird z.B. für kritische Punkte (Extremstellen) gebraucht
+# ============================================================
+
+# Abgeleitete Ausdrücke dürfen zusätzlich sign(...) enthalten (Ableitung von abs)
+# Der User selbst kann sign nicht verwenden, es taucht nur intern auf
+_DERIV_FUNCS = {**_ALLOWED_FUNCS, "sign": np.sign}
+
+
+def _zahl(v) -> ast.expr:
+    # Konstante als AST-Knoten
+    return ast.Constant(value=v)
+
+
+def _ist_zahl(node: ast.expr, v=None) -> bool:
+    # prüft, ob node eine Zahl ist (optional: genau die Zahl v)
+    if not isinstance(node, ast.Constant) or isinstance(node.value, bool):
+        return False
+    if not isinstance(node.value, (int, float)):
+        return False
+    return v is None or node.value == v
+
+
+def _hat_x(node: ast.expr) -> bool:
+    # hängt der Teilausdruck von x ab?
+    return any(isinstance(n, ast.Name) and n.id == "x" for n in ast.walk(node))
+
+
+# Kleine Bausteine, die triviale Fälle (0 und 1) direkt vereinfachen,
+# damit höhere Ableitungen nicht unnötig groß werden
+def _add(u, v):
+    if _ist_zahl(u, 0):
+        return v
+    if _ist_zahl(v, 0):
+        return u
+    return ast.BinOp(left=u, op=ast.Add(), right=v)
+
+
+def _sub(u, v):
+    if _ist_zahl(v, 0):
+        return u
+    if _ist_zahl(u, 0):
+        return _neg(v)
+    return ast.BinOp(left=u, op=ast.Sub(), right=v)
+
+
+def _mul(u, v):
+    if _ist_zahl(u, 0) or _ist_zahl(v, 0):
+        return _zahl(0)
+    if _ist_zahl(u, 1):
+        return v
+    if _ist_zahl(v, 1):
+        return u
+    return ast.BinOp(left=u, op=ast.Mult(), right=v)
+
+
+def _div(u, v):
+    if _ist_zahl(u, 0):
+        return _zahl(0)
+    if _ist_zahl(v, 1):
+        return u
+    return ast.BinOp(left=u, op=ast.Div(), right=v)
+
+
+def _neg(u):
+    if _ist_zahl(u):
+        return _zahl(-u.value)
+    return ast.UnaryOp(op=ast.USub(), operand=u)
+
+
+def _pot(u, v):
+    return ast.BinOp(left=u, op=ast.Pow(), right=v)
+
+
+def _ruf(name: str, u):
+    return ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=[u], keywords=[])
+
+
+def _ableitung_ast(node: ast.expr) -> ast.expr:
+    """
+    Leitet einen (bereits geprüften) Ausdrucks-AST symbolisch nach x ab.
+
+    Parameter:
+        node (ast.expr): Ausdrucksknoten aus ast.parse(..., mode="eval").body
+
+    Rückgabe:
+        ast.expr: Ausdrucksknoten der Ableitung
+    """
+    # Konstanten und Namen
+    if isinstance(node, ast.Constant):
+        return _zahl(0)
+    if isinstance(node, ast.Name):
+        return _zahl(1) if node.id == "x" else _zahl(0)
+
+    # Vorzeichen
+    if isinstance(node, ast.UnaryOp):
+        du = _ableitung_ast(node.operand)
+        return _neg(du) if isinstance(node.op, ast.USub) else du
+
+    if isinstance(node, ast.BinOp):
+        u, v = node.left, node.right
+        du, dv = _ableitung_ast(u), _ableitung_ast(v)
+        if isinstance(node.op, ast.Add):
+            return _add(du, dv)
+        if isinstance(node.op, ast.Sub):
+            return _sub(du, dv)
+        # Produktregel
+        if isinstance(node.op, ast.Mult):
+            return _add(_mul(du, v), _mul(u, dv))
+        # Quotientenregel
+        if isinstance(node.op, ast.Div):
+            return _div(_sub(_mul(du, v), _mul(u, dv)), _pot(v, _zahl(2)))
+        # Potenz: konstanter Exponent -> c*u**(c-1)*u', sonst u**v*(v'*log(u) + v*u'/u)
+        if isinstance(node.op, ast.Pow):
+            if not _hat_x(v):
+                return _mul(_mul(v, _pot(u, _sub(v, _zahl(1)))), du)
+            return _mul(node, _add(_mul(dv, _ruf("log", u)), _div(_mul(v, du), u)))
+        # Modulo mit konstantem Modul: Ableitung stückweise wie u
+        if isinstance(node.op, ast.Mod):
+            if _hat_x(v):
+                raise ValueError("Ableitung von u % v nur für konstantes v möglich")
+            return du
+
+    if isinstance(node, ast.Call):
+        u = node.args[0]
+        du = _ableitung_ast(u)
+        name = node.func.id
+        if name == "sin":
+            innen = _ruf("cos", u)
+        elif name == "cos":
+            innen = _neg(_ruf("sin", u))
+        elif name == "tan":
+            innen = _div(_zahl(1), _pot(_ruf("cos", u), _zahl(2)))
+        elif name == "arcsin":
+            innen = _div(_zahl(1), _ruf("sqrt", _sub(_zahl(1), _pot(u, _zahl(2)))))
+        elif name == "arccos":
+            innen = _neg(_div(_zahl(1), _ruf("sqrt", _sub(_zahl(1), _pot(u, _zahl(2))))))
+        elif name == "arctan":
+            innen = _div(_zahl(1), _add(_zahl(1), _pot(u, _zahl(2))))
+        elif name == "exp":
+            innen = _ruf("exp", u)
+        elif name == "log":
+            innen = _div(_zahl(1), u)
+        elif name == "sqrt":
+            innen = _div(_zahl(1), _mul(_zahl(2), _ruf("sqrt", u)))
+        elif name in ("abs", "sign"):
+            # abs' = sign (außer im Knick), sign' = 0 (außer im Sprung)
+            innen = _ruf("sign", u) if name == "abs" else _zahl(0)
+        else:
+            raise ValueError(f"Keine Ableitungsregel für {name!r}")
+        # Kettenregel
+        return _mul(innen, du)
+
+    raise ValueError(f"Nicht ableitbares Syntaxelement {type(node).__name__}")
+
+
+def ableitung(expr: str, ordnung: int = 1):
+    """
+    Erstellt aus einem Funktionsausdruck die symbolische Ableitung als auswertbare Funktion f'(x).
+
+    Parameter:
+        expr (str): Funktionsausdruck, z.B. "sin(x)" oder "x**2"
+        ordnung (int): Ordnung der Ableitung (1 = erste Ableitung, 3 = dritte Ableitung, ...)
+
+    Rückgabe:
+        callable: Funktion, die für x (float oder np.ndarray) die Ableitung auswertet
+    """
+    # Grammatik wie bei f und g prüfen (wirft ValueError bei unerlaubten Ausdrücken)
+    _compile_safe_function(expr)
+    body = ast.parse(expr, mode="eval").body
+    for _ in range(ordnung):
+        body = _ableitung_ast(body)
+    tree = ast.fix_missing_locations(ast.Expression(body=body))
+    code = compile(tree, "<ableitung>", "eval")
+
+    def df(x):
+        local_env = {"x": x, **_ALLOWED_CONSTS}
+        global_env = {"__builtins__": {}, **_DERIV_FUNCS}
+        return eval(code, global_env, local_env)
+
+    return df
+
+
 
 # ============================================================
 # 4) Hauptparser: liest die Datei und baut das Werte-Dict
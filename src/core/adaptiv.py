@@ -0,0 +1,121 @@
+import heapq#Warteschlange der Teilintervalle
+import math#fsum
+import numpy as np#arrays
+
+# Gauß-Kronrod-Regel G7/K15 auf [-1,1] (Werte wie in QUADPACK)
+# Kronrod-Knoten (nichtnegativ, absteigend); die Knoten mit ungeradem Index sind die Gauß-Knoten
+_XK = np.array([0.991455371120812639206854697526329,
+                0.949107912342758524526189684047851,
+                0.864864423359769072789712788640926,
+                0.741531185599394439863864773280788,
+                0.586087235467691130294144845693013,
+                0.405845151377397166906606412076961,
+                0.207784955007898467600689403773245,
+                0.000000000000000000000000000000000])
+_WK = np.array([0.022935322010529224963732008058970,
+                0.063092092629978553290700663189204,
+                0.104790010322250183839876322541518,
+                0.140653259715525918745189590510238,
+                0.169004726639267902826583426598550,
+                0.190350578064785409913256402421014,
+                0.204432940075298892414161999234649,
+                0.209482141084727828012999174891714])
+_WG = np.array([0.129484966168869693270611432679082,
+                0.279705391489276667901467771423780,
+                0.381830050505118944950369775488975,
+                0.417959183673469387755102040816327])
+# alle 15 Knoten mit Gewichten (Kronrod und eingebettete Gauß-Regel, 0 für Nicht-Gauß-Knoten)
+_X15 = np.concatenate((-_XK[:-1], _XK[::-1]))
+_W15 = np.concatenate((_WK[:-1], _WK[::-1]))
+_WG15 = np.zeros(15)
+_WG15[[1, 3, 5, 7, 9, 11, 13]] = np.concatenate((_WG[:-1], _WG[::-1]))
+
+
+def _gk15(f, l, r):
+    """
+    Wertet die Gauß-Kronrod-Regel G7/K15 auf vielen Teilintervallen gleichzeitig aus
+    (ein Funktionsaufruf für alle 15*m Knoten).
+
+    Parameter:
+        f (callable): Zu integrierende Funktion (vektorisiert)
+        l (np.ndarray): Linke Grenzen der m Teilintervalle
+        r (np.ndarray): Rechte Grenzen der m Teilintervalle
+
+    Rückgabe:
+        tuple: (K, e)
+            K (np.ndarray): Kronrod-Näherungen der Teilintegrale
+            e (np.ndarray): Fehlerschätzung |K - G| je Teilintervall
+    """
+    c = 0.5 * (l + r)
+    hw = 0.5 * (r - l)
+    x = c[:, None] + hw[:, None] * _X15
+    y = f(x.ravel())
+    # konstante Funktionen liefern evtl. nur einen Skalar -> auf Länge von x aufweiten
+    y = np.broadcast_to(np.asarray(y, dtype=float), (x.size,)).reshape(x.shape)
+    K = hw * (y @ _W15)
+    G = hw * (y @ _WG15)
+    return K, np.abs(K - G)
+
+
+def adaptiv_gk(err, h, hs, a, b, mode=0, batch=32, maxint=10**5):
+    """
+    Adaptive Gauß-Kronrod-Quadratur (G7/K15) ohne Rekursion.
+
+    Die Teilintervalle liegen in einem Heap, geordnet nach ihrer Fehlerschätzung. Pro Schritt werden
+    die Teilintervalle mit dem größten Fehler halbiert (höchstens batch, nur so viele, wie für err nötig wären)
+    und die Hälften gemeinsam (vektorisiert) ausgewertet. So wird nur dort verfeinert, wo der Integrand
+    es braucht (z.B. an Knicken von |f-g|).
+    Gestoppt wird, wenn die geschätzte Gesamtfehlersumme err unterschreitet (kein Referenzwert nötig)
+    oder maxint Teilintervalle erreicht sind (dann ist erreicht = False).
+    Die Fehlersumme wird laufend mitgeführt und nur gelegentlich (und vor dem Stoppen) exakt neu summiert,
+    der Aufwand pro Schritt hängt also nicht von der Größe des Heaps ab.
+
+    Parameter:
+        err (float): Fehlertoleranz für die geschätzte Gesamtfehlersumme
+        h (callable): Funktion h(x)
+        hs (callable): Funktion hs(x)
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        mode (int): 0 nutzt h, 1 nutzt hs
+        batch (int): Maximale Anzahl Teilintervalle, die pro Schritt halbiert werden
+        maxint (int): Maximale Anzahl Teilintervalle
+
+    Rückgabe:
+        tuple: (n, ak, erreicht)
+            n (int): Anzahl der Teilintervalle am Ende
+            ak (float): Adaptive Näherung des Integrals der gewählten Funktion
+            erreicht (bool): True, wenn die geschätzte Fehlersumme err unterschritten hat
+    """
+    f = h if mode == 0 else hs
+    # Start: ganzes Intervall
+    K, e = _gk15(f, np.array([float(a)]), np.array([float(b)]))
+    # Heap-Einträge: (-Fehler, links, rechts, Teilintegral) -> größter Fehler zuerst
+    heap = [(-e[0], float(a), float(b), K[0])]
+    fehler = e[0]
+    schritt = 0
+    while len(heap) < maxint:
+        if fehler < err or schritt % 64 == 0:
+            # laufende Summe auffrischen (Rundungsfehler der Differenzen), vor dem Stoppen immer exakt
+            fehler = math.fsum(-t[0] for t in heap)
+            if fehler < err:
+                break
+        schritt += 1
+        # schlechteste Teilintervalle entnehmen, bis der Rest err unterschreitet (höchstens batch Stück)
+        m = min(batch, maxint - len(heap))
+        teile, rest = [], fehler
+        while heap and len(teile) < m and rest >= err:
+            teile.append(heapq.heappop(heap))
+            rest += teile[-1][0]
+        l = np.array([t[1] for t in teile])
+        r = np.array([t[2] for t in teile])
+        mitte = 0.5 * (l + r)
+        # beide Hälften aller entnommenen Teilintervalle in einem Aufruf auswerten
+        K, e = _gk15(f, np.concatenate((l, mitte)), np.concatenate((mitte, r)))
+        for eintrag in zip(-e, np.concatenate((l, mitte)), np.concatenate((mitte, r)), K):
+            heapq.heappush(heap, eintrag)
+        # laufende Fehlersumme: entnommene Fehler ab, neue Fehler dazu
+        fehler = rest + float(np.sum(e))
+    else:
+        fehler = math.fsum(-t[0] for t in heap)
+    #Rückgabe
+    return len(heap), math.fsum(t[3] for t in heap), bool(fehler < err)
@@ -0,0 +1,106 @@
+import numpy as np#arrays
+from scipy.fft import dct
+
+def _auswerten(f, xs):
+    """
+    Wertet f an den Stellen xs aus (konstante Funktionen liefern evtl. nur einen Skalar -> aufweiten).
+
+    Parameter:
+        f (callable): Zu integrierende Funktion
+        xs (np.ndarray): Auswertestellen
+
+    Rückgabe:
+        np.ndarray: Funktionswerte (gleiche Länge wie xs)
+    """
+    return np.broadcast_to(np.asarray(f(xs), dtype=float), xs.shape)
+
+
+def _tschebyschow(ys, a, b):
+    """
+    Berechnet aus den Werten an den Tschebyschow-Punkten x_j = cos(pi*j/n), j=0..n, die Tschebyschow-Koeffizienten
+    (DCT-I über FFT, O(n log n)), das Clenshaw-Curtis-Integral und eine Fehlerschätzung aus dem Abklingen der Koeffizienten.
+
+    Parameter:
+        ys (np.ndarray): Funktionswerte an den n+1 Tschebyschow-Punkten (auf [a,b] abgebildet)
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+
+    Rückgabe:
+        tuple: (cs, est)
+            cs (float): Clenshaw-Curtis-Näherung des Integrals
+            est (float): Fehlerschätzung (Betrag der letzten Koeffizienten, auf [a,b] skaliert)
+    """
+    n = ys.size - 1
+    if n == 0:
+        return (b - a) * float(ys[0]), np.inf
+    # Koeffizienten der Interpolante p(x) = sum c_k T_k(x), Rand-Koeffizienten halbiert
+    c = dct(ys, type=1) / n
+    c[0] *= 0.5
+    c[-1] *= 0.5
+    # Integral von T_k über [-1,1]: 2/(1-k^2) für gerade k, 0 für ungerade k
+    k = np.arange(0, n + 1, 2)
+    cs = 0.5 * (b - a) * float(np.sum(c[::2] * 2.0 / (1.0 - k ** 2)))
+    # Fehlerschätzung: Größe der letzten drei Koeffizienten (drei, damit gerade/ungerade Symmetrie keine Null vortäuscht)
+    est = (b - a) * float(np.max(np.abs(c[-3:])))
+    return cs, est
+
+
+def clenshaw_curtis(nc, h, hs, a, b, mode=0):
+    """
+    Berechnet die Clenshaw-Curtis-Näherung des Integrals auf [a,b] mit nc+1 Tschebyschow-Punkten.
+
+    Parameter:
+        nc (int): Grad der Interpolante (Anzahl der Punkte minus 1)
+        h (callable): Funktion h(x)
+        hs (callable): Funktion hs(x)
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        mode (int): 0 nutzt h, 1 nutzt hs
+
+    Rückgabe:
+        float: Clenshaw-Curtis-Näherung des Integrals der gewählten Funktion
+    """
+    f = h if mode == 0 else hs
+    # Tschebyschow-Punkte auf [a,b]
+    xs = 0.5 * (a + b) + 0.5 * (b - a) * np.cos(np.pi * np.arange(nc + 1) / nc)
+    cs, _ = _tschebyschow(_auswerten(f, xs), a, b)
+    #Rückgabe
+    return cs
+
+
+def clenshaw_curtis_err(err, h, hs, a, b, mode=0, nmax=2**20):
+    """
+    Verdoppelt den Grad n der Clenshaw-Curtis-Regel, bis die Fehlerschätzung aus dem Abklingen der
+    Tschebyschow-Koeffizienten err unterschreitet (kein Referenzwert nötig) oder nmax erreicht ist
+    (dann ist erreicht = False). Die Gitter sind verschachtelt: bei n -> 2n werden nur die n neuen Punkte ausgewertet.
+
+    Parameter:
+        err (float): Fehlertoleranz für die Fehlerschätzung
+        h (callable): Funktion h(x)
+        hs (callable): Funktion hs(x)
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        mode (int): 0 nutzt h, 1 nutzt hs
+        nmax (int): Maximaler Grad
+
+    Rückgabe:
+        tuple: (n, cs, erreicht)
+            n (int): Gefundener Grad (Potenz von 2, n+1 Punkte)
+            cs (float): Clenshaw-Curtis-Näherung bei diesem n
+            erreicht (bool): True, wenn die Fehlerschätzung err unterschritten hat
+    """
+    f = h if mode == 0 else hs
+    m, r = 0.5 * (a + b), 0.5 * (b - a)
+    # Start bei n = 8 (wenige Koeffizienten täuschen sonst leicht Konvergenz vor)
+    n = 8
+    ys = _auswerten(f, m + r * np.cos(np.pi * np.arange(n + 1) / n))
+    cs, est = _tschebyschow(ys, a, b)
+    while est >= err and n < nmax:
+        # neue Punkte liegen genau zwischen den alten (ungerade Indizes des feineren Gitters)
+        y_neu = np.empty(2 * n + 1)
+        y_neu[0::2] = ys
+        y_neu[1::2] = _auswerten(f, m + r * np.cos(np.pi * (2 * np.arange(n) + 1) / (2 * n)))
+        ys, n = y_neu, 2 * n
+        cs, est = _tschebyschow(ys, a, b)
+    #Rückgabe
+    return n, cs, bool(est < err)
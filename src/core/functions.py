@@ -1,5 +1,7 @@
+import weakref
 import numpy as np
-from scipy.interpolate import CubicSpline
+from scipy.interpolate import CubicSpline, PPoly
+from scipy.optimize import minimize_scalar
 
 # Betragsfunktion aus zwei Funktionen
 def betragsfunk(f, g):
@@ -71,41 +73,223 @@ def splinebetrag(pl):
     # Speicherung
     return h
 
-def randomsmonte(a,b,N,h,hs,kma,f_raw,mode=0):
+# Ableitung der Betragsfunktion |f - g|
+def betragsableitung(f, g, df, dg, df1=None, dg1=None):
     """
-    Erzeugt Zufallspunkte für ein geometrisches Monte Carlo Verfahren und schätzt ein ymax im Intervall [a,b] durch Abtastung.
+    Erstellt die Ableitung von h(x) = |f(x) - g(x)| außerhalb der Nullstellen von f - g:
+    h^(k)(x) = sign(f(x) - g(x)) * (f^(k)(x) - g^(k)(x)).
+    Liegt x genau auf einer Nullstelle von f - g (z.B. am Rand), wird das Vorzeichen einseitig über die erste
+    Ableitung bestimmt: seite=+1 liefert den rechtsseitigen, seite=-1 den linksseitigen Grenzwert.
+
+    Parameter:
+        f (callable): Erste Funktion f(x)
+        g (callable): Zweite Funktion g(x)
+        df (callable): k-te Ableitung von f
+        dg (callable): k-te Ableitung von g
+        df1 (callable | None): Erste Ableitung von f (nur für das Vorzeichen an Nullstellen, Standard: df)
+        dg1 (callable | None): Erste Ableitung von g (nur für das Vorzeichen an Nullstellen, Standard: dg)
+
+    Rückgabe:
+        callable: Funktion dh(x, seite=1) mit der k-ten Ableitung von h
+    """
+    df1 = df if df1 is None else df1
+    dg1 = dg if dg1 is None else dg1
+    def dh(x, seite=1):
+        s = np.sign(f(x) - g(x))
+        # auf einer Nullstelle: Vorzeichen von f - g direkt daneben (Seite beachten)
+        s = np.where(s == 0, seite * np.sign(df1(x) - dg1(x)), s)
+        return s * (df(x) - dg(x))
+    return dh
+
+# Ableitung der Betragsfunktion aus zwei Splines
+def splinebetrag_ableitung(pl, ordnung=1):
+    """
+    Erstellt die Ableitung der Ordnung ordnung von hs(x) = |s1(x) - s2(x)| (außerhalb der Nullstellen von s1 - s2),
+    exakt über die PPoly-Darstellung der Spline-Differenz. Vorzeichen an Nullstellen wie bei betragsableitung.
+
+    Parameter:
+        pl (list): Liste mit mindestens zwei Elementen, jeweils (x_liste, y_liste) für die Spline-Stützpunkte
+        ordnung (int): Ordnung der Ableitung
+
+    Rückgabe:
+        callable: Funktion dhs(x, seite=1) mit der Ableitung von hs
+    """
+    d = splinedifferenz(pl)
+    d1 = d.derivative(1)
+    dk = d.derivative(ordnung)
+    def dhs(x, seite=1):
+        s = np.sign(d(x))
+        s = np.where(s == 0, seite * np.sign(d1(x)), s)
+        return s * dk(x)
+    return dhs
+
+# Cache der Monte-Carlo-Höhen ymax: f_raw -> {(a, b, kma, verfeinern): ymax}
+# Schwache Referenz auf die Funktion, damit Einträge mit der Funktion verschwinden.
+_YMAX_CACHE = weakref.WeakKeyDictionary()
+
+def ymax_cache_leeren():
+    """
+    Leert den ymax-Cache (z.B. zu Beginn eines neuen Auswertungslaufs).
+
+    Rückgabe:
+        keine
+    """
+    _YMAX_CACHE.clear()
+
+def _ymax_abtasten(a, b, kma, f_raw, verfeinern=False):
+    """
+    Bestimmt ymax durch Abtasten an kma Punkten, optional mit lokaler Maximierung (beschränkt, Brent)
+    im Bereich um den besten Abtastpunkt. Die Verfeinerung kann ymax nur vergrößern.
+
+    Parameter:
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        kma (int): Anzahl der Abtastpunkte
+        f_raw (callable): Ungezählte Funktion
+        verfeinern (bool): Lokale Maximierung ausgehend vom besten Abtastpunkt
+
+    Rückgabe:
+        float: Approximiertes Maximum von f_raw auf [a,b]
+    """
+    xapr=np.linspace(a,b,kma)#x-Werte um Funktion abzutasten
+    yapr = np.broadcast_to(np.asarray(f_raw(xapr), dtype=float), xapr.shape)
+    i = int(np.argmax(yapr))
+    ymax=float(yapr[i])#Maximum
+    if verfeinern and kma > 1:
+        # Suchbereich: Nachbarn des besten Abtastpunkts
+        xl, xr = xapr[max(i - 1, 0)], xapr[min(i + 1, kma - 1)]
+        fx = lambda x: -float(np.asarray(f_raw(np.array([x])), dtype=float).ravel()[0])
+        res = minimize_scalar(fx, bounds=(xl, xr), method="bounded")
+        if np.isfinite(res.fun):
+            ymax = max(ymax, -float(res.fun))
+    return ymax
+
+def monte_ymax(a,b,h,hs,kma,f_raw,mode=0,verfeinern=False):
+    """
+    Schätzt das Maximum ymax der gewählten Funktion auf [a,b] durch Abtastung (Höhe des Monte-Carlo-Rechtecks).
+    Das Ergebnis wird je Funktion f_raw und (a, b, kma, verfeinern) zwischengespeichert, wiederholte Aufrufe
+    aus den verschiedenen Monte-Carlo-Verfahren tasten also nicht erneut ab (siehe ymax_cache_leeren).
 
     Parameter:
         a (float): Linke Intervallgrenze
         b (float): Rechte Intervallgrenze
-        N (int): Anzahl der Zufallspunkte
         h (callable): Funktion h(x), wird je nach mode einmal ausgewertet (z.B. für Funktionsaufruf-Zählung)
         hs (callable): Funktion hs(x), wird je nach mode einmal ausgewertet (z.B. für Funktionsaufruf-Zählung)
         kma (int): Anzahl der Abtastpunkte zur Approximation des Maximums
         f_raw (callable): Funktion, die für die Maximumsuche abgetastet wird (nicht gezählt)
         mode (int): 0 nutzt h für den Zählaufruf, 1 nutzt hs für den Zählaufruf
+        verfeinern (bool): Lokale Maximierung ausgehend vom besten Abtastpunkt
 
     Rückgabe:
-        tuple: (xz, yz, ymax)
-            xz (np.ndarray): Zufällige x-Werte in [a,b] (Länge N)
-            yz (np.ndarray): Zufällige y-Werte in [0, ymax] (Länge N)
-            ymax (float): Approximiertes Maximum der abgetasteten Funktion f_raw auf [a,b]
+        float: Approximiertes Maximum der abgetasteten Funktion f_raw auf [a,b]
     """
-    #Funktion die Zufallspunkte erstellt
-    #Annäherung der globalen Maxima von h und hs
-    xapr=np.linspace(a,b,kma)#x-Werte um Funktion abzutasten
-    fr = f_raw#Funktion die nicht gezählt wird (Zähler durch fr +1 pro durchlauf)
-    #Berechnung je nach Mode
+    schluessel = (float(a), float(b), int(kma), bool(verfeinern))
+    try:
+        eintraege = _YMAX_CACHE.setdefault(f_raw, {})
+    except TypeError:
+        # Funktion ohne schwache Referenz (z.B. eingebaute Funktion) -> ohne Cache
+        eintraege = {}
+    if schluessel not in eintraege:
+        eintraege[schluessel] = _ymax_abtasten(a, b, kma, f_raw, verfeinern)
+    ymax = eintraege[schluessel]
+    #Zählaufruf je nach Mode
+    xm=(a+b)/2#x-Wert für Zählung
     if mode==0:
-        ymax=float(np.max(fr(xapr)))#Maximum h
-        xm=(a+b)/2#x-Wert für Zählung
         _=h(xm)#Funktionsaufruf
     elif mode==1:
-        ymax=float(np.max(fr(xapr)))#Maximum h
-        xm=(a+b)/2
         _=hs(xm)
-    #Punkteerstellung
-    xz = np.random.uniform(a, b, N)  # Zufällige x-Werte
-    yz = np.random.uniform(0,ymax, N) # Zufällige y-Werte für f
-    #Speicherung
-    return xz, yz,ymax
+    return ymax
+
+def splinedifferenz(pl, a=None, b=None):
+    """
+    Stellt die Differenz s1 - s2 der beiden natural CubicSplines aus pl exakt als stückweises Polynom (PPoly) dar.
+    Auf der Vereinigung der Stützstellen beider Splines (plus optional a und b) ist s1 - s2 stückweise kubisch,
+    die Koeffizienten werden aus den Ableitungen in der Mitte jedes Stücks gewonnen.
+
+    Parameter:
+        pl (list): Liste mit mindestens zwei Elementen, jeweils (x_liste, y_liste) für die Spline-Stützpunkte
+        a (float | None): Optionale linke Intervallgrenze, wird als zusätzlicher Bruchpunkt aufgenommen
+        b (float | None): Optionale rechte Intervallgrenze, wird als zusätzlicher Bruchpunkt aufgenommen
+
+    Rückgabe:
+        PPoly: Stückweises Polynom d(x) = s1(x) - s2(x) (außerhalb der Bruchpunkte wie die Splines extrapoliert)
+    """
+    cs1 = spline(pl, 0)
+    cs2 = spline(pl, 1)
+    # gemeinsame Bruchpunkte
+    xb = [cs1.x, cs2.x]
+    if a is not None and b is not None:
+        xb.append(np.array([a, b], dtype=float))
+    xb = np.unique(np.concatenate(xb))
+    # Ableitungen der Differenz in der Stückmitte (dort ist d ein einziges kubisches Polynom)
+    xm = 0.5 * (xb[:-1] + xb[1:])
+    D = [cs1(xm, nu) - cs2(xm, nu) for nu in range(4)]
+    # Taylor-Verschiebung von der Mitte auf den linken Bruchpunkt (t = x_links - x_mitte)
+    t = xb[:-1] - xm
+    c3 = D[3] / 6
+    c2 = (D[2] + D[3] * t) / 2
+    c1 = D[1] + D[2] * t + D[3] * t**2 / 2
+    c0 = D[0] + D[1] * t + D[2] * t**2 / 2 + D[3] * t**3 / 6
+    return PPoly(np.vstack([c3, c2, c1, c0]), xb)
+
+def kritische_punkte_spline(pl, a, b):
+    """
+    Bestimmt die kritischen Punkte von hs(x) = |s1(x) - s2(x)| auf [a,b] exakt:
+    Nullstellen von s1 - s2 (Knicke von hs) und Nullstellen der Ableitung (lokale Extrema).
+
+    Parameter:
+        pl (list): Liste mit mindestens zwei Elementen, jeweils (x_liste, y_liste) für die Spline-Stützpunkte
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+
+    Rückgabe:
+        np.ndarray: Sortierte kritische Punkte im Inneren von [a,b] (ohne Ränder)
+    """
+    d = splinedifferenz(pl, a, b)
+    # Nullstellen von d und d' (auf Stücken mit d == 0 liefert roots NaN -> verwerfen)
+    xk = np.concatenate([d.roots(extrapolate=False), d.derivative().roots(extrapolate=False)])
+    xk = xk[np.isfinite(xk)]
+    xk = xk[(xk > a) & (xk < b)]
+    return np.unique(xk)
+
+def _nullstellen_raster(phi, xg, it=60):
+    # Vorzeichenwechsel von phi auf dem Raster xg suchen und per (vektorisierter) Bisektion verfeinern
+    yg = np.broadcast_to(np.asarray(phi(xg), dtype=float), xg.shape)
+    # exakte Nullstellen auf dem Raster
+    xk = [xg[yg == 0.0]]
+    # Klammern mit Vorzeichenwechsel (NaN-Werte zählen nicht)
+    wechsel = np.isfinite(yg[:-1]) & np.isfinite(yg[1:]) & (yg[:-1] * yg[1:] < 0)
+    xl, xr = xg[:-1][wechsel], xg[1:][wechsel]
+    sl = np.sign(yg[:-1][wechsel])
+    for _ in range(it):
+        if xl.size == 0:
+            break
+        xm = 0.5 * (xl + xr)
+        sm = np.sign(np.broadcast_to(np.asarray(phi(xm), dtype=float), xm.shape))
+        links = (sm == sl)
+        xl = np.where(links, xm, xl)
+        xr = np.where(links, xr, xm)
+    xk.append(0.5 * (xl + xr))
+    return np.concatenate(xk)
+
+def kritische_punkte(d, dd, a, b, m=10001):
+    """
+    Bestimmt Kandidaten für die Extremstellen von |d(x)| auf [a,b] für beliebige (z.B. geparste) Funktionen:
+    Nullstellen von d (Knicke von |d|) und Nullstellen von dd = d' (lokale Extrema).
+    Gesucht wird über Vorzeichenwechsel auf einem Raster mit m Punkten, die anschließend per Bisektion
+    auf Maschinengenauigkeit verfeinert werden. Nullstellenpaare innerhalb eines Rasterabstands können dabei übersehen werden.
+
+    Parameter:
+        d (callable): Differenzfunktion d(x) = f(x) - g(x)
+        dd (callable): Ableitung d'(x) = f'(x) - g'(x)
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        m (int): Anzahl der Rasterpunkte für die Vorzeichensuche
+
+    Rückgabe:
+        np.ndarray: Sortierte kritische Punkte im Inneren von [a,b] (ohne Ränder)
+    """
+    xg = np.linspace(a, b, m)
+    xk = np.concatenate([_nullstellen_raster(d, xg), _nullstellen_raster(dd, xg)])
+    xk = xk[(xk > a) & (xk < b)]
+    return np.unique(xk)
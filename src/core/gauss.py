@@ -0,0 +1,97 @@
+import numpy as np#arrays
+
+# Cache der Gauß-Legendre-Knoten und -Gewichte auf [-1,1] je Ordnung (prozessweit, einmal berechnet)
+_TABELLEN = {}
+
+def gauss_tabelle(ordnung):
+    """
+    Liefert Knoten und Gewichte der Gauß-Legendre-Regel auf [-1,1]. Jede Ordnung wird nur einmal berechnet.
+
+    Parameter:
+        ordnung (int): Anzahl der Knoten pro Teilintervall
+
+    Rückgabe:
+        tuple: (xg, wg)
+            xg (np.ndarray): Knoten auf [-1,1]
+            wg (np.ndarray): Gewichte (Summe 2)
+    """
+    ordnung = int(ordnung)
+    if ordnung < 1:
+        raise ValueError("ordnung muss mindestens 1 sein")
+    if ordnung not in _TABELLEN:
+        xg, wg = np.polynomial.legendre.leggauss(ordnung)
+        # schreibgeschützt, damit der Cache nicht versehentlich verändert wird
+        xg.flags.writeable = False
+        wg.flags.writeable = False
+        _TABELLEN[ordnung] = (xg, wg)
+    return _TABELLEN[ordnung]
+
+
+def gaussregel(ng, h, hs, a, b, mode=0, ordnung=5):
+    """
+    Berechnet die zusammengesetzte Gauß-Legendre-Näherung für das Integral auf [a,b].
+    [a,b] wird in ng gleich lange Teilintervalle zerlegt, auf jedem wird die Gauß-Regel mit ordnung Knoten
+    angewendet. Alle ng*ordnung Knoten werden in einem Funktionsaufruf ausgewertet.
+
+    Parameter:
+        ng (int): Anzahl der Teilintervalle
+        h (callable): Funktion h(x)
+        hs (callable): Funktion hs(x)
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        mode (int): 0 nutzt h, 1 nutzt hs
+        ordnung (int): Anzahl der Gauß-Knoten pro Teilintervall
+
+    Rückgabe:
+        float: Gauß-Legendre-Näherung des Integrals der gewählten Funktion
+    """
+    xg, wg = gauss_tabelle(ordnung)
+    #Feinheit der Zerlegung
+    dx = (b - a) / ng
+    # Mittelpunkte der Teilintervalle, Knoten als (ng, ordnung)-Gitter
+    c = a + (np.arange(ng) + 0.5) * dx
+    xs = (c[:, None] + (0.5 * dx) * xg).ravel()
+    if mode == 0:
+        ys = h(xs)  # y-Werte h
+    elif mode == 1:
+        ys = hs(xs)  # y-Werte hs
+    # konstante Funktionen liefern evtl. nur einen Skalar -> auf Länge von xs aufweiten
+    ys = np.broadcast_to(np.asarray(ys, dtype=float), xs.shape).reshape(ng, -1)
+    #Rückgabe
+    return 0.5 * dx * float(np.sum(ys @ wg))
+
+
+def gausserr(err, h, hs, a, b, Ai, k=1, mode=0, ordnung=5):
+    """
+    Erhöht ng iterativ (Potenzen von 2), bis die Gauß-Legendre-Näherung den Fehler err gegenüber dem Referenzwert Ai unterschreitet.
+
+    Parameter:
+        err (float): Fehlertoleranz für |Ai - Gauß|
+        h (callable): Funktion h(x)
+        hs (callable): Funktion hs(x)
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        Ai (float): Referenzintegralwert der Zielfunktion
+        k (int): Schrittweite, mit der der Exponent q erhöht wird (ng = 2**q)
+        mode (int): 0 nutzt h, 1 nutzt hs
+        ordnung (int): Anzahl der Gauß-Knoten pro Teilintervall
+
+    Rückgabe:
+        tuple: (ng, gs)
+            ng (int): Gefundene Teilintervallzahl (als Potenz von 2)
+            gs (float): Gauß-Legendre-Näherung bei diesem ng
+    """
+    # Startwerte (erste Rechnung bei ng = 1)
+    ng,q = 1,1
+    gs = gaussregel(ng, h, hs, a, b, mode, ordnung)
+    # ng erhöhen, bis Fehler klein genug ist
+    while True:
+        #Stoppen wenn err erreicht
+        if abs(gs-Ai) < err:
+            break
+        else:
+            ng=2**q
+            q+=k
+            gs = gaussregel(ng, h, hs, a, b, mode, ordnung)
+    #Rückgabe
+    return ng, gs
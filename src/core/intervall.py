@@ -0,0 +1,272 @@
+import ast
+import numpy as np
+from config.parser import funktion_aus_ausdruck, konstantenwert
+
+# ------------------------------------------------------------
+# Intervallarithmetik für geparste Funktionsausdrücke
+# ------------------------------------------------------------
+#
+# Idee:
+# Statt f an einzelnen Punkten auszuwerten, wird f auf ganzen Intervallen [lo, hi]
+# ausgewertet. Jede Operation liefert ein Intervall, das alle möglichen Werte sicher
+# einschließt. Damit erhält man für jedes Teilintervall einer Zerlegung garantierte
+# Schranken für Minimum und Maximum (ohne Abtasten).
+#
+# Alle Operationen arbeiten vektorisiert: lo und hi sind Arrays, jedes Element steht
+# für ein eigenes Teilintervall.
+#
+# Rundung:
+# Die Grenzen werden nach jeder Operation leicht nach außen verschoben, damit auch
+# Rundungsfehler (und die wenigen ulp Ungenauigkeit von np.sin, np.exp, ...) abgedeckt sind.
+# Undefinierte Ergebnisse (NaN, z.B. log auf negativen Werten) werden zu (-inf, inf).
+
+_EPS = np.finfo(float).eps
+_TINY = np.finfo(float).tiny
+
+
+def _aussen(lo, hi, ulp=1):
+    # Grenzen um ulp relative Maschinengenauigkeiten nach außen runden
+    lo = lo - (np.abs(lo) * (ulp * _EPS) + _TINY)
+    hi = hi + (np.abs(hi) * (ulp * _EPS) + _TINY)
+    # undefinierte Werte -> ganze Zahlengerade
+    nan = np.isnan(lo) | np.isnan(hi)
+    if np.any(nan):
+        lo = np.where(nan, -np.inf, lo)
+        hi = np.where(nan, np.inf, hi)
+    return lo, hi
+
+
+def _konstante(c, form):
+    # Konstante als (gerundetes) Punktintervall
+    lo = np.full(form, float(c))
+    return _aussen(lo, lo.copy())
+
+
+def _mul(a, b, c, d):
+    # [a,b] * [c,d]: Minimum/Maximum der vier Eckprodukte (0*inf wird als 0 gewertet)
+    with np.errstate(invalid="ignore"):
+        p = np.stack([a * c, a * d, b * c, b * d])
+    p = np.where(np.isnan(p), 0.0, p)
+    return _aussen(np.min(p, axis=0), np.max(p, axis=0))
+
+
+def _div(a, b, c, d):
+    # [a,b] / [c,d]: enthält der Nenner die 0, ist keine Schranke möglich
+    null = (c <= 0) & (d >= 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lo, hi = _mul(a, b, 1.0 / d, 1.0 / c)
+    return np.where(null, -np.inf, lo), np.where(null, np.inf, hi)
+
+
+def _ganzzahlige_potenz(a, b, n):
+    # [a,b] ** n für ganzzahliges n
+    if n == 0:
+        return np.ones_like(a), np.ones_like(b)
+    if n < 0:
+        lo, hi = _ganzzahlige_potenz(a, b, -n)
+        return _div(np.ones_like(lo), np.ones_like(hi), lo, hi)
+    with np.errstate(over="ignore"):
+        pa, pb = a ** n, b ** n
+    if n % 2 == 1:
+        # ungerade Potenz: monoton steigend
+        return _aussen(pa, pb)
+    # gerade Potenz: Minimum 0, falls 0 im Intervall liegt
+    lo = np.where(a >= 0, pa, np.where(b <= 0, pb, 0.0))
+    hi = np.maximum(pa, pb)
+    return _aussen(lo, hi)
+
+
+def _monoton(fn, a, b, steigend=True, ulp=4):
+    # monotone Funktion: Werte an den Grenzen genügen
+    with np.errstate(all="ignore"):
+        fa, fb = fn(a), fn(b)
+    return _aussen(fa, fb, ulp) if steigend else _aussen(fb, fa, ulp)
+
+
+def _periodisch(fn, a, b, x_max, x_min):
+    # sin/cos sind auf [a,b] nur an den Rändern oder in x_max + 2k*pi (Wert 1) bzw. x_min + 2k*pi (Wert -1) extremal
+    with np.errstate(invalid="ignore"):
+        fa, fb = fn(a), fn(b)
+    lo, hi = np.minimum(fa, fb), np.maximum(fa, fb)
+    # etwas Spielraum, da pi selbst nicht exakt darstellbar ist
+    tol = 4 * _EPS * np.maximum(np.abs(a), np.abs(b)) + 1e-15
+    zwei_pi = 2 * np.pi
+    k_max = np.ceil((a - tol - x_max) / zwei_pi)
+    k_min = np.ceil((a - tol - x_min) / zwei_pi)
+    hat_max = (x_max + zwei_pi * k_max) <= b + tol
+    hat_min = (x_min + zwei_pi * k_min) <= b + tol
+    breit = (b - a) >= zwei_pi
+    hi = np.where(hat_max | breit, 1.0, hi)
+    lo = np.where(hat_min | breit, -1.0, lo)
+    lo, hi = _aussen(lo, hi, 4)
+    return np.maximum(lo, -1.0), np.minimum(hi, 1.0)
+
+
+def _tan(a, b):
+    # tan ist zwischen zwei Polstellen (pi/2 + k*pi) monoton steigend
+    tol = 4 * _EPS * np.maximum(np.abs(a), np.abs(b)) + 1e-15
+    k = np.ceil((a - tol - np.pi / 2) / np.pi)
+    pol = (np.pi / 2 + np.pi * k) <= b + tol
+    lo, hi = _monoton(np.tan, a, b)
+    return np.where(pol, -np.inf, lo), np.where(pol, np.inf, hi)
+
+
+def _betrag(a, b):
+    # |[a,b]|
+    lo = np.where(a >= 0, a, np.where(b <= 0, -b, 0.0))
+    hi = np.maximum(np.abs(a), np.abs(b))
+    return lo, hi
+
+
+def _mod(a, b, c):
+    # [a,b] % c für konstantes c != 0 (Ergebnis liegt zwischen 0 und c)
+    # innerhalb eines Periodenstücks ist x % c = x - k*c monoton steigend,
+    # ein Sprung liegt genau dann vor, wenn der Wert am rechten Rand kleiner ist als am linken
+    with np.errstate(all="ignore"):
+        ra, rb = np.remainder(a, c), np.remainder(b, c)
+    gleich = (b - a < abs(c)) & (ra <= rb)
+    lo = np.where(gleich, ra, min(0.0, c))
+    hi = np.where(gleich, rb, max(0.0, c))
+    return _aussen(lo, hi)
+
+
+def _konstanter_wert(node):
+    # Wert eines x-freien Teilausdrucks (z.B. Exponent 2 oder 1/2), sonst None
+    if any(isinstance(n, ast.Name) and n.id == "x" for n in ast.walk(node)):
+        return None
+    try:
+        return float(funktion_aus_ausdruck(ast.unparse(node))(0.0))
+    except Exception:
+        return None
+
+
+def _auswerten(node, a, b):
+    """
+    Wertet einen Ausdrucks-AST mit Intervallarithmetik aus.
+
+    Parameter:
+        node (ast.expr): Knoten des (bereits geprüften) Ausdrucks
+        a (np.ndarray): Linke Grenzen der x-Intervalle
+        b (np.ndarray): Rechte Grenzen der x-Intervalle
+
+    Rückgabe:
+        tuple: (lo, hi) Arrays mit den eingeschlossenen Wertebereichen
+    """
+    if isinstance(node, ast.Constant):
+        return _konstante(node.value, a.shape)
+
+    if isinstance(node, ast.Name):
+        if node.id == "x":
+            return a, b
+        return _konstante(konstantenwert(node.id), a.shape)
+
+    if isinstance(node, ast.UnaryOp):
+        lo, hi = _auswerten(node.operand, a, b)
+        return (-hi, -lo) if isinstance(node.op, ast.USub) else (lo, hi)
+
+    if isinstance(node, ast.BinOp):
+        # Potenzen und Modulo mit konstantem rechten Teil gesondert (engere Schranken)
+        if isinstance(node.op, (ast.Pow, ast.Mod)):
+            c = _konstanter_wert(node.right)
+            lo, hi = _auswerten(node.left, a, b)
+            if isinstance(node.op, ast.Mod):
+                if c is None or c == 0:
+                    return np.full(a.shape, -np.inf), np.full(a.shape, np.inf)
+                return _mod(lo, hi, c)
+            if c is not None and float(c).is_integer():
+                return _ganzzahlige_potenz(lo, hi, int(c))
+            if c is not None:
+                # reeller Exponent: nur für Basis >= 0 definiert, dort monoton
+                lo0 = np.where(lo < 0, 0.0, lo)
+                plo, phi = _monoton(lambda t: t ** c, lo0, hi, steigend=(c > 0))
+                undef = hi < 0
+                return np.where(undef, -np.inf, plo), np.where(undef, np.inf, phi)
+            # allgemeiner Exponent: u**v = exp(v*log(u)) für u > 0
+            vlo, vhi = _auswerten(node.right, a, b)
+            llo, lhi = _monoton(np.log, lo, hi)
+            plo, phi = _mul(vlo, vhi, llo, lhi)
+            elo, ehi = _monoton(np.exp, plo, phi)
+            undef = lo <= 0
+            return np.where(undef, -np.inf, elo), np.where(undef, np.inf, ehi)
+
+        alo, ahi = _auswerten(node.left, a, b)
+        blo, bhi = _auswerten(node.right, a, b)
+        if isinstance(node.op, ast.Add):
+            return _aussen(alo + blo, ahi + bhi)
+        if isinstance(node.op, ast.Sub):
+            return _aussen(alo - bhi, ahi - blo)
+        if isinstance(node.op, ast.Mult):
+            return _mul(alo, ahi, blo, bhi)
+        if isinstance(node.op, ast.Div):
+            return _div(alo, ahi, blo, bhi)
+
+    if isinstance(node, ast.Call):
+        lo, hi = _auswerten(node.args[0], a, b)
+        name = node.func.id
+        if name == "sin":
+            return _periodisch(np.sin, lo, hi, np.pi / 2, -np.pi / 2)
+        if name == "cos":
+            return _periodisch(np.cos, lo, hi, 0.0, np.pi)
+        if name == "tan":
+            return _tan(lo, hi)
+        if name == "arcsin":
+            return _monoton(np.arcsin, np.maximum(lo, -1.0), np.minimum(hi, 1.0))
+        if name == "arccos":
+            return _monoton(np.arccos, np.maximum(lo, -1.0), np.minimum(hi, 1.0), steigend=False)
+        if name == "arctan":
+            return _monoton(np.arctan, lo, hi)
+        if name == "exp":
+            return _monoton(np.exp, lo, hi)
+        if name == "log":
+            # log(0) = -inf ist als untere Schranke korrekt
+            return _monoton(np.log, np.maximum(lo, 0.0), hi)
+        if name == "sqrt":
+            return _monoton(np.sqrt, np.maximum(lo, 0.0), hi)
+        if name == "abs":
+            return _betrag(lo, hi)
+
+    raise ValueError(f"Intervallauswertung für {type(node).__name__} nicht möglich")
+
+
+def intervall_funktion(expr: str):
+    """
+    Erstellt aus einem Funktionsausdruck eine Intervall-Auswertung F(lo, hi) -> (ylo, yhi).
+    Für jedes x-Intervall [lo[i], hi[i]] gilt garantiert ylo[i] <= f(x) <= yhi[i] für alle x darin.
+
+    Parameter:
+        expr (str): Funktionsausdruck, z.B. "sin(x)" oder "x**2" (gleiche Grammatik wie f und g)
+
+    Rückgabe:
+        callable: Funktion F(lo, hi), die für Arrays von Intervallgrenzen die Einschließungen liefert
+    """
+    # Grammatik wie bei f und g prüfen (wirft ValueError bei unerlaubten Ausdrücken)
+    funktion_aus_ausdruck(expr)
+    body = ast.parse(expr, mode="eval").body
+
+    def F(lo, hi):
+        lo = np.atleast_1d(np.asarray(lo, dtype=float))
+        hi = np.atleast_1d(np.asarray(hi, dtype=float))
+        ylo, yhi = _auswerten(body, lo, hi)
+        return np.broadcast_to(ylo, lo.shape), np.broadcast_to(yhi, lo.shape)
+
+    return F
+
+
+def intervall_betrag(Ff, Fg):
+    """
+    Kombiniert zwei Intervall-Auswertungen zu einer Einschließung von h(x) = |f(x) - g(x)|.
+
+    Parameter:
+        Ff (callable): Intervall-Auswertung von f (aus intervall_funktion)
+        Fg (callable): Intervall-Auswertung von g (aus intervall_funktion)
+
+    Rückgabe:
+        callable: Funktion H(lo, hi) -> (ylo, yhi) mit ylo <= |f(x) - g(x)| <= yhi auf jedem Intervall
+    """
+    def H(lo, hi):
+        flo, fhi = Ff(lo, hi)
+        glo, ghi = Fg(lo, hi)
+        dlo, dhi = _aussen(flo - ghi, fhi - glo)
+        return _betrag(dlo, dhi)
+
+    return H
@@ -1,14 +1,149 @@
+import multiprocessing as mp
+import sys
 import numpy as np
-from core.functions import randomsmonte
+from scipy import stats
+from core.functions import monte_ymax
+from core.riemann import _extrema, _zaehlaufruf
 from utils.validation import _eval_y
+from utils.zufall import Stichprobe
 
-def geomonte(N, a, b, h, hs, kma, f_raw, mode=0, eps=1e-12):
+def _reservoir(res, neu, j0, rng):
+    """
+    Aktualisiert eine gleichverteilte Stichprobe (Reservoir, Algorithmus R) fester Größe mit einem Block neuer Einträge.
+
+    Parameter:
+        res (np.ndarray): Reservoir der Form (M, spalten), wird in-place verändert
+        neu (np.ndarray): Neue Einträge der Form (m, spalten) mit flachem Index j0, ..., j0+m-1
+        j0 (int): Flacher Index des ersten neuen Eintrags
+        rng (np.random.Generator): Zufallsgenerator für die Ersetzungen
+
+    Rückgabe:
+        keine
+    """
+    M = res.shape[0]
+    # Eintrag j ersetzt mit Wahrscheinlichkeit M/(j+1) einen zufälligen Platz
+    r = rng.integers(0, j0 + np.arange(neu.shape[0]) + 1)
+    idx = np.flatnonzero(r < M)
+    # bei mehrfach getroffenen Plätzen gewinnt der spätere Eintrag (wie bei sequentieller Abarbeitung)
+    platz, letzte = np.unique(r[idx][::-1], return_index=True)
+    res[platz] = neu[idx[::-1][letzte]]
+
+# Funktionen der Worker-Prozesse: werden beim Start des Pools übergeben und per fork geerbt
+# (h/hs sind Closures über Ausdrücke und Splines und lassen sich nicht an Worker schicken)
+_WORKER_FUNKTIONEN = ()
+
+def _pool_start(funktionen):
+    # läuft einmal je Worker-Prozess (initializer des Pools)
+    global _WORKER_FUNKTIONEN
+    _WORKER_FUNKTIONEN = funktionen
+
+def _pool_worker(args):
+    # läuft im Worker-Prozess: Aufgabe mit der registrierten Funktion Nummer i ausführen
+    aufgabe, i, rest = args
+    return aufgabe(_WORKER_FUNKTIONEN[i], *rest)
+
+class TrefferPool:
+    """
+    Prozess-Pool für das parallele Zählen der Monte-Carlo-Treffer. Wird einmal pro Auswertung erzeugt und an alle
+    Monte-Carlo-Funktionen übergeben (nicht bei jeder Verdopplung von N ein neuer Pool).
+
+    Die Worker werden per fork gestartet und erben die registrierten Funktionen. fork wird nur unter Linux
+    verwendet (macOS: fork nach Cocoa/Tk stürzt ab, Windows: kein fork), sonst wird seriell gerechnet.
+    Die Prozesse werden erst beim ersten parallelen Auftrag gestartet; die GUI-Threads von Tk werden in den
+    Workern nie benutzt. Nach der Auswertung mit close() (oder als Kontextmanager) beenden.
+    Der Pool verteilt nur die festen Abschnitte (siehe _abschnitte), das Ergebnis ist daher bei festem Seed
+    unabhängig von der Zahl der Prozesse.
+    """
+
+    def __init__(self, prozesse=1, funktionen=()):
+        """
+        Initialisiert den Pool (ohne Prozesse zu starten).
+
+        Parameter:
+            prozesse (int): Anzahl der Worker-Prozesse
+            funktionen (iterable): Funktionen, die in den Workern ausgewertet werden dürfen (z.B. h_c, hs_c)
+
+        Rückgabe:
+            keine
+        """
+        self.funktionen = tuple(funktionen)
+        self.prozesse = int(prozesse) if sys.platform.startswith("linux") else 1
+        self._pool = None
+
+    def nutzbar(self, f):
+        """
+        Prüft, ob Aufträge für f im Pool laufen können (mehr als ein Prozess und f registriert).
+
+        Parameter:
+            f (callable): Auszuwertende Funktion
+
+        Rückgabe:
+            bool: True, wenn parallel gerechnet werden kann
+        """
+        return self.prozesse > 1 and any(g is f for g in self.funktionen)
+
+    def map(self, aufgabe, f, auftraege):
+        """
+        Führt aufgabe(f, *auftrag) für alle Aufträge in den Worker-Prozessen aus.
+
+        Parameter:
+            aufgabe (callable): Funktion auf Modulebene (z.B. _treffer_bereich)
+            f (callable): Registrierte Funktion
+            auftraege (list): Argumenttupel (ohne f)
+
+        Rückgabe:
+            list: Ergebnisse in der Reihenfolge der Aufträge
+        """
+        if self._pool is None:
+            self._pool = mp.get_context("fork").Pool(self.prozesse, _pool_start, (self.funktionen,))
+        nr = next(i for i, g in enumerate(self.funktionen) if g is f)
+        return self._pool.map(_pool_worker, [(aufgabe, nr, auftrag) for auftrag in auftraege])
+
+    def close(self):
+        """
+        Beendet die Worker-Prozesse (falls gestartet).
+
+        Rückgabe:
+            keine
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        """
+        Kontextmanager: liefert den Pool selbst.
+
+        Rückgabe:
+            TrefferPool: dieser Pool
+        """
+        return self
+
+    def __exit__(self, exc_typ, *exc):
+        """
+        Kontextmanager: beendet die Worker-Prozesse (bei Ausnahmen sofort, ohne auf offene Aufträge zu warten).
+
+        Rückgabe:
+            keine
+        """
+        if exc_typ is not None and self._pool is not None:
+            self._pool.terminate()
+        self.close()
+
+def geomonte(N, a, b, h, hs, kma, f_raw, mode=0, eps=1e-12, rng=None, verfahren="zufall", verfeinern=False,
+             behalten=None, chunk=2**20, pool=None):
     """
     Führt eine geometrische Monte-Carlo-Integration (Treffer-Methode) auf [a,b] für h oder hs aus.
 
     Es werden Zufallspunkte (xz, yz) in einem Rechteck der Höhe ymax erzeugt.
     Anschließend wird gezählt, wie viele Punkte unter der Kurve liegen (Treffer Zi).
     Die Funktion wird robust über _eval_y ausgewertet (z.B. für numerische Stabilität).
+    Die Punkte werden blockweise gezogen und gezählt. Zurückgegeben werden (für den Plot) höchstens behalten Punkte,
+    eine gleichverteilte Stichprobe aller N Punkte (Reservoir-Sampling); die Trefferzahl umfasst immer alle N Punkte.
+    Mehr als _ABSCHNITT Punkte (nur Pseudo-Zufall) werden wie in _trefferzahlen in feste Abschnitte geteilt
+    (mit pool in den Workern); jeder Abschnitt liefert ein eigenes Reservoir, die Gesamtstichprobe wird daraus
+    gezogen (Anteile je Abschnitt hypergeometrisch, also wieder gleichverteilt).
 
     Parameter:
         N (int): Anzahl der Zufallspunkte
@@ -16,37 +151,165 @@ def geomonte(N, a, b, h, hs, kma, f_raw, mode=0, eps=1e-12):
         b (float): Rechte Intervallgrenze
         h (callable): Funktion h(x)
         hs (callable): Funktion hs(x)
-        kma (int): Anzahl der Abtastpunkte zur ymax-Approximation in randomsmonte
-        f_raw (callable): Ungezählte/robuste Rohfunktion für die ymax-Bestimmung in randomsmonte
+        kma (int): Anzahl der Abtastpunkte zur ymax-Approximation (siehe core.functions.monte_ymax)
+        f_raw (callable): Ungezählte/robuste Rohfunktion für die ymax-Bestimmung
         mode (int): 0 nutzt h, 1 nutzt hs
         eps (float): Toleranz/Schutzparameter, wird an _eval_y weitergegeben
+        rng (np.random.Generator | int | None): Zufallsgenerator oder Seed (siehe utils.zufall.erzeuge_rng)
+        verfahren (str): "zufall" (Pseudo-Zufall) oder "sobol" / "halton" (verwürfelte QMC-Folgen, siehe utils.zufall.Stichprobe)
+        verfeinern (bool): ymax zusätzlich lokal maximieren (siehe core.functions.monte_ymax)
+        behalten (int | None): Maximale Anzahl zurückgegebener Punkte (None = alle N)
+        chunk (int): Maximale Anzahl Zufallspunkte pro Block
+        pool (TrefferPool | None): Prozess-Pool für das Zählen der Treffer (None = seriell, siehe TrefferPool)
 
     Rückgabe:
-        tuple: (I, Zi, xz, yz)
+        tuple: (I, Zi, xz, yz, treffer)
             I (float): Monte-Carlo-Näherung des Integrals
-            Zi (int): Anzahl der Trefferpunkte (unter der Kurve)
-            xz (np.ndarray): Zufällige x-Koordinaten
-            yz (np.ndarray): Zufällige y-Koordinaten
-    """
-    # Zufallspunkte + ymax
-    xz, yz, ymax = randomsmonte(a, b, N, h, hs, kma, f_raw, mode)
-    # auf Arrays ziehen (der Rest wird über _eval_y abgefangen)
-    xz = np.asarray(xz, dtype=float).ravel()
-    yz = np.asarray(yz, dtype=float).ravel()
-    ymax = float(np.asarray(ymax).ravel()[0])
+            Zi (int): Anzahl der Trefferpunkte (unter der Kurve, über alle N Punkte)
+            xz (np.ndarray): x-Koordinaten der behaltenen Punkte
+            yz (np.ndarray): y-Koordinaten der behaltenen Punkte
+            treffer (np.ndarray): True, wenn der behaltene Punkt unter der Kurve liegt
+    """
+    # ymax (Höhe des Rechtecks)
+    ymax = monte_ymax(a, b, h, hs, kma, f_raw, mode, verfeinern)
     # Rechteckfläche
     A = (b - a) * ymax
-    # passende Kurve wählen und robust auswerten
+    # passende Kurve wählen
     f = h if mode == 0 else hs
-    ycurve = _eval_y(f, xz, eps)
-    # Treffer (vektorisiert)
-    Zi = int(np.sum(ycurve >= yz))
+    quelle = Stichprobe(verfahren, rng)
+    M = N if behalten is None else min(int(behalten), N)
+    # Reservoir: eigener Strom, damit die Punktfolge unverändert bleibt
+    rng_res = quelle.rng.spawn(1)[0]
+    if quelle.folgen is not None or N <= _ABSCHNITT:
+        Zi, res = _geo_bereich(f, a, b, ymax, N, 0, N, M, eps, chunk, quelle, rng_res)
+    else:
+        # je Abschnitt ein eigener Zufallsstrom (Punkte und Reservoir), seriell oder im Pool
+        grenzen = _abschnitte(N)
+        auftraege = [(a, b, ymax, N, grenzen[i], grenzen[i + 1], M, eps, chunk, Stichprobe("zufall", r),
+                      r.spawn(1)[0]) for i, r in enumerate(quelle.rng.spawn(len(grenzen) - 1))]
+        teile = _auftraege_rechnen(_geo_bereich, f, auftraege, N, pool)
+        Zi = sum(z for z, _ in teile)
+        # M Punkte aus allen Abschnitten: Anzahl je Abschnitt hypergeometrisch, dann gleichverteilt aus dessen Reservoir
+        anteile = rng_res.multivariate_hypergeometric(np.diff(grenzen), M)
+        res = np.concatenate([r_i[rng_res.choice(r_i.shape[0], m, replace=False)]
+                              for (_, r_i), m in zip(teile, anteile)])
     #Speicherung
-    return A * (Zi / N), Zi, xz, yz
+    return A * (Zi / N), Zi, res[:, 0], res[:, 1], res[:, 2].astype(bool)
 
-def errmonte(err, a, b, h, hs, kma, f_raw, Ai, k=10, mode=0, eps=1e-12):
+def _geo_bereich(f, a, b, ymax, N, j0, j1, M, eps, chunk, quelle, rng_res):
     """
-    Führt geomonte iterativ aus und erhöht N (als Potenz von 2), bis der Fehler err gegenüber dem Referenzwert Ai unterschritten wird.
+    Zieht die Punkte mit flachem Index j0 <= j < j1 für geomonte, zählt die Treffer und behält eine
+    gleichverteilte Stichprobe von höchstens M Punkten des Abschnitts (Reservoir-Sampling).
+
+    Parameter:
+        f (callable): Funktion, unter deren Kurve gezählt wird
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        ymax (float): Höhe des Rechtecks
+        N (int): Anzahl der Zufallspunkte insgesamt
+        j0 (int): Erster flacher Index
+        j1 (int): Flacher Index hinter dem letzten Punkt
+        M (int): Maximale Anzahl behaltener Punkte
+        eps (float): Toleranz/Schutzparameter, wird an _eval_y weitergegeben
+        chunk (int): Maximale Anzahl Zufallspunkte pro Block
+        quelle (Stichprobe): Punktquelle (Pseudo-Zufall oder QMC)
+        rng_res (np.random.Generator): Zufallsgenerator für das Reservoir
+
+    Rückgabe:
+        tuple: (Zi, res)
+            Zi (int): Trefferzahl des Abschnitts
+            res (np.ndarray): Behaltene Punkte der Form (min(M, j1-j0), 3) mit Spalten x, y, Treffer
+    """
+    M = min(M, j1 - j0)
+    res = np.empty((M, 3))
+    Zi = 0
+    for c0 in range(j0, j1, chunk):
+        c1 = min(c0 + chunk, j1)
+        u = quelle.ziehe(c0, c1, N)
+        xz = a + (b - a) * u[:, 0]
+        yz = ymax * u[:, 1]
+        # Treffer (vektorisiert, robust ausgewertet)
+        tr = _eval_y(f, xz, eps) >= yz
+        Zi += int(np.sum(tr))
+        blk = np.column_stack((xz, yz, tr))
+        # die ersten M Punkte füllen das Reservoir, danach zufällige Ersetzung (Index relativ zum Abschnitt)
+        k0 = c0 - j0
+        n_fill = max(0, min(c1 - j0, M) - k0)
+        res[k0:k0 + n_fill] = blk[:n_fill]
+        if n_fill < c1 - c0:
+            _reservoir(res, blk[n_fill:], k0 + n_fill, rng_res)
+    return Zi, res
+
+def geomonte_strata(N, a, b, h, hs, f_raw, nst, mode=0, k=2000, eps=1e-12, chunk=2**20, rng=None,
+                    verfahren="zufall", ext=None):
+    """
+    Geschichtete Treffer-Methode: statt eines Rechtecks der Höhe ymax wird eine stückweise konstante
+    Hüllkurve verwendet (Maximum je Teilintervall, wie bei der Riemann-Obersumme). Jedes der nst Teilintervalle
+    bekommt Punkte im Verhältnis seiner Hüllfläche, gezählt wird je Teilintervall.
+    Bei spitzen Funktionen liegen dadurch deutlich mehr Punkte unter der Kurve (höhere Trefferquote,
+    kleinere Varianz pro Funktionsauswertung).
+
+    Parameter:
+        N (int): Anzahl der Zufallspunkte (Summe über alle Teilintervalle)
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        h (callable): Funktion h(x)
+        hs (callable): Funktion hs(x)
+        f_raw (callable): Ungezählte Rohfunktion für die Maxima der Teilintervalle
+        nst (int): Anzahl der Teilintervalle (Schichten)
+        mode (int): 0 nutzt h, 1 nutzt hs
+        k (int): Anzahl der Abtastpunkte pro Teilintervall (siehe core.riemann.riemann_extrema)
+        eps (float): Toleranz/Schutzparameter, wird an _eval_y weitergegeben
+        chunk (int): Maximale Anzahl Zufallspunkte pro Block
+        rng (np.random.Generator | int | None): Zufallsgenerator oder Seed (siehe utils.zufall.erzeuge_rng)
+        verfahren (str): "zufall" (Pseudo-Zufall) oder "sobol" / "halton" (verwürfelte QMC-Folgen, siehe utils.zufall.Stichprobe)
+        ext (callable | None): Extrema-Verfahren ext(nr, a, b) wie bei den Riemann-Summen (None = Abtasten)
+
+    Rückgabe:
+        tuple: (I, Zi, var)
+            I (float): Monte-Carlo-Näherung des Integrals
+            Zi (int): Anzahl der Trefferpunkte (unter der Kurve)
+            var (float): Geschätzte Varianz von I
+    """
+    f = h if mode == 0 else hs
+    # Hüllkurve: Maxima je Teilintervall (1 gezählter Call pro Teilintervall wie bei Riemann)
+    _, M = _extrema(nst, a, b, f_raw, k, chunk, ext)
+    _zaehlaufruf(f, nst, a, b)
+    M = np.maximum(M, 0.0)
+    dx = (b - a) / nst
+    Ah = dx * M  # Hüllfläche je Teilintervall
+    if Ah.sum() <= 0:
+        return 0.0, 0, 0.0
+    # Punkte proportional zur Hüllfläche verteilen (größte Reste, Summe genau N)
+    soll = N * Ah / Ah.sum()
+    n = np.floor(soll).astype(np.int64)
+    n[np.argsort(n - soll)[:N - int(n.sum())]] += 1
+    grenzen = np.cumsum(n)
+    quelle = Stichprobe(verfahren, rng)
+    Z = np.zeros(nst, dtype=np.int64)
+    for c0 in range(0, N, chunk):
+        c1 = min(c0 + chunk, N)
+        # Teilintervall jedes Punkts aus dem flachen Index
+        i = np.searchsorted(grenzen, np.arange(c0, c1), side="right")
+        u = quelle.ziehe(c0, c1, N)
+        xz = a + (i + u[:, 0]) * dx
+        yz = M[i] * u[:, 1]
+        treffer = _eval_y(f, xz, eps) >= yz
+        Z += np.bincount(i[treffer], minlength=nst)
+    # Schätzer je Teilintervall (Hüllfläche * Trefferquote), Teilintervalle ohne Punkte fallen weg
+    ok = n > 0
+    p = Z[ok] / n[ok]
+    I = float(np.sum(Ah[ok] * p))
+    var = float(np.sum(Ah[ok] ** 2 * p * (1 - p) / n[ok]))
+    #Rückgabe
+    return I, int(Z.sum()), var
+
+def errmonte(err, a, b, h, hs, kma, f_raw, Ai, k=10, mode=0, eps=1e-12, chunk=2**20, rng=None, pool=None,
+             verfahren="zufall", verfeinern=False):
+    """
+    Erhöht N (als Potenz von 2), bis die geometrische Monte-Carlo-Näherung den Fehler err gegenüber dem Referenzwert Ai unterschreitet.
+    Die Treffer sind additiv: ymax wird einmal bestimmt, die Trefferzahl läuft mit und beim Erhöhen von N werden
+    nur die N_neu - N_alt zusätzlichen Punkte gezogen (blockweise, keine Arrays der Länge N).
 
     Parameter:
         err (float): Fehlertoleranz für |MonteCarlo - Ai|
@@ -54,36 +317,154 @@ def errmonte(err, a, b, h, hs, kma, f_raw, Ai, k=10, mode=0, eps=1e-12):
         b (float): Rechte Intervallgrenze
         h (callable): Funktion h(x)
         hs (callable): Funktion hs(x)
-        kma (int): Anzahl der Abtastpunkte zur ymax-Approximation in randomsmonte
-        f_raw (callable): Ungezählte/robuste Rohfunktion für die ymax-Bestimmung in randomsmonte
+        kma (int): Anzahl der Abtastpunkte zur ymax-Approximation (siehe monte_ymax)
+        f_raw (callable): Ungezählte/robuste Rohfunktion für die ymax-Bestimmung (siehe monte_ymax)
         Ai (float): Referenzintegralwert der Zielfunktion
         k (int): Schrittweite für den Exponenten q (N = 2**q)
         mode (int): 0 nutzt h, 1 nutzt hs
         eps (float): Toleranz/Schutzparameter, wird an _eval_y weitergegeben
+        chunk (int): Maximale Anzahl Zufallspunkte pro Block
+        rng (np.random.Generator | int | None): Zufallsgenerator oder Seed (siehe utils.zufall.erzeuge_rng)
+        pool (TrefferPool | None): Prozess-Pool für das Zählen der Treffer (None = seriell, siehe TrefferPool)
+        verfahren (str): "zufall" (Pseudo-Zufall) oder "sobol" / "halton" (verwürfelte QMC-Folgen, siehe utils.zufall.Stichprobe)
+        verfeinern (bool): ymax zusätzlich lokal maximieren (siehe core.functions.monte_ymax)
 
     Rückgabe:
         tuple: (N, mc, Zi)
             N (int): Verwendete Stichprobengröße (Potenz von 2)
             mc (float): Monte-Carlo-Näherung bei diesem N
-            Zi (int): Trefferzahl aus dem letzten Lauf
+            Zi (int): Trefferzahl bei diesem N
     """
     #Funktion die MC berechnet bis err erreicht
-    # Startwerte
-    mc, N, q = 0.0, 1, 1
+    # ymax einmal bestimmen
+    ymax = monte_ymax(a, b, h, hs, kma, f_raw, mode, verfeinern)
+    A = (b - a) * ymax
+    f = h if mode == 0 else hs
+    # eine Punktquelle für die ganze Suche (reproduzierbar bei festem Seed, QMC-Folge läuft weiter)
+    quelle = Stichprobe(verfahren, rng)
+    # Startwerte (noch keine Punkte gezogen)
+    Zi, N_alt, N, q = 0, 0, 1, 1
     # Monte-Carlo konvergiert nicht monoton (Zufallsverfahren)
     while True:
-        mc, Zi, _, _ = geomonte(N, a, b, h, hs, kma, f_raw, mode) #Berechnung Annäherung und Treffer
+        # nur die zusätzlichen Punkte ziehen, Treffer aufaddieren
+        Zi += int(_trefferzahlen(f, a, b, ymax, N - N_alt, 1, eps, chunk, quelle, pool)[0])
+        mc = A * (Zi / N)
         if abs(mc - Ai) < err:
             break
         else:
+            N_alt = N
             N = 2 ** q  # neues N berechnen
             q += k
     # Rückgabe
     return N, mc, Zi
 
-def mittel_monte(N, a, b, h, hs, kma, f_raw, wm, mode=0, eps=1e-12):
+def _treffer_bereich(f, a, b, ymax, N, wm, j0, j1, eps, chunk, quelle):
+    """
+    Zählt die Treffer der Zufallspunkte mit flachem Index j0 <= j < j1 (Punkt j gehört zur Wiederholung j // N).
+
+    Parameter:
+        f (callable): Funktion, unter deren Kurve gezählt wird
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        ymax (float): Höhe des Rechtecks
+        N (int): Anzahl der Zufallspunkte pro Wiederholung
+        wm (int): Anzahl der Wiederholungen
+        j0 (int): Erster flacher Index
+        j1 (int): Flacher Index hinter dem letzten Punkt
+        eps (float): Toleranz/Schutzparameter, wird an _eval_y weitergegeben
+        chunk (int): Maximale Anzahl Zufallspunkte pro Block
+        quelle (Stichprobe): Punktquelle (Pseudo-Zufall oder QMC)
+
+    Rückgabe:
+        np.ndarray: Trefferzahlen der wm Wiederholungen (nur Punkte aus dem Bereich)
+    """
+    Z = np.zeros(wm, dtype=np.int64)
+    for c0 in range(j0, j1, chunk):
+        c1 = min(c0 + chunk, j1)
+        u = quelle.ziehe(c0, c1, N)
+        xz = a + (b - a) * u[:, 0]
+        yz = ymax * u[:, 1]
+        treffer = _eval_y(f, xz, eps) >= yz
+        # Treffer abschnittsweise je Wiederholung summieren
+        w0, w1 = c0 // N, (c1 - 1) // N
+        starts = np.maximum(np.arange(w0, w1 + 1) * N, c0) - c0
+        Z[w0:w1 + 1] += np.add.reduceat(treffer, starts, dtype=np.int64)
+    return Z
+
+# feste Abschnittsgröße für große Stichproben: jeder Abschnitt bekommt einen eigenen, per spawn abgeleiteten
+# Zufallsstrom. Abschnitte und Ströme hängen nur von der Punktzahl ab, nicht von der Zahl der Prozesse.
+_ABSCHNITT = 2**22
+
+def _abschnitte(gesamt):
+    # Grenzen der Abschnitte des flachen Index 0..gesamt (höchstens _ABSCHNITT Punkte je Abschnitt)
+    return list(range(0, gesamt, _ABSCHNITT)) + [gesamt]
+
+def _auftraege_rechnen(aufgabe, f, auftraege, gesamt, pool=None):
+    """
+    Führt aufgabe(f, *auftrag) für alle Abschnitte aus, im Pool (falls für f nutzbar) oder seriell.
+    Beide Wege liefern dieselben Ergebnisse, da jeder Auftrag seinen eigenen Zufallsstrom mitbringt.
+
+    Parameter:
+        aufgabe (callable): Funktion auf Modulebene (_treffer_bereich oder _geo_bereich)
+        f (callable): Auszuwertende Funktion
+        auftraege (list): Argumenttupel je Abschnitt (ohne f)
+        gesamt (int): Anzahl der Funktionsauswertungen aller Aufträge
+        pool (TrefferPool | None): Prozess-Pool (None = seriell)
+
+    Rückgabe:
+        list: Ergebnisse in der Reihenfolge der Aufträge
+    """
+    if pool is None or not pool.nutzbar(f):
+        return [aufgabe(f, *auftrag) for auftrag in auftraege]
+    teile = pool.map(aufgabe, f, auftraege)
+    # Auswertungen in den Workern dem Zähler im Elternprozess gutschreiben
+    zaehle = getattr(f, "zaehle", None)
+    if zaehle is not None:
+        zaehle(gesamt)
+    return teile
+
+def _trefferzahlen(f, a, b, ymax, N, wm, eps=1e-12, chunk=2**20, quelle=None, pool=None):
     """
-    Berechnet den Mittelwert aus wm Monte-Carlo-Durchläufen (geomonte) mit festem N.
+    Zieht wm*N Zufallspunkte im Rechteck [a,b] x [0,ymax] blockweise (höchstens chunk Punkte gleichzeitig)
+    und zählt die Treffer unter der Kurve getrennt für jede der wm Wiederholungen.
+
+    Mehr als _ABSCHNITT Punkte (nur Pseudo-Zufall, QMC-Folgen laufen am Stück weiter) werden in feste Abschnitte
+    mit je einem eigenen, per spawn abgeleiteten Zufallsstrom geteilt. Ist ein TrefferPool übergeben, in dem f
+    registriert ist, werden die Abschnitte in den Workern gezählt, sonst nacheinander. Bei festem Seed ist das
+    Ergebnis unabhängig von der Zahl der Prozesse. Die Auswertungen der Worker werden einem Zähler mit Methode
+    zaehle (CountedFunction) im Elternprozess gutgeschrieben.
+
+    Parameter:
+        f (callable): Funktion, unter deren Kurve gezählt wird
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        ymax (float): Höhe des Rechtecks
+        N (int): Anzahl der Zufallspunkte pro Wiederholung
+        wm (int): Anzahl der Wiederholungen
+        eps (float): Toleranz/Schutzparameter, wird an _eval_y weitergegeben
+        chunk (int): Maximale Anzahl Zufallspunkte pro Block
+        quelle (Stichprobe | None): Punktquelle mit wm Replikaten (None = neue Pseudo-Zufallsquelle)
+        pool (TrefferPool | None): Prozess-Pool (None = seriell)
+
+    Rückgabe:
+        np.ndarray: Trefferzahlen der wm Wiederholungen
+    """
+    quelle = Stichprobe("zufall") if quelle is None else quelle
+    gesamt = wm * N
+    if quelle.folgen is not None or gesamt <= _ABSCHNITT:
+        return _treffer_bereich(f, a, b, ymax, N, wm, 0, gesamt, eps, chunk, quelle)
+    # je Abschnitt ein eigener Zufallsstrom
+    grenzen = _abschnitte(gesamt)
+    auftraege = [(a, b, ymax, N, wm, grenzen[i], grenzen[i + 1], eps, chunk, Stichprobe("zufall", r))
+                 for i, r in enumerate(quelle.rng.spawn(len(grenzen) - 1))]
+    return np.sum(_auftraege_rechnen(_treffer_bereich, f, auftraege, gesamt, pool), axis=0)
+
+def mittel_monte(N, a, b, h, hs, kma, f_raw, wm, mode=0, eps=1e-12, chunk=2**20, rng=None, pool=None,
+                 verfahren="zufall", verfeinern=False):
+    """
+    Berechnet den Mittelwert aus wm Monte-Carlo-Durchläufen (Treffer-Methode wie geomonte) mit festem N.
+    ymax wird nur einmal bestimmt, alle wm*N Zufallspunkte werden blockweise gezogen und
+    die Treffer je Wiederholung gezählt (keine Python-Schleife über die Wiederholungen).
 
     Parameter:
         N (int): Anzahl der Zufallspunkte pro Monte-Carlo-Lauf
@@ -91,29 +472,73 @@ def mittel_monte(N, a, b, h, hs, kma, f_raw, wm, mode=0, eps=1e-12):
         b (float): Rechte Intervallgrenze
         h (callable): Funktion h(x)
         hs (callable): Funktion hs(x)
-        kma (int): Anzahl der Abtastpunkte zur ymax-Approximation in randomsmonte
-        f_raw (callable): Ungezählte/robuste Rohfunktion für die ymax-Bestimmung in randomsmonte
+        kma (int): Anzahl der Abtastpunkte zur ymax-Approximation (siehe monte_ymax)
+        f_raw (callable): Ungezählte/robuste Rohfunktion für die ymax-Bestimmung (siehe monte_ymax)
         wm (int): Anzahl der Wiederholungen (Runs), über die gemittelt wird
         mode (int): 0 nutzt h, 1 nutzt hs
-        eps (float): Toleranz/Schutzparameter (wird hier nicht direkt genutzt, ist als Parameter vorhanden)
+        eps (float): Toleranz/Schutzparameter, wird an _eval_y weitergegeben
+        chunk (int): Maximale Anzahl Zufallspunkte pro Block
+        rng (np.random.Generator | int | None): Zufallsgenerator oder Seed (siehe utils.zufall.erzeuge_rng)
+        pool (TrefferPool | None): Prozess-Pool für das Zählen der Treffer (None = seriell, siehe TrefferPool)
+        verfahren (str): "zufall" (Pseudo-Zufall) oder "sobol" / "halton" (verwürfelte QMC-Folgen, siehe utils.zufall.Stichprobe)
+        verfeinern (bool): ymax zusätzlich lokal maximieren (siehe core.functions.monte_ymax)
 
     Rückgabe:
         float: Mittelwert der Monte-Carlo-Schätzer über wm Läufe
     """
     #Berechnet Mittelwert aus wm monte Carlo Durchläufen
-    #Schätzer auf Null
-    Is=0
-    #wm Wiederholungen
-    for i in range(wm):
-        #Schätzer addieren
-        Is += geomonte(N, a, b, h, hs, kma, f_raw, mode)[0]
-    #Rückgabe Mittelwert
-    return Is/wm
-
-def err_mittel_monte(err, a, b, h, hs, kma, f_raw, wm, kmi, Ai, mode=0, eps=1e-12):
-    """
-    Erhöht N (als Potenz von 2), bis der Mittelwert aus wm Monte-Carlo-Läufen (mittel_monte)
+    mm, _ = replikat_monte(N, a, b, h, hs, kma, f_raw, wm, mode, eps, chunk, rng, pool, verfahren, verfeinern)
+    #Rückgabe
+    return mm
+
+def replikat_monte(N, a, b, h, hs, kma, f_raw, wm, mode=0, eps=1e-12, chunk=2**20, rng=None, pool=None,
+                   verfahren="zufall", verfeinern=False):
+    """
+    Wie mittel_monte, liefert zusätzlich den Standardfehler des Mittelwerts aus der Streuung der wm Läufe.
+    Bei verfahren "sobol"/"halton" ist jeder Lauf eine eigene verwürfelte QMC-Folge (randomisierte Replikate),
+    die Streuung der Replikate ist dann ein unverzerrter Fehlerschätzer für das QMC-Ergebnis.
+
+    Parameter:
+        N (int): Anzahl der Punkte pro Lauf
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        h (callable): Funktion h(x)
+        hs (callable): Funktion hs(x)
+        kma (int): Anzahl der Abtastpunkte zur ymax-Approximation (siehe monte_ymax)
+        f_raw (callable): Ungezählte/robuste Rohfunktion für die ymax-Bestimmung (siehe monte_ymax)
+        wm (int): Anzahl der Läufe (Replikate)
+        mode (int): 0 nutzt h, 1 nutzt hs
+        eps (float): Toleranz/Schutzparameter, wird an _eval_y weitergegeben
+        chunk (int): Maximale Anzahl Punkte pro Block
+        rng (np.random.Generator | int | None): Zufallsgenerator oder Seed (siehe utils.zufall.erzeuge_rng)
+        pool (TrefferPool | None): Prozess-Pool für das Zählen der Treffer (None = seriell, siehe TrefferPool)
+        verfahren (str): "zufall" (Pseudo-Zufall) oder "sobol" / "halton" (verwürfelte QMC-Folgen, siehe utils.zufall.Stichprobe)
+        verfeinern (bool): ymax zusätzlich lokal maximieren (siehe core.functions.monte_ymax)
+
+    Rückgabe:
+        tuple: (mm, se)
+            mm (float): Mittelwert der wm Schätzer
+            se (float): Standardfehler des Mittelwerts (nan für wm = 1)
+    """
+    #ymax einmal für alle Wiederholungen
+    ymax = monte_ymax(a, b, h, hs, kma, f_raw, mode, verfeinern)
+    A = (b - a) * ymax
+    f = h if mode == 0 else hs
+    #Treffer je Wiederholung
+    Z = _trefferzahlen(f, a, b, ymax, N, wm, eps, chunk, Stichprobe(verfahren, rng, wm), pool)
+    #Schätzer A*Z_i/N je Lauf
+    I = A * (Z / N)
+    se = float(np.std(I, ddof=1) / np.sqrt(wm)) if wm > 1 else float("nan")
+    #Rückgabe
+    return float(np.mean(I)), se
+
+def err_mittel_monte(err, a, b, h, hs, kma, f_raw, wm, kmi, Ai, mode=0, eps=1e-12, chunk=2**20, rng=None, pool=None,
+                     verfahren="zufall", verfeinern=False):
+    """
+    Erhöht N (als Potenz von 2), bis der Mittelwert aus wm Monte-Carlo-Läufen (wie mittel_monte)
     den Fehler err gegenüber dem Referenzwert Ai unterschreitet.
+    Jede Wiederholung behält ihre Trefferzahl, beim Erhöhen von N werden je Wiederholung nur die
+    N_neu - N_alt zusätzlichen Punkte gezogen (blockweise).
 
     Parameter:
         err (float): Fehlertoleranz für |Mittelwert - Ai|
@@ -121,13 +546,18 @@ def err_mittel_monte(err, a, b, h, hs, kma, f_raw, wm, kmi, Ai, mode=0, eps=1e-1
         b (float): Rechte Intervallgrenze
         h (callable): Funktion h(x)
         hs (callable): Funktion hs(x)
-        kma (int): Anzahl der Abtastpunkte zur ymax-Approximation in randomsmonte
-        f_raw (callable): Ungezählte/robuste Rohfunktion für die ymax-Bestimmung in randomsmonte
+        kma (int): Anzahl der Abtastpunkte zur ymax-Approximation (siehe monte_ymax)
+        f_raw (callable): Ungezählte/robuste Rohfunktion für die ymax-Bestimmung (siehe monte_ymax)
         wm (int): Anzahl der Wiederholungen für den Mittelwert-Schätzer
         kmi (int): Schrittweite für den Exponenten q (N = 2**q)
         Ai (float): Referenzintegralwert der Zielfunktion
         mode (int): 0 nutzt h, 1 nutzt hs
-        eps (float): Toleranz/Schutzparameter (wird hier nicht direkt genutzt, ist als Parameter vorhanden)
+        eps (float): Toleranz/Schutzparameter, wird an _eval_y weitergegeben
+        chunk (int): Maximale Anzahl Zufallspunkte pro Block
+        rng (np.random.Generator | int | None): Zufallsgenerator oder Seed (siehe utils.zufall.erzeuge_rng)
+        pool (TrefferPool | None): Prozess-Pool für das Zählen der Treffer (None = seriell, siehe TrefferPool)
+        verfahren (str): "zufall" (Pseudo-Zufall) oder "sobol" / "halton" (verwürfelte QMC-Folgen, siehe utils.zufall.Stichprobe)
+        verfeinern (bool): ymax zusätzlich lokal maximieren (siehe core.functions.monte_ymax)
 
     Rückgabe:
         tuple: (N, Am)
@@ -135,17 +565,388 @@ def err_mittel_monte(err, a, b, h, hs, kma, f_raw, wm, kmi, Ai, mode=0, eps=1e-1
             Am (float): Mittelwert-Schätzer bei diesem N
     """
     #Berechnet mittel_monte bis err unterschritten
-    #N,q auf 1
-    N,q=1,1
+    # ymax einmal bestimmen
+    ymax = monte_ymax(a, b, h, hs, kma, f_raw, mode, verfeinern)
+    A = (b - a) * ymax
+    f = h if mode == 0 else hs
+    quelle = Stichprobe(verfahren, rng, wm)
+    #Trefferzahlen der wm Wiederholungen, N,q auf 1
+    Z = np.zeros(wm, dtype=np.int64)
+    N_alt,N,q=0,1,1
     #Beginn der Schleife
     while True:
-        #Berechnung des Mittelwerts aus wm Durchläufen
-        Am=mittel_monte(N, a, b, h, hs, kma, f_raw,wm, mode)
+        #zusätzliche Punkte je Wiederholung ziehen, Mittelwert der wm Schätzer
+        Z += _trefferzahlen(f, a, b, ymax, N - N_alt, wm, eps, chunk, quelle, pool)
+        Am = float(np.mean(A * (Z / N)))
         #Stopp wenn err unterschritten
         if abs(Am - Ai) < err:
             break
         else:
+            N_alt = N
             N = 2 ** q
             q+=kmi
     #Rückgabe
     return N,Am
+
+def _quantil(niveau, freiheitsgrade=None):
+    # zweiseitiges Quantil zum Konfidenzniveau (Normalverteilung bzw. t-Verteilung bei wenigen Wiederholungen)
+    if freiheitsgrade is None:
+        return float(stats.norm.ppf(0.5 + 0.5 * niveau))
+    return float(stats.t.ppf(0.5 + 0.5 * niveau, freiheitsgrade))
+
+def errmonte_ki(err, a, b, h, hs, kma, f_raw, k=1, mode=0, niveau=0.95, nmin=64, nmax=2**26, eps=1e-12,
+                chunk=2**20, rng=None, pool=None, verfahren="zufall", verfeinern=False, replikate=8):
+    """
+    Wie errmonte, gestoppt wird aber über das Konfidenzintervall statt über einen Referenzwert:
+    sobald die halbe Breite des KI zum Niveau niveau kleiner als err ist (oder N >= nmax).
+    - "zufall": die Trefferzahl ist binomialverteilt, Var(A*Z/N) = A^2 p(1-p)/N. Für p wird der
+      Agresti-Coull-Schätzer p = (Z + z^2/2)/(N + z^2) verwendet, damit Z = 0 oder Z = N kein KI der Breite 0 vortäuscht.
+    - "sobol"/"halton": die N Punkte werden auf replikate verwürfelte Folgen aufgeteilt, das KI kommt aus der
+      Streuung ihrer Schätzer (t-Quantil mit replikate-1 Freiheitsgraden). Die Binomialvarianz wäre hier
+      um Größenordnungen zu pessimistisch und die Suche liefe bis nmax.
+
+    Parameter:
+        err (float): Zielwert für die halbe Breite des Konfidenzintervalls
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        h (callable): Funktion h(x)
+        hs (callable): Funktion hs(x)
+        kma (int): Anzahl der Abtastpunkte zur ymax-Approximation (siehe monte_ymax)
+        f_raw (callable): Ungezählte/robuste Rohfunktion für die ymax-Bestimmung (siehe monte_ymax)
+        k (int): Schrittweite für den Exponenten q (N = nmin * 2**q)
+        mode (int): 0 nutzt h, 1 nutzt hs
+        niveau (float): Konfidenzniveau, z.B. 0.95
+        nmin (int): Start-Stichprobengröße
+        nmax (int): Maximale Stichprobengröße (begrenzt die Laufzeit)
+        eps (float): Toleranz/Schutzparameter, wird an _eval_y weitergegeben
+        chunk (int): Maximale Anzahl Zufallspunkte pro Block
+        rng (np.random.Generator | int | None): Zufallsgenerator oder Seed (siehe utils.zufall.erzeuge_rng)
+        pool (TrefferPool | None): Prozess-Pool für das Zählen der Treffer (None = seriell, siehe TrefferPool)
+        verfahren (str): "zufall" (Pseudo-Zufall) oder "sobol" / "halton" (verwürfelte QMC-Folgen, siehe utils.zufall.Stichprobe)
+        verfeinern (bool): ymax zusätzlich lokal maximieren (siehe core.functions.monte_ymax)
+        replikate (int): Anzahl der verwürfelten Folgen bei QMC (mindestens 2, bei "zufall" ohne Bedeutung)
+
+    Rückgabe:
+        tuple: (N, mc, hw)
+            N (int): Verwendete Stichprobengröße (bei QMC Summe über alle Replikate)
+            mc (float): Monte-Carlo-Näherung bei diesem N
+            hw (float): Halbe Breite des Konfidenzintervalls, KI = [mc - hw, mc + hw]
+    """
+    quelle = Stichprobe(verfahren, rng, replikate)
+    if quelle.folgen is None:
+        r, z = 1, _quantil(niveau)
+    else:
+        if replikate < 2:
+            raise ValueError("Für das QMC-Konfidenzintervall werden mindestens 2 Replikate benötigt (replikate >= 2)")
+        r, z = int(replikate), _quantil(niveau, replikate - 1)
+    ymax = monte_ymax(a, b, h, hs, kma, f_raw, mode, verfeinern)
+    A = (b - a) * ymax
+    f = h if mode == 0 else hs
+    # n = Punkte je Replikat, N = r*n
+    Z = np.zeros(r, dtype=np.int64)
+    n_alt, n = 0, max(int(nmin) // r, 1)
+    while True:
+        # nur die zusätzlichen Punkte ziehen, Treffer aufaddieren
+        Z += _trefferzahlen(f, a, b, ymax, n - n_alt, r, eps, chunk, quelle, pool)
+        I = A * (Z / n)
+        mc = float(np.mean(I))
+        if r == 1:
+            p = (Z[0] + 0.5 * z * z) / (n + z * z)
+            hw = z * A * np.sqrt(p * (1 - p) / n)
+        else:
+            # Standardfehler aus der Streuung der Replikate
+            hw = z * float(np.std(I, ddof=1)) / np.sqrt(r)
+        #Stoppen wenn KI schmal genug oder nmax erreicht
+        if hw < err or r * n >= nmax:
+            break
+        n_alt = n
+        n = min(n * 2 ** k, max(int(nmax) // r, 1))
+    #Rückgabe
+    return r * n, mc, float(hw)
+
+def err_mittel_monte_ki(err, a, b, h, hs, kma, f_raw, wm, kmi=1, mode=0, niveau=0.95, nmin=64, nmax=2**24,
+                        eps=1e-12, chunk=2**20, rng=None, pool=None, verfahren="zufall", verfeinern=False):
+    """
+    Wie err_mittel_monte, gestoppt wird aber über das Konfidenzintervall des Mittelwerts der wm Läufe
+    statt über einen Referenzwert.
+    - "zufall": alle wm*N Punkte sind unabhängig, es wird die gepoolte Binomialvarianz verwendet
+      (wie errmonte_ki; die Streuung aus wenigen Läufen ist zu unsicher und würde zu früh stoppen)
+    - "sobol"/"halton": die Läufe sind randomisierte QMC-Replikate, das KI kommt aus ihrer Streuung
+      (t-Quantil mit wm-1 Freiheitsgraden)
+
+    Parameter:
+        err (float): Zielwert für die halbe Breite des Konfidenzintervalls
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        h (callable): Funktion h(x)
+        hs (callable): Funktion hs(x)
+        kma (int): Anzahl der Abtastpunkte zur ymax-Approximation (siehe monte_ymax)
+        f_raw (callable): Ungezählte/robuste Rohfunktion für die ymax-Bestimmung (siehe monte_ymax)
+        wm (int): Anzahl der Läufe (bei "sobol"/"halton" mindestens 2)
+        kmi (int): Schrittweite für den Exponenten q (N = nmin * 2**q)
+        mode (int): 0 nutzt h, 1 nutzt hs
+        niveau (float): Konfidenzniveau, z.B. 0.95
+        nmin (int): Start-Stichprobengröße je Lauf
+        nmax (int): Maximale Stichprobengröße je Lauf (begrenzt die Laufzeit)
+        eps (float): Toleranz/Schutzparameter, wird an _eval_y weitergegeben
+        chunk (int): Maximale Anzahl Zufallspunkte pro Block
+        rng (np.random.Generator | int | None): Zufallsgenerator oder Seed (siehe utils.zufall.erzeuge_rng)
+        pool (TrefferPool | None): Prozess-Pool für das Zählen der Treffer (None = seriell, siehe TrefferPool)
+        verfahren (str): "zufall" (Pseudo-Zufall) oder "sobol" / "halton" (verwürfelte QMC-Folgen, siehe utils.zufall.Stichprobe)
+        verfeinern (bool): ymax zusätzlich lokal maximieren (siehe core.functions.monte_ymax)
+
+    Rückgabe:
+        tuple: (N, Am, hw)
+            N (int): Verwendete Stichprobengröße je Lauf
+            Am (float): Mittelwert-Schätzer bei diesem N
+            hw (float): Halbe Breite des Konfidenzintervalls, KI = [Am - hw, Am + hw]
+    """
+    quelle = Stichprobe(verfahren, rng, wm)
+    if quelle.folgen is not None and wm < 2:
+        raise ValueError("Für das QMC-Konfidenzintervall werden mindestens 2 Läufe benötigt (wm >= 2)")
+    ymax = monte_ymax(a, b, h, hs, kma, f_raw, mode, verfeinern)
+    A = (b - a) * ymax
+    f = h if mode == 0 else hs
+    z = _quantil(niveau, wm - 1 if quelle.folgen is not None else None)
+    Z = np.zeros(wm, dtype=np.int64)
+    N_alt, N = 0, int(nmin)
+    while True:
+        #zusätzliche Punkte je Lauf ziehen
+        Z += _trefferzahlen(f, a, b, ymax, N - N_alt, wm, eps, chunk, quelle, pool)
+        I = A * (Z / N)
+        Am = float(np.mean(I))
+        if quelle.folgen is None:
+            # gepoolte Binomialvarianz über alle wm*N Punkte (Agresti-Coull wie errmonte_ki)
+            p = (Z.sum() + 0.5 * z * z) / (wm * N + z * z)
+            hw = z * A * np.sqrt(p * (1 - p) / (wm * N))
+        else:
+            # Standardfehler aus der Streuung der Replikate
+            hw = z * float(np.std(I, ddof=1)) / np.sqrt(wm)
+        #Stoppen wenn KI schmal genug oder nmax erreicht
+        if hw < err or N >= nmax:
+            break
+        N_alt = N
+        N = min(N * 2 ** kmi, int(nmax))
+    #Rückgabe
+    return N, Am, float(hw)
+
+# ------------------------------------------------------------
+# Mittelwert-Monte-Carlo (ohne ymax-Rechteck) mit Varianzreduktion
+# ------------------------------------------------------------
+
+# erlaubte Schätzer: Stichprobenmittel, antithetische Paare, Trapez-Interpolante als Kontrollvariate
+_SCHAETZER = ("mittel", "antithetisch", "kontrolle")
+
+def _kontrolle(f, a, b, nk, eps=1e-12):
+    """
+    Baut die Trapez-Interpolante (Polygonzug durch nk+1 äquidistante Stützstellen) als Kontrollvariate.
+    Ihr Integral ist exakt bekannt (Trapezregel), die Stützwerte kosten nk+1 Funktionsaufrufe.
+
+    Parameter:
+        f (callable): Zu integrierende Funktion
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        nk (int): Anzahl der Teilintervalle der Interpolante
+        eps (float): Toleranz/Schutzparameter, wird an _eval_y weitergegeben
+
+    Rückgabe:
+        tuple: (xk, yk, T)
+            xk (np.ndarray): Stützstellen
+            yk (np.ndarray): Funktionswerte an den Stützstellen
+            T (float): Integral der Interpolante über [a,b]
+    """
+    xk = np.linspace(a, b, nk + 1)
+    yk = _eval_y(f, xk, eps)
+    T = (b - a) / nk * (0.5 * yk[0] + float(np.sum(yk[1:-1])) + 0.5 * yk[-1])
+    return xk, yk, T
+
+def _mittel_vereinen(S1, S2):
+    """
+    Vereint zwei Zusammenfassungen [n, mean Y, mean X, SYY, SXX, SXY] (zentrierte Quadratsummen) zu einer
+    (paarweise Formel von Chan et al.). Es werden nie rohe Quadratsummen voneinander abgezogen, die Varianz
+    bleibt daher auch bei großem Mittelwert des Integranden genau.
+
+    Parameter:
+        S1 (np.ndarray): Erste Zusammenfassung (n = 0 erlaubt)
+        S2 (np.ndarray): Zweite Zusammenfassung (n = 0 erlaubt)
+
+    Rückgabe:
+        np.ndarray: Zusammenfassung aller Stichproben aus S1 und S2
+    """
+    n1, n2 = S1[0], S2[0]
+    if n1 == 0 or n2 == 0:
+        return (S2 if n1 == 0 else S1).copy()
+    n = n1 + n2
+    dy, dx = S2[1] - S1[1], S2[2] - S1[2]
+    g = n1 * n2 / n
+    return np.array([n, S1[1] + dy * n2 / n, S1[2] + dx * n2 / n,
+                     S1[3] + S2[3] + dy * dy * g, S1[4] + S2[4] + dx * dx * g, S1[5] + S2[5] + dx * dy * g])
+
+def _mittel_summen(f, a, b, n, quelle, schaetzer, kv, eps=1e-12, chunk=2**20):
+    """
+    Zieht n Stichproben und liefert die Zusammenfassung, aus der Schätzer und Varianz berechnet werden.
+    Pro Stichprobe: Y = (b-a) f(x) (bei "antithetisch" Mittel aus f(x) und f(a+b-x)) und
+    X = (b-a) t(x) mit der Kontrollvariate t (nur bei "kontrolle", sonst 0).
+    Je Block werden Mittelwerte und um sie zentrierte Quadratsummen gebildet und mit _mittel_vereinen
+    zusammengeführt.
+
+    Parameter:
+        f (callable): Zu integrierende Funktion
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        n (int): Anzahl der Stichproben
+        quelle (Stichprobe): Punktquelle (Pseudo-Zufall oder QMC, nur die erste Koordinate wird genutzt)
+        schaetzer (str): "mittel", "antithetisch" oder "kontrolle"
+        kv (tuple | None): (xk, yk, T) aus _kontrolle oder None
+        eps (float): Toleranz/Schutzparameter, wird an _eval_y weitergegeben
+        chunk (int): Maximale Anzahl Stichproben pro Block
+
+    Rückgabe:
+        np.ndarray: Zusammenfassung [n, mean Y, mean X, SYY, SXX, SXY] mit den zentrierten Summen
+            SYY = sum (Y - mean Y)^2, SXX = sum (X - mean X)^2, SXY = sum (X - mean X)(Y - mean Y)
+    """
+    S = np.zeros(6)
+    for c0 in range(0, n, chunk):
+        c1 = min(c0 + chunk, n)
+        x = a + (b - a) * quelle.ziehe(c0, c1, n)[:, 0]
+        if schaetzer == "antithetisch":
+            # x und Spiegelpunkt a+b-x in einem Aufruf
+            y = _eval_y(f, np.concatenate((x, a + b - x)), eps)
+            Y = (b - a) * 0.5 * (y[:c1 - c0] + y[c1 - c0:])
+        else:
+            Y = (b - a) * _eval_y(f, x, eps)
+        X = (b - a) * np.interp(x, kv[0], kv[1]) if kv is not None else np.zeros_like(Y)
+        my, mx = Y.mean(), X.mean()
+        Yz, Xz = Y - my, X - mx
+        S = _mittel_vereinen(S, np.array([c1 - c0, my, mx, Yz @ Yz, Xz @ Xz, Xz @ Yz]))
+    return S
+
+def _mittel_schaetzung(S, T=0.0):
+    """
+    Berechnet aus der Zusammenfassung von _mittel_summen den Integralschätzer und seine Varianz.
+    Mit Kontrollvariate: I = mean(Y) - c (mean(X) - T), c = Cov(X,Y)/Var(X) (aus denselben Stichproben geschätzt;
+    bei weniger als 10 Stichproben ist diese Schätzung unbrauchbar, dann gilt c = 1).
+
+    Parameter:
+        S (np.ndarray): Zusammenfassung [n, mean Y, mean X, SYY, SXX, SXY] (siehe _mittel_summen)
+        T (float): Exakter Erwartungswert der Kontrollvariate (Integral der Interpolante)
+
+    Rückgabe:
+        tuple: (I, var)
+            I (float): Schätzer des Integrals
+            var (float): Geschätzte Varianz des Schätzers (nan für n < 2)
+    """
+    n, my, mx, syy, sxx, sxy = S
+    if n < 2:
+        return float(my), float("nan")
+    vy, vx, cxy = syy / (n - 1), sxx / (n - 1), sxy / (n - 1)
+    if vx > 0:
+        c = cxy / vx if n >= 10 else 1.0
+        # Restvarianz nach Abzug der Kontrollvariate: Var(Y - cX) = Var(Y) - 2c Cov(X,Y) + c^2 Var(X)
+        return float(my - c * (mx - T)), float(max(vy - 2 * c * cxy + c * c * vx, 0.0) / n)
+    return float(my), float(vy / n)
+
+def _stichprobenzahl(N, schaetzer):
+    """
+    Rechnet eine Anzahl Funktionsauswertungen in die Anzahl Stichproben um (bei "antithetisch" kostet
+    jedes Paar x, a+b-x zwei Auswertungen).
+
+    Parameter:
+        N (int): Anzahl der Funktionsauswertungen
+        schaetzer (str): "mittel", "antithetisch" oder "kontrolle"
+
+    Rückgabe:
+        int: Anzahl der Stichproben (mindestens 1)
+    """
+    return max(N // 2, 1) if schaetzer == "antithetisch" else N
+
+def mittelwert_monte(N, a, b, h, hs, mode=0, schaetzer="mittel", nk=64, eps=1e-12, chunk=2**20, rng=None,
+                     verfahren="zufall"):
+    """
+    Mittelwert-Monte-Carlo: I ≈ (b-a) * Mittel von f(x_i), ohne ymax-Rechteck und ohne Treffer-Indikator.
+
+    Schätzer:
+    - "mittel": einfaches Stichprobenmittel
+    - "antithetisch": Paare x und a+b-x (negativ korreliert bei monotonen Abschnitten), N/2 Paare
+    - "kontrolle": Trapez-Interpolante mit nk Teilintervallen als Kontrollvariate, es wird nur der
+      (kleine) Rest f - c*t gesampelt; kostet zusätzlich nk+1 Aufrufe
+
+    Parameter:
+        N (int): Anzahl der Funktionsauswertungen für die Stichproben
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        h (callable): Funktion h(x)
+        hs (callable): Funktion hs(x)
+        mode (int): 0 nutzt h, 1 nutzt hs
+        schaetzer (str): "mittel", "antithetisch" oder "kontrolle"
+        nk (int): Teilintervalle der Trapez-Interpolante (nur "kontrolle")
+        eps (float): Toleranz/Schutzparameter, wird an _eval_y weitergegeben
+        chunk (int): Maximale Anzahl Stichproben pro Block
+        rng (np.random.Generator | int | None): Zufallsgenerator oder Seed (siehe utils.zufall.erzeuge_rng)
+        verfahren (str): "zufall" (Pseudo-Zufall) oder "sobol" / "halton" (verwürfelte QMC-Folgen, siehe utils.zufall.Stichprobe)
+
+    Rückgabe:
+        tuple: (I, var)
+            I (float): Monte-Carlo-Näherung des Integrals
+            var (float): Geschätzte Varianz von I
+    """
+    if schaetzer not in _SCHAETZER:
+        raise ValueError(f"Unbekannter Schätzer {schaetzer!r} (erlaubt: {', '.join(_SCHAETZER)})")
+    f = h if mode == 0 else hs
+    kv = _kontrolle(f, a, b, nk, eps) if schaetzer == "kontrolle" else None
+    S = _mittel_summen(f, a, b, _stichprobenzahl(N, schaetzer), Stichprobe(verfahren, rng), schaetzer, kv, eps, chunk)
+    #Rückgabe
+    return _mittel_schaetzung(S, kv[2] if kv is not None else 0.0)
+
+def err_mittelwert_monte(err, a, b, h, hs, Ai, k=1, mode=0, schaetzer="mittel", nk=64, nmin=64, eps=1e-12,
+                         chunk=2**20, rng=None, verfahren="zufall"):
+    """
+    Erhöht N (ab nmin, Faktor 2**k), bis mittelwert_monte den Fehler err gegenüber dem Referenzwert Ai unterschreitet.
+    Die Zusammenfassung (siehe _mittel_summen) läuft mit, beim Erhöhen von N werden nur die zusätzlichen Stichproben gezogen,
+    die Kontrollvariate wird nur einmal aufgebaut. Der Start bei nmin verhindert, dass ein zufällig kleiner
+    Fehler bei wenigen Stichproben (mit unbrauchbarer Varianz- und Koeffizientenschätzung) die Suche beendet.
+
+    Parameter:
+        err (float): Fehlertoleranz für |MonteCarlo - Ai|
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        h (callable): Funktion h(x)
+        hs (callable): Funktion hs(x)
+        Ai (float): Referenzintegralwert der Zielfunktion
+        k (int): Schrittweite für den Exponenten (N wird je Schritt mit 2**k multipliziert)
+        mode (int): 0 nutzt h, 1 nutzt hs
+        schaetzer (str): "mittel", "antithetisch" oder "kontrolle"
+        nk (int): Teilintervalle der Trapez-Interpolante (nur "kontrolle")
+        nmin (int): Start-N (Funktionsauswertungen)
+        eps (float): Toleranz/Schutzparameter, wird an _eval_y weitergegeben
+        chunk (int): Maximale Anzahl Stichproben pro Block
+        rng (np.random.Generator | int | None): Zufallsgenerator oder Seed (siehe utils.zufall.erzeuge_rng)
+        verfahren (str): "zufall" (Pseudo-Zufall) oder "sobol" / "halton" (verwürfelte QMC-Folgen, siehe utils.zufall.Stichprobe)
+
+    Rückgabe:
+        tuple: (N, I, var)
+            N (int): Verwendete Anzahl Funktionsauswertungen für die Stichproben (wie bei mittelwert_monte)
+            I (float): Monte-Carlo-Näherung bei diesem N
+            var (float): Geschätzte Varianz von I
+    """
+    if schaetzer not in _SCHAETZER:
+        raise ValueError(f"Unbekannter Schätzer {schaetzer!r} (erlaubt: {', '.join(_SCHAETZER)})")
+    f = h if mode == 0 else hs
+    kv = _kontrolle(f, a, b, nk, eps) if schaetzer == "kontrolle" else None
+    T = kv[2] if kv is not None else 0.0
+    quelle = Stichprobe(verfahren, rng)
+    # Startwerte (noch keine Stichproben)
+    S = np.zeros(6)
+    N_alt, N = 0, nmin
+    while True:
+        # nur die zusätzlichen Stichproben ziehen, Summen aufaddieren
+        n_neu = _stichprobenzahl(N, schaetzer) - (_stichprobenzahl(N_alt, schaetzer) if N_alt else 0)
+        S = _mittel_vereinen(S, _mittel_summen(f, a, b, n_neu, quelle, schaetzer, kv, eps, chunk))
+        I, var = _mittel_schaetzung(S, T)
+        if abs(I - Ai) < err:
+            break
+        else:
+            N_alt = N
+            N = N * 2 ** k
+    #Rückgabe
+    return N, I, var
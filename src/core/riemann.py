@@ -1,9 +1,115 @@
 import numpy as np
 
-def riemann_untersumme(nr, a, b, f,f_raw,k=2000):
+def _zaehlaufruf(f, nr, a, b):
+    # 1 gezählter Call pro Intervall (Fairness), als ein Array-Aufruf über alle Mittelpunkte
+    xr = np.linspace(a, b, nr + 1)
+    _ = f(0.5 * (xr[:-1] + xr[1:]))  # zählt genau nr Calls (Werte werden nicht benutzt)
+
+
+def riemann_extrema(nr, a, b, f_raw, k=2000, chunk=2**20):
+    """
+    Bestimmt für alle nr Teilintervalle von [a,b] das approximierte Minimum und Maximum durch feines Abtasten.
+    Statt einer Python-Schleife über die Teilintervalle werden blockweise mehrere Teilintervalle gleichzeitig
+    als 2D-Gitter (Teilintervalle × k) ausgewertet und entlang der Zeilen reduziert.
+
+    Parameter:
+        nr (int): Anzahl der Teilintervalle der Zerlegung
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        f_raw (callable): Ungezählte Funktion für das feine Abtasten
+        k (int): Anzahl der Abtastpunkte pro Teilintervall
+        chunk (int): Maximale Anzahl Abtastpunkte pro Block (begrenzt den Speicherbedarf)
+
+    Rückgabe:
+        tuple: (ymin, ymax)
+            ymin (np.ndarray): Approximierte Minima der Teilintervalle (Länge nr)
+            ymax (np.ndarray): Approximierte Maxima der Teilintervalle (Länge nr)
+    """
+    # Teilpunkte
+    xr = np.linspace(a, b, nr + 1)
+    # relative Lage der k Abtastpunkte im Teilintervall (wie np.linspace(xr[i], xr[i+1], k))
+    t = np.linspace(0.0, 1.0, k)
+    # Ergebnisarrays
+    ymin = np.empty(nr)
+    ymax = np.empty(nr)
+    # Anzahl Teilintervalle pro Block, so dass ein Block höchstens chunk Punkte enthält
+    zeilen = max(1, int(chunk) // k)
+    for i0 in range(0, nr, zeilen):
+        i1 = min(i0 + zeilen, nr)
+        # 2D-Gitter: Zeile = Teilintervall, Spalte = Abtastpunkt
+        xl = xr[i0:i1, None]
+        xapr = xl + (xr[i0 + 1:i1 + 1, None] - xl) * t
+        # konstante Funktionen liefern evtl. nur einen Skalar -> auf Gitterform aufweiten
+        ym = np.broadcast_to(np.asarray(f_raw(xapr), dtype=float), xapr.shape)
+        ymin[i0:i1] = np.min(ym, axis=1)
+        ymax[i0:i1] = np.max(ym, axis=1)
+    # Speicherung
+    return ymin, ymax
+
+def extrema_kritisch(f_raw, xk):
+    """
+    Erstellt ein Extrema-Verfahren, das Minimum und Maximum jedes Teilintervalls nicht durch Abtasten,
+    sondern über kritische Punkte bestimmt: Ränder der Teilintervalle plus die übergebenen Kandidaten
+    (Nullstellen von f-g und der Ableitung, siehe core.functions.kritische_punkte / kritische_punkte_spline).
+    Pro Teilintervall sind damit nur O(1) Auswertungen nötig und scharfe Minima (Knicke von |f-g|) werden exakt getroffen.
+
+    Parameter:
+        f_raw (callable): Ungezählte Funktion, die an Rändern und Kandidaten ausgewertet wird
+        xk (array-like): Kritische Punkte im Inneren von [a,b]
+
+    Rückgabe:
+        callable: Funktion ext(nr, a, b) -> (ymin, ymax), nutzbar als Parameter ext der Riemann-Funktionen
+    """
+    xk = np.sort(np.asarray(xk, dtype=float).ravel())
+
+    def ext(nr, a, b):
+        # Werte an den Teilpunkten
+        xr = np.linspace(a, b, nr + 1)
+        yr = np.broadcast_to(np.asarray(f_raw(xr), dtype=float), xr.shape)
+        ymin = np.minimum(yr[:-1], yr[1:])
+        ymax = np.maximum(yr[:-1], yr[1:])
+        # Kandidaten im Inneren dem jeweiligen Teilintervall zuordnen
+        xi = xk[(xk > a) & (xk < b)]
+        if xi.size:
+            yi = np.broadcast_to(np.asarray(f_raw(xi), dtype=float), xi.shape)
+            idx = np.clip(np.searchsorted(xr, xi, side="right") - 1, 0, nr - 1)
+            np.minimum.at(ymin, idx, yi)
+            np.maximum.at(ymax, idx, yi)
+        return ymin, ymax
+
+    return ext
+
+def extrema_intervall(H):
+    """
+    Erstellt ein Extrema-Verfahren auf Basis von Intervallarithmetik (siehe core.intervall).
+    Für jedes Teilintervall liefert H garantierte Schranken ymin <= h(x) <= ymax, damit werden
+    Unter- und Obersumme zu echten Schranken des Integrals (bis auf Rundung in der Summation).
+
+    Parameter:
+        H (callable): Intervall-Auswertung H(lo, hi) -> (ylo, yhi), z.B. aus core.intervall.intervall_betrag
+
+    Rückgabe:
+        callable: Funktion ext(nr, a, b) -> (ymin, ymax), nutzbar als Parameter ext der Riemann-Funktionen
+    """
+    def ext(nr, a, b):
+        # alle Teilintervalle gleichzeitig einschließen
+        xr = np.linspace(a, b, nr + 1)
+        ylo, yhi = H(xr[:-1], xr[1:])
+        return np.asarray(ylo, dtype=float), np.asarray(yhi, dtype=float)
+
+    return ext
+
+def _extrema(nr, a, b, f_raw, k, chunk, ext):
+    # Extrema je Teilintervall: über ein übergebenes Verfahren oder durch Abtasten
+    if ext is not None:
+        return ext(nr, a, b)
+    return riemann_extrema(nr, a, b, f_raw, k, chunk)
+
+def riemann_untersumme(nr, a, b, f,f_raw,k=2000,chunk=2**20,ext=None):
     """
     Berechnet eine approximierte Riemann-Untersumme auf [a,b], indem pro Teilintervall das Minimum durch feines Abtasten angenähert wird.
     Zusätzlich wird pro Teilintervall genau ein gezählter Funktionsaufruf über f(x) durchgeführt (Fairness), während die Abtastung über f_raw ungezählt bleibt.
+    Die Abtastung aller Teilintervalle erfolgt blockweise vektorisiert (siehe riemann_extrema).
 
     Parameter:
         nr (int): Anzahl der Teilintervalle der Zerlegung
@@ -12,6 +118,8 @@ def riemann_untersumme(nr, a, b, f,f_raw,k=2000):
         f (callable): Gezählt ausgewertete Funktion (z.B. CountedFunction), dient nur zur Aufrufzählung
         f_raw (callable): Ungezählte Funktion für das feine Abtasten (liefert Werte für Min-Approximation)
         k (int): Anzahl der Abtastpunkte pro Teilintervall zur Approximation des Minimums
+        chunk (int): Maximale Anzahl Abtastpunkte pro Block
+        ext (callable | None): Optionales Extrema-Verfahren ext(nr, a, b) -> (ymin, ymax), z.B. aus extrema_kritisch; None = Abtasten
 
     Rückgabe:
         float: Approximierte Untersumme (Integralnäherung) auf [a,b]
@@ -19,27 +127,18 @@ def riemann_untersumme(nr, a, b, f,f_raw,k=2000):
     # Berechnet die untersumme (angenähert da ymin nur approximiert)
     #Feinheit der Zerlegung
     dx = (b - a) / nr
-    # Teilpunkte
-    xr = np.linspace(a, b, nr + 1)
-    # Summen
-    rsu = 0.0   # noch Null
-    fr=f_raw#Ungezählte Abtast-Funktion
-    for i in range(nr):
-        # 1 gezählter Call pro Intervall (Fairness)
-        xm = 0.5 * (xr[i] + xr[i+1])
-        _ = f(xm)  # zählt genau 1 Call (Wert wird nicht benutzt)
-        # Feines Abtasten im i-ten Teilintervall
-        xapr=np.linspace(xr[i], xr[i+1], k)#x-Werte auf i Intervall
-        ym=fr(xapr)#jeweilige y-Werte
-        ymin=float(np.min(ym))#kleinsten Speichern
-        rsu+=ymin
-    # mit dx multiplizieren
-    return rsu * dx
-
-def riemann_obersumme(nr, a, b, f,f_raw,k=2000):
+    # 1 gezählter Call pro Intervall (Fairness)
+    _zaehlaufruf(f, nr, a, b)
+    # Minima aller Teilintervalle blockweise bestimmen
+    ymin, _ = _extrema(nr, a, b, f_raw, k, chunk, ext)
+    # aufsummieren und mit dx multiplizieren
+    return float(np.sum(ymin)) * dx
+
+def riemann_obersumme(nr, a, b, f,f_raw,k=2000,chunk=2**20,ext=None):
     """
     Berechnet eine approximierte Riemann-Obersumme auf [a,b], indem pro Teilintervall das Maximum durch feines Abtasten angenähert wird.
     Zusätzlich wird pro Teilintervall genau ein gezählter Funktionsaufruf über f(x) durchgeführt (Fairness), während die Abtastung über f_raw ungezählt bleibt.
+    Die Abtastung aller Teilintervalle erfolgt blockweise vektorisiert (siehe riemann_extrema).
 
     Parameter:
         nr (int): Anzahl der Teilintervalle der Zerlegung
@@ -48,6 +147,8 @@ def riemann_obersumme(nr, a, b, f,f_raw,k=2000):
         f (callable): Gezählt ausgewertete Funktion (z.B. CountedFunction), dient nur zur Aufrufzählung
         f_raw (callable): Ungezählte Funktion für das feine Abtasten (liefert Werte für Max-Approximation)
         k (int): Anzahl der Abtastpunkte pro Teilintervall zur Approximation des Maximums
+        chunk (int): Maximale Anzahl Abtastpunkte pro Block
+        ext (callable | None): Optionales Extrema-Verfahren ext(nr, a, b) -> (ymin, ymax), z.B. aus extrema_kritisch; None = Abtasten
 
     Rückgabe:
         float: Approximierte Obersumme (Integralnäherung) auf [a,b]
@@ -55,26 +156,50 @@ def riemann_obersumme(nr, a, b, f,f_raw,k=2000):
     #Berechnet die obersumme (angenähert da ymax nur approximiert)
     # Feinheit der Zerlegung
     dx = (b - a) / nr
-    # Teilpunkte
-    xr = np.linspace(a, b, nr + 1)
-    # Summen
-    rso = 0.0  # noch Null
-    fr = f_raw  # Ungezählte Abtast-Funktion
-    for i in range(nr):
-        # 1 gezählter Call pro Intervall (Fairness)
-        xm = 0.5 * (xr[i] + xr[i+1])
-        _ = f(xm)  # zählt genau 1 Call (Wert wird nicht benutzt)
-        # Feines Abtasten im i-ten Teilintervall
-        xapr = np.linspace(xr[i], xr[i + 1], k)  # x-Werte auf i Intervall
-        ym = fr(xapr)  # jeweilige y-Werte
-        ymax = float(np.max(ym))  # größten Speichern
-        rso += ymax
-    # mit dx multiplizieren
-    return rso * dx
-
-def mittel_riemann(nr, a, b, h, hs,f_raw,k=2000,mode=0):
+    # 1 gezählter Call pro Intervall (Fairness)
+    _zaehlaufruf(f, nr, a, b)
+    # Maxima aller Teilintervalle blockweise bestimmen
+    _, ymax = _extrema(nr, a, b, f_raw, k, chunk, ext)
+    # aufsummieren und mit dx multiplizieren
+    return float(np.sum(ymax)) * dx
+
+def riemann_summen(nr, a, b, f, f_raw, k=2000, chunk=2**20, ext=None):
+    """
+    Berechnet approximierte Untersumme, Obersumme und deren Mittelwert (Riemann-Ø) in einem gemeinsamen Abtastdurchlauf.
+    Minimum und Maximum jedes Teilintervalls stammen aus denselben k Abtastpunkten, daher wird nur einmal abgetastet
+    und nur ein gezählter Funktionsaufruf pro Teilintervall durchgeführt.
+
+    Parameter:
+        nr (int): Anzahl der Teilintervalle der Zerlegung
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        f (callable): Gezählt ausgewertete Funktion (z.B. CountedFunction), dient nur zur Aufrufzählung
+        f_raw (callable): Ungezählte Funktion für das feine Abtasten
+        k (int): Anzahl der Abtastpunkte pro Teilintervall
+        chunk (int): Maximale Anzahl Abtastpunkte pro Block
+        ext (callable | None): Optionales Extrema-Verfahren ext(nr, a, b) -> (ymin, ymax), z.B. aus extrema_kritisch; None = Abtasten
+
+    Rückgabe:
+        tuple: (u, o, m)
+            u (float): Approximierte Untersumme
+            o (float): Approximierte Obersumme
+            m (float): Mittelwert aus Unter- und Obersumme
+    """
+    # Feinheit der Zerlegung
+    dx = (b - a) / nr
+    # 1 gezählter Call pro Intervall (Fairness)
+    _zaehlaufruf(f, nr, a, b)
+    # Minima und Maxima aus einem Abtastdurchlauf
+    ymin, ymax = _extrema(nr, a, b, f_raw, k, chunk, ext)
+    u = float(np.sum(ymin)) * dx
+    o = float(np.sum(ymax)) * dx
+    # Speicherung
+    return u, o, (u + o) / 2
+
+def mittel_riemann(nr, a, b, h, hs,f_raw,k=2000,mode=0,chunk=2**20,ext=None):
     """
     Berechnet den Mittelwert aus approximierter Unter- und Obersumme (Riemann-Ø) für h oder hs auf [a,b].
+    Unter- und Obersumme werden gemeinsam in einem Abtastdurchlauf bestimmt (siehe riemann_summen).
 
     Parameter:
         nr (int): Anzahl der Teilintervalle der Zerlegung
@@ -85,21 +210,127 @@ def mittel_riemann(nr, a, b, h, hs,f_raw,k=2000,mode=0):
         f_raw (callable): Ungezählte Funktion für feines Abtasten in Unter-/Obersumme
         k (int): Anzahl der Abtastpunkte pro Teilintervall in Unter-/Obersumme
         mode (int): 0 nutzt h, 1 nutzt hs
+        chunk (int): Maximale Anzahl Abtastpunkte pro Block
+        ext (callable | None): Optionales Extrema-Verfahren ext(nr, a, b) -> (ymin, ymax), z.B. aus extrema_kritisch; None = Abtasten
 
     Rückgabe:
         float: Riemann-Mittelwert (Durchschnitt aus Unter- und Obersumme) der gewählten Funktion auf [a,b]
     """
     #Berechnung des Durchschnitts aus OS und US
-    if mode == 0:
-        u, o = riemann_untersumme(nr, a, b, h,f_raw, k),riemann_obersumme(nr, a, b, h,f_raw, k)#Untersummenwerte
-    elif mode == 1:
-        u, o = riemann_untersumme(nr, a, b, hs,f_raw, k),riemann_obersumme(nr, a, b, hs,f_raw, k)#Obersummenwerte
-    return (u + o) / 2#Berechnung Durchschnitt
+    fc = h if mode == 0 else hs
+    return riemann_summen(nr, a, b, fc, f_raw, k, chunk, ext)[2]
+
 
+# Obergrenze des Abtastgitters in Punkten (float64, 2**24 Punkte = 128 MB).
+# - Mit dem Standardwert kr = 2000 (k-1 = 1999 Abstände pro Teilintervall) werden Abtastwerte nur bis
+#   n ≈ 2**24/1999 ≈ 8392 Teilintervalle wiederverwendet, für größere n wird jede Stufe neu abgetastet.
+# - Beim Verfeinern existieren altes und neues Gitter kurz gleichzeitig, der Spitzenbedarf liegt
+#   bei etwa 1.5 * 128 MB (Verdopplung von n) plus ein Block der Größe chunk.
+# Kleinere kr verschieben die Grenze zu größerem n (z.B. kr = 200 -> n ≈ 84000).
+_SPEICHER = 2**24
+
+
+class Abtastgitter:
+    """
+    Zwischenspeicher der Abtastwerte für die fehlergesteuerten Riemann-Suchen (errunter, errober, err_mittel_riemann).
 
-def errunter(err,h,hs,a,b,f_raw,Ai,k=1,k1=2000,mode=0):
+    Auf Stufe n besteht das Abtastgitter aus n*(k-1)+1 äquidistanten Punkten, jedes Teilintervall enthält
+    genau k davon (wie np.linspace(xr[i], xr[i+1], k)). Beim Verfeinern n -> 2^s*n sind alle alten Punkte
+    Teil des neuen Gitters, daher werden nur die neuen Zwischenpunkte über f_raw ausgewertet. Die Minima/Maxima
+    der Teilintervalle ergeben sich anschließend durch blockweise Reduktion der gespeicherten Werte.
+    Der Gesamtaufwand einer Suche entspricht damit etwa dem Aufwand der letzten Stufe.
+    Übersteigt das Gitter speicher Punkte, wird der Zwischenspeicher verworfen und jede weitere Stufe
+    blockweise neu abgetastet (riemann_extrema), damit der Speicherbedarf begrenzt bleibt.
+    Die Wiederverwendung gilt also nur bis n ≈ speicher/(k-1) (siehe _SPEICHER), darüber kostet jede Stufe
+    wieder eine vollständige Abtastung.
+    """
+
+    def __init__(self, a, b, f_raw, k=2000, chunk=2**20, speicher=None):
+        """
+        Initialisiert ein leeres Abtastgitter.
+
+        Parameter:
+            a (float): Linke Intervallgrenze
+            b (float): Rechte Intervallgrenze
+            f_raw (callable): Ungezählte Funktion für das feine Abtasten
+            k (int): Anzahl der Abtastpunkte pro Teilintervall (inkl. beider Ränder)
+            chunk (int): Maximale Anzahl neu ausgewerteter Punkte pro Block
+            speicher (int | None): Maximale Anzahl gespeicherter Gitterpunkte (None = _SPEICHER)
+
+        Rückgabe:
+            keine
+        """
+        self.a = a
+        self.b = b
+        self.f_raw = f_raw
+        self.m = max(int(k) - 1, 1)  # Abstände zwischen Abtastpunkten pro Teilintervall
+        self.chunk = max(1, int(chunk))
+        self.speicher = _SPEICHER if speicher is None else int(speicher)
+        self.n = 0       # aktuelle Stufe (noch nichts abgetastet)
+        self.y = None    # Abtastwerte des aktuellen Gitters
+
+    def _auswerten(self, x):
+        # konstante Funktionen liefern evtl. nur einen Skalar -> auf Form von x aufweiten
+        return np.broadcast_to(np.asarray(self.f_raw(x), dtype=float), x.shape)
+
+    def extrema(self, n):
+        """
+        Verfeinert das Gitter auf n Teilintervalle und gibt Minimum und Maximum jedes Teilintervalls zurück.
+
+        Parameter:
+            n (int): Neue Teilintervallzahl, muss ein Vielfaches der bisherigen sein
+
+        Rückgabe:
+            tuple: (ymin, ymax)
+                ymin (np.ndarray): Approximierte Minima der Teilintervalle (Länge n)
+                ymax (np.ndarray): Approximierte Maxima der Teilintervalle (Länge n)
+        """
+        m = self.m
+        zellen = n * m  # Anzahl der Gitterabstände auf der neuen Stufe
+        if zellen + 1 > self.speicher:
+            # Gitter zu groß zum Speichern -> ohne Zwischenspeicher blockweise abtasten
+            self.y = None
+            self.n = n
+            return riemann_extrema(n, self.a, self.b, self.f_raw, m + 1, self.chunk)
+        dxf = (self.b - self.a) / zellen
+        if self.y is None:
+            # erste Stufe: komplettes Gitter blockweise abtasten
+            y = np.empty(zellen + 1)
+            for j0 in range(0, zellen + 1, self.chunk):
+                j1 = min(j0 + self.chunk, zellen + 1)
+                y[j0:j1] = self._auswerten(self.a + np.arange(j0, j1) * dxf)
+        else:
+            if n % self.n != 0:
+                raise ValueError("n muss ein Vielfaches der bisherigen Teilintervallzahl sein")
+            fak = n // self.n
+            alt = self.y.size - 1  # Anzahl der alten Gitterabstände
+            y = np.empty(zellen + 1)
+            # alte Punkte übernehmen (jeder fak-te Punkt des neuen Gitters), altes Gitter danach freigeben
+            y[::fak] = self.y
+            self.y = None
+            if fak > 1:
+                # neue Punkte: je alter Zelle die fak-1 inneren Punkte
+                neu = y[:-1].reshape(alt, fak)
+                r = np.arange(1, fak)
+                zeilen = max(1, self.chunk // (fak - 1))
+                for c0 in range(0, alt, zeilen):
+                    c1 = min(c0 + zeilen, alt)
+                    j = np.arange(c0, c1)[:, None] * fak + r
+                    neu[c0:c1, 1:] = self._auswerten(self.a + j * dxf)
+        self.y = y
+        self.n = n
+        # Teilintervall i umfasst die Punkte i*m ... (i+1)*m
+        blk = y[:-1].reshape(n, m)
+        rechts = y[m::m]
+        ymin = np.minimum(np.min(blk, axis=1), rechts)
+        ymax = np.maximum(np.max(blk, axis=1), rechts)
+        return ymin, ymax
+
+
+def errunter(err,h,hs,a,b,f_raw,Ai,k=1,k1=2000,mode=0,chunk=2**20,ext=None):
     """
     Erhöht n iterativ (potenzen von 2), bis die approximierte Untersumme den Fehler err gegenüber dem Referenzwert Ai unterschreitet.
+    Die Abtastwerte früherer Stufen werden über ein Abtastgitter wiederverwendet, pro Stufe werden nur neue Punkte ausgewertet.
 
     Parameter:
         err (float): Fehlertoleranz für |Ai - Untersumme|
@@ -112,6 +343,8 @@ def errunter(err,h,hs,a,b,f_raw,Ai,k=1,k1=2000,mode=0):
         k (int): Schrittweite, mit der der Exponent q erhöht wird (n = 2**q)
         k1 (int): Anzahl der Abtastpunkte pro Teilintervall zur Minimum-Approximation
         mode (int): 0 nutzt h, 1 nutzt hs
+        chunk (int): Maximale Anzahl neu ausgewerteter Abtastpunkte pro Block
+        ext (callable | None): Optionales Extrema-Verfahren ext(n, a, b) -> (ymin, ymax); None = Abtastgitter
 
     Rückgabe:
         tuple: (n, us)
@@ -119,36 +352,30 @@ def errunter(err,h,hs,a,b,f_raw,Ai,k=1,k1=2000,mode=0):
             us (float): Untersummen-Näherung bei diesem n
     """
     # Funktion die untersumme solange ausführt bis err erreicht
-    """
- Wenn mode==0 dann h, wenn mode==1 dann hs
-    """
-    # Start: n = 0 (noch keine Teilintervalle)
+    # gezählte Funktion je nach mode
+    fc = h if mode == 0 else hs
+    # Abtastgitter, das zwischen den Stufen erhalten bleibt
+    gitter = Abtastgitter(a, b, f_raw, k1, chunk)
+    # Start: n = 1
     us,n,q=0.0,1,1
     # Erhöhe n so lange, bis der Fehler klein genug ist
-    # Erste Rechnung erfolgt bei n = 2
     while True:
-        if mode==0:
-            us = riemann_untersumme(n, a, b, h,f_raw, k1)
-            # Stoppen wenn err erreicht
-            if abs(Ai-us)<err:
-                break
-            else:
-                n = 2 ** q
-                q+=k
-        elif mode==1:
-            us = riemann_untersumme(n, a, b, hs,f_raw, k1)
-            # Stoppen wenn err erreicht
-            if abs(Ai - us) < err:
-                break
-            else:
-                n = 2 ** q
-                q+=k
+        _zaehlaufruf(fc, n, a, b)
+        ymin, _ = gitter.extrema(n) if ext is None else ext(n, a, b)
+        us = float(np.sum(ymin)) * (b - a) / n
+        # Stoppen wenn err erreicht
+        if abs(Ai-us)<err:
+            break
+        else:
+            n = 2 ** q
+            q+=k
     #Speicherung
     return n,us
 
-def errober(err, h, hs, a, b,f_raw,Ai, k=1, k1=2000, mode=0):
+def errober(err, h, hs, a, b,f_raw,Ai, k=1, k1=2000, mode=0, chunk=2**20, ext=None):
     """
     Erhöht n iterativ (potenzen von 2), bis die approximierte Obersumme den Fehler err gegenüber dem Referenzwert Ai unterschreitet.
+    Die Abtastwerte früherer Stufen werden über ein Abtastgitter wiederverwendet, pro Stufe werden nur neue Punkte ausgewertet.
 
     Parameter:
         err (float): Fehlertoleranz für |Ai - Obersumme|
@@ -161,6 +388,8 @@ def errober(err, h, hs, a, b,f_raw,Ai, k=1, k1=2000, mode=0):
         k (int): Schrittweite, mit der der Exponent q erhöht wird (n = 2**q)
         k1 (int): Anzahl der Abtastpunkte pro Teilintervall zur Maximum-Approximation
         mode (int): 0 nutzt h, 1 nutzt hs
+        chunk (int): Maximale Anzahl neu ausgewerteter Abtastpunkte pro Block
+        ext (callable | None): Optionales Extrema-Verfahren ext(n, a, b) -> (ymin, ymax); None = Abtastgitter
 
     Rückgabe:
         tuple: (n, os)
@@ -168,37 +397,31 @@ def errober(err, h, hs, a, b,f_raw,Ai, k=1, k1=2000, mode=0):
             os (float): Obersummen-Näherung bei diesem n
     """
     # Funktion die obersumme solange ausführt bis err erreicht
-    """
- Wenn mode==0 dann h, wenn mode==1 dann hs
-    """
-    # Start: n = 0 (noch keine Teilintervalle)
+    # gezählte Funktion je nach mode
+    fc = h if mode == 0 else hs
+    # Abtastgitter, das zwischen den Stufen erhalten bleibt
+    gitter = Abtastgitter(a, b, f_raw, k1, chunk)
+    # Start: n = 1
     os, n,q = 0.0, 1,1
     # Erhöhe n so lange, bis der Fehler klein genug ist
-    # Erste Rechnung erfolgt bei n = 1
     while True:
-        if mode==0:
-            os = riemann_obersumme(n, a, b, h,f_raw, k1)
-            # Stoppen wenn err erreicht
-            if abs(Ai-os)<err:
-                break
-            #Erhöhen n und k
-            else:
-                n = 2 ** q
-                q+=k
-        elif mode==1:
-            os = riemann_obersumme(n, a, b, hs,f_raw, k1)
-            # Stoppen wenn err erreicht
-            if abs(Ai - os) < err:
-                break
-            else:
-                n = 2 ** q
-                q+=k
+        _zaehlaufruf(fc, n, a, b)
+        _, ymax = gitter.extrema(n) if ext is None else ext(n, a, b)
+        os = float(np.sum(ymax)) * (b - a) / n
+        # Stoppen wenn err erreicht
+        if abs(Ai-os)<err:
+            break
+        #Erhöhen n und k
+        else:
+            n = 2 ** q
+            q+=k
     # Speicherung
     return n, os
 
-def err_mittel_riemann(err,a,b,h,hs,f_raw,Ai,k=1,k1=2000,mode=0):
+def err_mittel_riemann(err,a,b,h,hs,f_raw,Ai,k=1,k1=2000,mode=0,chunk=2**20,ext=None):
     """
     Erhöht n iterativ (potenzen von 2), bis der Mittelwert aus Unter- und Obersumme (Riemann-Ø) den Fehler err gegenüber dem Referenzwert Ai unterschreitet.
+    Unter- und Obersumme einer Stufe kommen aus demselben Abtastgitter, das zwischen den Stufen wiederverwendet wird.
 
     Parameter:
         err (float): Fehlertoleranz für |Ai - RiemannØ|
@@ -211,6 +434,8 @@ def err_mittel_riemann(err,a,b,h,hs,f_raw,Ai,k=1,k1=2000,mode=0):
         k (int): Schrittweite, mit der der Exponent q erhöht wird (n = 2**q)
         k1 (int): Anzahl der Abtastpunkte pro Teilintervall in Unter-/Obersumme
         mode (int): 0 nutzt h, 1 nutzt hs
+        chunk (int): Maximale Anzahl neu ausgewerteter Abtastpunkte pro Block
+        ext (callable | None): Optionales Extrema-Verfahren ext(n, a, b) -> (ymin, ymax); None = Abtastgitter
 
     Rückgabe:
         tuple: (n, rs)
@@ -218,26 +443,132 @@ def err_mittel_riemann(err,a,b,h,hs,f_raw,Ai,k=1,k1=2000,mode=0):
             rs (float): Riemann-Ø Näherung bei diesem n
     """
     #Funktion die mittelriemann solange ausführt bis err erreicht
-    # Start: n = 0 (noch keine Teilintervalle)
+    # gezählte Funktion je nach mode
+    fc = h if mode == 0 else hs
+    # Abtastgitter, das zwischen den Stufen erhalten bleibt
+    gitter = Abtastgitter(a, b, f_raw, k1, chunk)
+    # Start: n = 1
     rs,n,q=0.0,1,1
     # Erhöhe n so lange, bis der Fehler klein genug ist
-    # Erste Rechnung erfolgt bei n = 1
     while True:
-        if mode==0:
-            rs = mittel_riemann(n, a, b, h, hs,f_raw,k,mode)#berechnung
-            #Stoppen wenn err erreicht
-            if abs(Ai-rs)<err:
-                break
-            else:
-                n = 2 ** q
-                q+=k
-        elif mode==1:
-            rs = mittel_riemann(n, a, b, h, hs,f_raw,k,mode)#berechnung
-            # Stoppen wenn err erreicht
-            if abs(Ai - rs) < err:
-                break
-            else:
-                n = 2 ** q
-                q+=k
+        _zaehlaufruf(fc, n, a, b)
+        ymin, ymax = gitter.extrema(n) if ext is None else ext(n, a, b)
+        rs = 0.5 * float(np.sum(ymin) + np.sum(ymax)) * (b - a) / n  # Durchschnitt aus US und OS
+        #Stoppen wenn err erreicht
+        if abs(Ai-rs)<err:
+            break
+        else:
+            n = 2 ** q
+            q+=k
     #Speicherung
     return n,rs
+
+
+def _neville_zeile(R_alt, rs, nl, tiefe):
+    """
+    Berechnet eine neue Zeile des Extrapolationsschemas (Neville) für Riemann-Ø Werte.
+    Auf monotonen Stücken liegen Minimum und Maximum an den Rändern der Teilintervalle, Riemann-Ø ist dort
+    die Trapezsumme. Der Fehler wird daher wie bei Romberg als Polynom in dx^2 (dx = (b-a)/n) angesetzt,
+    jede Spalte j eliminiert den Term dx^(2j). Die Verhältnisse aufeinanderfolgender n dürfen verschieden sein.
+
+    Parameter:
+        R_alt (list): Vorige Zeile des Schemas (R_alt[0] ist Riemann-Ø der vorigen Stufe)
+        rs (float): Riemann-Ø der aktuellen Stufe
+        nl (list): Teilintervallzahlen aller bisherigen Stufen (nl[-1] ist die aktuelle)
+        tiefe (int): Maximale Anzahl eliminierter Fehlerterme
+
+    Rückgabe:
+        list: Neue Zeile, der letzte Eintrag ist die beste Näherung
+    """
+    R = [rs]
+    for j in range(1, min(len(R_alt), tiefe) + 1):
+        R.append(R[j - 1] + (R[j - 1] - R_alt[j - 1]) / ((nl[-1] / nl[-1 - j]) ** 2 - 1))
+    return R
+
+
+def riemann_extrapoliert(nr, a, b, h, hs, f_raw, k=2000, mode=0, chunk=2**20, ext=None, tiefe=3):
+    """
+    Extrapoliert Riemann-Ø über die Stufen n = 1, 2, 4, ..., 2**m <= nr (Richardson/Neville).
+    Die führenden Fehlerterme der Stufen heben sich auf, die Konvergenz ist dadurch deutlich schneller als
+    bei Riemann-Ø selbst. Die Stufen teilen sich ein Abtastgitter, pro Stufe wird ein Zählaufruf gemacht.
+
+    Parameter:
+        nr (int): Maximale Anzahl der Teilintervalle der feinsten Stufe (wird auf eine Potenz von 2 abgerundet)
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        h (callable): Gezählt ausgewertete Funktion h(x)
+        hs (callable): Gezählt ausgewertete Funktion hs(x)
+        f_raw (callable): Ungezählte Funktion für feines Abtasten in Unter-/Obersumme
+        k (int): Anzahl der Abtastpunkte pro Teilintervall in Unter-/Obersumme
+        mode (int): 0 nutzt h, 1 nutzt hs
+        chunk (int): Maximale Anzahl neu ausgewerteter Abtastpunkte pro Block
+        ext (callable | None): Optionales Extrema-Verfahren ext(n, a, b) -> (ymin, ymax); None = Abtastgitter
+        tiefe (int): Maximale Anzahl eliminierter Fehlerterme (höhere Spalten verstärken bei Knicken eher Störungen)
+
+    Rückgabe:
+        tuple: (n, re)
+            n (int): Teilintervallzahl der feinsten Stufe (Potenz von 2)
+            re (float): Extrapolierte Riemann-Ø Näherung
+    """
+    fc = h if mode == 0 else hs
+    gitter = Abtastgitter(a, b, f_raw, k, chunk)
+    # Anzahl der Verdopplungen (feinste Stufe n = 2**m <= nr)
+    m = int(np.floor(np.log2(max(int(nr), 1))))
+    R, nl = [], []
+    for i in range(m + 1):
+        n = 2 ** i
+        _zaehlaufruf(fc, n, a, b)
+        ymin, ymax = gitter.extrema(n) if ext is None else ext(n, a, b)
+        rs = 0.5 * float(np.sum(ymin) + np.sum(ymax)) * (b - a) / n
+        nl.append(n)
+        R = _neville_zeile(R, rs, nl, tiefe)
+    #Rückgabe
+    return n, R[-1]
+
+
+def err_riemann_extrapoliert(err,a,b,h,hs,f_raw,Ai,k=1,k1=2000,mode=0,chunk=2**20,ext=None,tiefe=3):
+    """
+    Erhöht n iterativ (potenzen von 2) wie err_mittel_riemann, bis der über alle bisherigen Stufen extrapolierte
+    Riemann-Ø Wert den Fehler err gegenüber dem Referenzwert Ai unterschreitet.
+
+    Parameter:
+        err (float): Fehlertoleranz für |Ai - extrapoliertes RiemannØ|
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        h (callable): Gezählt ausgewertete Funktion h(x)
+        hs (callable): Gezählt ausgewertete Funktion hs(x)
+        f_raw (callable): Ungezählte Funktion für feines Abtasten in Unter-/Obersumme
+        Ai (float): Referenzintegralwert der Zielfunktion
+        k (int): Schrittweite, mit der der Exponent q erhöht wird (n = 2**q)
+        k1 (int): Anzahl der Abtastpunkte pro Teilintervall in Unter-/Obersumme
+        mode (int): 0 nutzt h, 1 nutzt hs
+        chunk (int): Maximale Anzahl neu ausgewerteter Abtastpunkte pro Block
+        ext (callable | None): Optionales Extrema-Verfahren ext(n, a, b) -> (ymin, ymax); None = Abtastgitter
+        tiefe (int): Maximale Anzahl eliminierter Fehlerterme
+
+    Rückgabe:
+        tuple: (n, re)
+            n (int): Gefundene Teilintervallzahl (als Potenz von 2)
+            re (float): Extrapolierte Riemann-Ø Näherung bei diesem n
+    """
+    fc = h if mode == 0 else hs
+    # Abtastgitter, das zwischen den Stufen erhalten bleibt
+    gitter = Abtastgitter(a, b, f_raw, k1, chunk)
+    # Start: n = 1
+    R, nl = [], []
+    n,q=1,1
+    # Erhöhe n so lange, bis der Fehler klein genug ist
+    while True:
+        _zaehlaufruf(fc, n, a, b)
+        ymin, ymax = gitter.extrema(n) if ext is None else ext(n, a, b)
+        rs = 0.5 * float(np.sum(ymin) + np.sum(ymax)) * (b - a) / n
+        nl.append(n)
+        R = _neville_zeile(R, rs, nl, tiefe)
+        #Stoppen wenn err erreicht
+        if abs(Ai-R[-1])<err:
+            break
+        else:
+            n = 2 ** q
+            q+=k
+    #Rückgabe
+    return n,R[-1]
@@ -0,0 +1,86 @@
+import numpy as np#arrays
+from core.trapez import trapezregel, trapez_verfeinern
+
+def _richardson_zeile(R_alt, ts):
+    """
+    Berechnet eine neue Zeile des Romberg-Schemas aus der vorigen Zeile und einer neuen Trapezsumme.
+
+    Parameter:
+        R_alt (list): Vorige Zeile des Schemas (Länge i), R_alt[0] ist die Trapezsumme zur halben Schrittweite
+        ts (float): Trapezsumme zur aktuellen (halbierten) Schrittweite
+
+    Rückgabe:
+        list: Neue Zeile (Länge i+1), der letzte Eintrag ist die beste Näherung
+    """
+    # Richardson-Extrapolation: der Fehler der Trapezregel hat nur gerade Potenzen von dx,
+    # jede Spalte j eliminiert den Term dx^(2j)
+    R = [ts]
+    for j in range(1, len(R_alt) + 1):
+        R.append(R[j - 1] + (R[j - 1] - R_alt[j - 1]) / (4 ** j - 1))
+    return R
+
+
+def romberg(nro, h, hs, a, b, mode=0):
+    """
+    Berechnet die Romberg-Näherung des Integrals auf [a,b] aus den Trapezsummen zu 1, 2, 4, ..., n Teilintervallen.
+    Die Trapezsummen werden über verschachtelte Gitter verfeinert (nur neue Stützstellen werden ausgewertet),
+    die Extrapolation selbst kostet keine weiteren Funktionsauswertungen.
+
+    Parameter:
+        nro (int): Maximale Anzahl der Teilintervalle der feinsten Trapezsumme (wird auf eine Potenz von 2 abgerundet)
+        h (callable): Funktion h(x)
+        hs (callable): Funktion hs(x)
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        mode (int): 0 nutzt h, 1 nutzt hs
+
+    Rückgabe:
+        tuple: (n, rs)
+            n (int): Tatsächlich verwendete Teilintervallzahl der feinsten Stufe (Potenz von 2)
+            rs (float): Romberg-Näherung des Integrals der gewählten Funktion
+    """
+    # Anzahl der Halbierungen (feinste Stufe n = 2**m <= nro)
+    m = int(np.floor(np.log2(max(int(nro), 1))))
+    # erste Zeile: Trapezsumme mit einem Teilintervall
+    n = 1
+    R = [float(trapezregel(n, h, hs, a, b, mode))]
+    for _ in range(m):
+        ts = trapez_verfeinern(R[0], n, 2 * n, h, hs, a, b, mode)
+        n *= 2
+        R = _richardson_zeile(R, ts)
+    #Rückgabe
+    return n, R[-1]
+
+
+def rombergerr(err, h, hs, a, b, Ai, mode=0):
+    """
+    Halbiert die Schrittweite, bis die Romberg-Näherung den Fehler err gegenüber dem Referenzwert Ai unterschreitet.
+
+    Parameter:
+        err (float): Fehlertoleranz für |Ai - Romberg|
+        h (callable): Funktion h(x)
+        hs (callable): Funktion hs(x)
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        Ai (float): Referenzintegralwert der Zielfunktion
+        mode (int): 0 nutzt h, 1 nutzt hs
+
+    Rückgabe:
+        tuple: (n, rs)
+            n (int): Gefundene Teilintervallzahl der feinsten Trapezsumme (Potenz von 2)
+            rs (float): Romberg-Näherung bei diesem n
+    """
+    # Startwerte (erste Rechnung bei n = 1)
+    n = 1
+    R = [float(trapezregel(n, h, hs, a, b, mode))]
+    # Schrittweite halbieren, bis Fehler klein genug ist
+    while True:
+        #Stoppen wenn err erreicht
+        if abs(R[-1] - Ai) < err:
+            break
+        else:
+            ts = trapez_verfeinern(R[0], n, 2 * n, h, hs, a, b, mode)
+            n *= 2
+            R = _richardson_zeile(R, ts)
+    #Rückgabe
+    return n, R[-1]
@@ -1,11 +1,13 @@
 import numpy as np#arrays
+from core.trapez import trapezregel, trapez_verfeinern
 
-def simpsonregel(h,hs,ns,a,b,mode=0):
+def simpsonregel(h,hs,ns,a,b,mode=0,chunk=2**22):
     """
     Berechnet die Simpsonregel-Näherung für das Integral auf [a,b].
 
     Abhängig vom Parameter mode wird entweder die Funktion h oder hs integriert.
     Die Anzahl der Teilintervalle ns muss gerade sein.
+    Ist ns+1 größer als chunk, wird blockweise gerechnet (simpsonregel_blockweise), damit ys nicht komplett im Speicher liegt.
 
     Parameter:
         h (callable): Funktion h(x)
@@ -14,10 +16,14 @@ def simpsonregel(h,hs,ns,a,b,mode=0):
         a (float): Linke Intervallgrenze
         b (float): Rechte Intervallgrenze
         mode (int): 0 nutzt h, 1 nutzt hs
+        chunk (int): Maximale Anzahl Stützstellen, die auf einmal ausgewertet werden
 
     Rückgabe:
         float: Simpsonregel-Näherung des Integrals der gewählten Funktion
     """
+    # sehr feine Zerlegung -> blockweise rechnen
+    if ns + 1 > chunk:
+        return simpsonregel_blockweise(h, hs, ns, a, b, mode, chunk)
     #Feinheit der Zerlegung
     dx = (b - a) / ns
     #Stützstellen
@@ -37,13 +43,42 @@ def simpsonregel(h,hs,ns,a,b,mode=0):
         elif ys.size == 1 and xs.size > 1:
             ys = np.full_like(xs, float(ys.ravel()[0]), dtype=float)
     # ---------------------------------------------------------------
-    #Berechnung Simpson
-    ss = ys[0] + ys[-1]
-    for i in range(1, ns):
-        if i % 2 == 0:  # summe für alle geraden i
-            ss += 2 * ys[i]
-        elif i % 2 == 1:  # summe für alle ungeraden i
-            ss += 4 * ys[i]
+    #Berechnung Simpson (ungerade Indizes Gewicht 4, gerade innere Indizes Gewicht 2)
+    ss = ys[0] + ys[-1] + 4 * np.sum(ys[1:-1:2]) + 2 * np.sum(ys[2:-1:2])
+    #Rückgabe
+    return ss * (dx / 3)
+
+
+def simpsonregel_blockweise(h,hs,ns,a,b,mode=0,chunk=2**22):
+    """
+    Berechnet die Simpsonregel-Näherung wie simpsonregel, wertet die Stützstellen aber in Blöcken
+    von höchstens chunk Punkten aus. Der Speicherbedarf hängt damit nicht von ns ab.
+
+    Parameter:
+        h (callable): Funktion h(x)
+        hs (callable): Funktion hs(x)
+        ns (int): Anzahl der Teilintervalle (gerade Zahl)
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        mode (int): 0 nutzt h, 1 nutzt hs
+        chunk (int): Maximale Anzahl Stützstellen pro Block
+
+    Rückgabe:
+        float: Simpsonregel-Näherung des Integrals der gewählten Funktion
+    """
+    #Feinheit der Zerlegung
+    dx = (b - a) / ns
+    f = h if mode == 0 else hs
+    ss = 0.0
+    for j0 in range(0, ns + 1, chunk):
+        j1 = min(j0 + chunk, ns + 1)
+        j = np.arange(j0, j1)
+        xs = a + j * dx
+        ys = np.broadcast_to(np.asarray(f(xs), dtype=float), xs.shape)
+        # Gewichte: 1 an den Rändern, 4 für ungerade, 2 für gerade Indizes
+        w = np.where(j % 2 == 1, 4.0, 2.0)
+        w[(j == 0) | (j == ns)] = 1.0
+        ss += float(np.dot(w, ys))
     #Rückgabe
     return ss * (dx / 3)
 
@@ -52,6 +87,9 @@ def simpsonerr(h,hs,err,a,b,Ai,k=1,mode=0):
     """
     Erhöht die Teilintervallzahl ns (in Zweierpotenzen), bis die Simpsonregel-
     Näherung den Fehler err gegenüber dem Referenzwert Ai unterschreitet.
+    Die Simpsonsumme wird aus zwei Trapezsummen verschachtelter Gitter gebildet,
+    S(ns) = (4*T(ns) - T(ns/2)) / 3. Die Trapezsummen werden mitgeführt, pro Schritt
+    werden daher nur die neuen Stützstellen ausgewertet.
 
     Parameter:
         h (callable): Funktion h(x)
@@ -68,15 +106,21 @@ def simpsonerr(h,hs,err,a,b,Ai,k=1,mode=0):
             ns (int): Gefundene Teilintervallzahl (gerade, Potenz von 2)
             ss (float): Simpsonregel-Näherung bei diesem ns
     """
-    # Start: ns = 0 (noch keine Teilintervalle), erste Rechnung bei ns = 2
-    ss, ns,q = 0.0, 2,2  # Simpson-Näherung,ns und Laufvariable q
+    # Start: erste Rechnung bei ns = 2 aus T(1) und T(2)
+    ns,q = 2,2  # ns und Laufvariable q
+    th = trapezregel(1, h, hs, a, b, mode)  # Trapezsumme bei ns/2
+    tn = trapez_verfeinern(th, 1, ns, h, hs, a, b, mode)  # Trapezsumme bei ns
+    ss = (4 * tn - th) / 3
     # ns erhöhen, bis Simpsonregel nah genug am Referenzwert Ai ist
     while True:
-        ss = simpsonregel(h, hs, ns, a, b, mode)
         #Stoppen wenn err erreicht
         if abs(Ai-ss) < err: break
         else:
+            # Trapezsummen auf ns_neu/2 und ns_neu verfeinern (nur neue Stützstellen)
+            th = trapez_verfeinern(tn, ns, 2**(q - 1), h, hs, a, b, mode)
+            tn = trapez_verfeinern(th, 2**(q - 1), 2**q, h, hs, a, b, mode)
             ns=2**q
             q+=k
+            ss = (4 * tn - th) / 3
     #Rückgabe
     return ns, ss
@@ -0,0 +1,102 @@
+import numpy as np#arrays
+
+def _knoten(t, a, b):
+    """
+    Berechnet die Tanh-Sinh-Knoten zu positiven Parametern t (beide Seiten, symmetrisch) samt Gewichten.
+
+    Die Abstände zu den Rändern werden in Komplementform berechnet, 1 - tanh(u) = exp(-u)/cosh(u),
+    damit Knoten nahe a bzw. b nicht auf den Rand gerundet werden. Knoten, die in Gleitkomma trotzdem
+    mit a oder b zusammenfallen würden, werden verworfen (an den Rändern wird nie ausgewertet).
+
+    Parameter:
+        t (np.ndarray): Positive Parameterwerte
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+
+    Rückgabe:
+        tuple: (xs, ws)
+            xs (np.ndarray): Knoten (erst links von der Mitte, dann rechts)
+            ws (np.ndarray): Zugehörige Gewichte (ohne Schrittweite)
+    """
+    r = 0.5 * (b - a)
+    u = 0.5 * np.pi * np.sinh(t)
+    # Abstand zum Rand und Gewicht über e = exp(-2u) (kein Überlauf von cosh(u) für große u):
+    # exp(-u)/cosh(u) = 2e/(1+e), 1/cosh(u)^2 = 4e/(1+e)^2
+    e = np.exp(-2.0 * u)
+    d = r * 2.0 * e / (1.0 + e)
+    w = r * 0.5 * np.pi * np.cosh(t) * 4.0 * e / (1.0 + e) ** 2
+    xl, xr = a + d, b - d
+    ok_l = (d > 0) & (xl > a) & (xl < b)
+    ok_r = (d > 0) & (xr < b) & (xr > a)
+    return np.concatenate((xl[ok_l], xr[ok_r])), np.concatenate((w[ok_l], w[ok_r]))
+
+
+def _summe(f, xs, ws):
+    """
+    Gewichtete Summe der Funktionswerte an den Knoten (konstante Funktionen liefern evtl. nur einen Skalar).
+
+    Parameter:
+        f (callable): Zu integrierende Funktion
+        xs (np.ndarray): Knoten
+        ws (np.ndarray): Gewichte
+
+    Rückgabe:
+        float: Summe ws * f(xs)
+    """
+    if xs.size == 0:
+        return 0.0
+    ys = np.broadcast_to(np.asarray(f(xs), dtype=float), xs.shape)
+    return float(np.dot(ws, ys))
+
+
+def tanh_sinh(err, h, hs, a, b, mode=0, tmax=6.5, maxstufe=12):
+    """
+    Doppelt-exponentielle (Tanh-Sinh-) Quadratur auf [a,b].
+
+    Substitution x = (a+b)/2 + (b-a)/2 * tanh(pi/2 * sinh(t)) und Trapezregel in t mit Schrittweite dt.
+    Die Knoten häufen sich doppelt exponentiell an den Rändern, dadurch werden auch Integranden mit
+    Randsingularitäten (z.B. x*ln(x), ln(x)/sqrt(x)) schnell genau, ohne eps-Ersetzung und ohne
+    Auswertung an a oder b. Beim Halbieren von dt bleiben alle alten Knoten gültig, pro Stufe
+    werden nur die neuen Knoten ausgewertet.
+    Gestoppt wird, wenn sich zwei aufeinanderfolgende Stufen um weniger als err unterscheiden
+    (kein Referenzwert nötig) oder maxstufe erreicht ist (dann ist erreicht = False).
+
+    Parameter:
+        err (float): Fehlertoleranz für die Differenz zweier Stufen
+        h (callable): Funktion h(x)
+        hs (callable): Funktion hs(x)
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        mode (int): 0 nutzt h, 1 nutzt hs
+        tmax (float): Abschneidegrenze des Parameters t
+        maxstufe (int): Maximale Anzahl der Halbierungen von dt
+
+    Rückgabe:
+        tuple: (n, ts, erreicht)
+            n (int): Anzahl der verwendeten Knoten
+            ts (float): Tanh-Sinh-Näherung des Integrals der gewählten Funktion
+            erreicht (bool): True, wenn sich die letzten beiden Stufen um weniger als err unterscheiden
+    """
+    f = h if mode == 0 else hs
+    # Stufe 0: dt = 1, Knoten t = 0, ±1, ..., ±floor(tmax)
+    dt = 1.0
+    xs, ws = _knoten(np.arange(1.0, np.floor(tmax) + 1), a, b)
+    xm = np.array([0.5 * (a + b)])
+    s = _summe(f, xm, np.array([0.25 * np.pi * (b - a)])) + _summe(f, xs, ws)
+    n = xs.size + 1
+    ts = dt * s
+    erreicht = False
+    for _ in range(maxstufe):
+        # neue Knoten: ungerade Vielfache von dt/2
+        t = (2 * np.arange(int(tmax / dt) + 1) + 1) * (0.5 * dt)
+        xs, ws = _knoten(t[t <= tmax], a, b)
+        s += _summe(f, xs, ws)
+        n += xs.size
+        dt *= 0.5
+        ts, ts_alt = dt * s, ts
+        #Stoppen wenn err erreicht
+        if abs(ts - ts_alt) < err:
+            erreicht = True
+            break
+    #Rückgabe
+    return n, ts, erreicht
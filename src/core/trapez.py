@@ -1,5 +1,8 @@
 import numpy as np#arrays
 
+# Euler-Maclaurin: Koeffizienten -B_2j/(2j)! vor dx^(2j) * (F^(2j-1)(b) - F^(2j-1)(a)), j = 1, 2, 3
+_EM_KOEFF = (-1 / 12, 1 / 720, -1 / 30240)
+
 def trapezregel(nt,h,hs,a,b,mode=0):
     """
     Berechnet die Trapezregel-Näherung für das Integral auf [a,b], je nach mode für h oder hs.
@@ -39,9 +42,48 @@ def trapezregel(nt,h,hs,a,b,mode=0):
     return ts*dx
 
 
+def trapez_verfeinern(ts, nt, nt_neu, h, hs, a, b, mode=0):
+    """
+    Verfeinert eine vorhandene Trapezsumme von nt auf nt_neu Teilintervalle (nt_neu Vielfaches von nt).
+    Die alten Stützstellen sind Teil des neuen Gitters, daher werden nur die neuen Zwischenpunkte ausgewertet:
+    T(nt_neu) = T(nt)/fak + dx_neu * Summe der neuen Funktionswerte, mit fak = nt_neu/nt.
+
+    Parameter:
+        ts (float): Trapezregel-Näherung bei nt Teilintervallen
+        nt (int): Bisherige Anzahl der Teilintervalle
+        nt_neu (int): Neue Anzahl der Teilintervalle (Vielfaches von nt)
+        h (callable): Funktion h(x)
+        hs (callable): Funktion hs(x)
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        mode (int): 0 nutzt h, 1 nutzt hs
+
+    Rückgabe:
+        float: Trapezregel-Näherung bei nt_neu Teilintervallen
+    """
+    fak = nt_neu // nt
+    if fak * nt != nt_neu:
+        raise ValueError("nt_neu muss ein Vielfaches von nt sein")
+    if fak == 1:
+        return ts
+    #Feinheit der neuen Zerlegung
+    dx = (b - a) / nt_neu
+    #neue Stützstellen: je altem Teilintervall die fak-1 inneren Punkte
+    j = (np.arange(nt)[:, None] * fak + np.arange(1, fak)).ravel()
+    xt = a + j * dx
+    if mode == 0:
+        yt = h(xt)  # y-Werte h
+    elif mode == 1:
+        yt = hs(xt)  # y-Werte hs
+    # konstante Funktionen liefern evtl. nur einen Skalar -> auf Länge von xt aufweiten
+    yt = np.broadcast_to(np.asarray(yt, dtype=float), xt.shape)
+    return ts / fak + dx * float(np.sum(yt))
+
+
 def trapezerr(err, h, hs, a, b,Ai, k=1, mode=0):
     """
     Erhöht nt iterativ (Potenzen von 2), bis die Trapezregel-Näherung den Fehler err gegenüber dem Referenzwert Ai unterschreitet.
+    Da die Gitter verschachtelt sind, wird die vorige Summe übernommen und pro Schritt nur an den neuen Stützstellen ausgewertet.
 
     Parameter:
         err (float): Fehlertoleranz für |Ai - Trapezregel|
@@ -59,16 +101,111 @@ def trapezerr(err, h, hs, a, b,Ai, k=1, mode=0):
             ts (float): Trapezregel-Näherung bei diesem nt
     """
     #Berechnet Trapezregel so lange bis err erreicht
-    # Startwerte
-    ts, nt,q = 0.0, 1,1
+    # Startwerte (erste Rechnung bei nt = 1)
+    nt,q = 1,1
+    ts = trapezregel(nt, h, hs, a, b, mode)
     # nt erhöhen, bis Fehler klein genug ist
     while True:
-        ts = trapezregel(nt, h, hs, a, b, mode)#berechnung
         #Stoppen wenn err erreicht
         if abs(ts-Ai) < err:
             break
         else:
+            # nur neue Stützstellen auswerten
+            ts = trapez_verfeinern(ts, nt, 2**q, h, hs, a, b, mode)
             nt=2**q
             q+=k
     #Rückgabe
     return nt, ts
+
+
+def em_korrektur(dx, abl, a, b):
+    """
+    Berechnet die Euler-Maclaurin-Randkorrektur der Trapezregel aus den Ableitungen an den Rändern:
+    Integral = T(dx) - dx^2/12 * (F'(b) - F'(a)) + dx^4/720 * (F^(3)(b) - F^(3)(a)) - ...
+    Ist ein Randwert nicht endlich (z.B. Singularität der Ableitung), werden nur die Terme davor verwendet.
+
+    Parameter:
+        dx (float): Schrittweite der Trapezregel
+        abl (tuple): Ableitungen der Ordnungen 1, 3, 5, ... als Funktionen d(x, seite)
+                     (seite=+1 rechtsseitig an a, seite=-1 linksseitig an b)
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+
+    Rückgabe:
+        float: Korrekturterm, der zur Trapezsumme addiert wird
+    """
+    kor = 0.0
+    # Ränder als float-Arrays (1/0 usw. liefert dann inf/NaN statt einer Exception)
+    xa, xb = np.array([a], dtype=float), np.array([b], dtype=float)
+    for j, (c, d) in enumerate(zip(_EM_KOEFF, abl), start=1):
+        with np.errstate(all="ignore"):
+            term = c * dx ** (2 * j) * float(np.sum(d(xb, -1) - d(xa, 1)))
+        if not np.isfinite(term):
+            break
+        kor += term
+    return kor
+
+
+def trapezregel_em(nt, h, hs, a, b, dh, dhs, mode=0):
+    """
+    Berechnet die Trapezregel-Näherung mit Euler-Maclaurin-Randkorrektur (Ordnung 2+2*len(dh) für glatte Funktionen).
+    Die Korrektur braucht nur Ableitungswerte an a und b, die Zahl der Funktionsauswertungen bleibt nt+1.
+
+    Parameter:
+        nt (int): Anzahl der Teilintervalle der Zerlegung
+        h (callable): Funktion h(x)
+        hs (callable): Funktion hs(x)
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        dh (tuple): Ableitungen von h der Ordnungen 1, 3, ... (siehe em_korrektur)
+        dhs (tuple): Ableitungen von hs der Ordnungen 1, 3, ... (siehe em_korrektur)
+        mode (int): 0 nutzt h, 1 nutzt hs
+
+    Rückgabe:
+        float: Korrigierte Trapezregel-Näherung des Integrals der gewählten Funktion
+    """
+    abl = dh if mode == 0 else dhs
+    ts = trapezregel(nt, h, hs, a, b, mode)
+    return ts + em_korrektur((b - a) / nt, abl, a, b)
+
+
+def trapezerr_em(err, h, hs, a, b, Ai, dh, dhs, k=1, mode=0):
+    """
+    Erhöht nt iterativ (Potenzen von 2), bis die randkorrigierte Trapezregel den Fehler err gegenüber dem
+    Referenzwert Ai unterschreitet. Die Trapezsummen werden wie in trapezerr auf verschachtelten Gittern verfeinert.
+
+    Parameter:
+        err (float): Fehlertoleranz für |Ai - korrigierte Trapezregel|
+        h (callable): Funktion h(x)
+        hs (callable): Funktion hs(x)
+        a (float): Linke Intervallgrenze
+        b (float): Rechte Intervallgrenze
+        Ai (float): Referenzintegralwert der Zielfunktion
+        dh (tuple): Ableitungen von h der Ordnungen 1, 3, ... (siehe em_korrektur)
+        dhs (tuple): Ableitungen von hs der Ordnungen 1, 3, ... (siehe em_korrektur)
+        k (int): Schrittweite, mit der der Exponent q erhöht wird (nt = 2**q)
+        mode (int): 0 nutzt h, 1 nutzt hs
+
+    Rückgabe:
+        tuple: (nt, te)
+            nt (int): Gefundene Teilintervallzahl (als Potenz von 2)
+            te (float): Korrigierte Trapezregel-Näherung bei diesem nt
+    """
+    abl = dh if mode == 0 else dhs
+    # Startwerte (erste Rechnung bei nt = 1)
+    nt,q = 1,1
+    ts = trapezregel(nt, h, hs, a, b, mode)
+    te = ts + em_korrektur(b - a, abl, a, b)
+    # nt erhöhen, bis Fehler klein genug ist
+    while True:
+        #Stoppen wenn err erreicht
+        if abs(te-Ai) < err:
+            break
+        else:
+            # nur neue Stützstellen auswerten, die Korrektur kostet keine Funktionsauswertung
+            ts = trapez_verfeinern(ts, nt, 2**q, h, hs, a, b, mode)
+            nt=2**q
+            q+=k
+            te = ts + em_korrektur((b - a) / nt, abl, a, b)
+    #Rückgabe
+    return nt, te
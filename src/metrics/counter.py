@@ -58,3 +58,16 @@ class CountedFunction:
             keine
         """
         self.calls = 0
+
+    def zaehle(self, n):
+        """
+        Erhöht den Zähler um n Auswertungen, die nicht über diesen Aufruf gelaufen sind
+        (z.B. in Worker-Prozessen, deren Zähler nicht zurück in den Elternprozess kommt).
+
+        Parameter:
+            n (int): Anzahl zusätzlicher Funktionsauswertungen
+
+        Rückgabe:
+            keine
+        """
+        self.calls += int(n)
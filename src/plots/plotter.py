@@ -248,9 +248,10 @@ def plot_simpson(ax, a, b, ns, f):
         ax.legend(loc="best")
 
 
-def plot_monte(ax, a, b, N,f,kma,xz,yz,T,w="h"):
+def plot_monte(ax, a, b, N,f,kma,xz,yz,T,w="h",treffer=None):
     """
     Plottet die Funktion f auf [a,b] und zeigt dazu die Monte-Carlo-Zufallspunkte (mit Trefferanzahl).
+    xz/yz dürfen eine Stichprobe der N Punkte sein (siehe core.monte.geomonte, Parameter behalten).
 
     Parameter:
         ax (matplotlib.axes.Axes): Ziel-Achse, in die gezeichnet wird
@@ -261,8 +262,9 @@ def plot_monte(ax, a, b, N,f,kma,xz,yz,T,w="h"):
         kma (int): Parameter/Steuergröße aus dem Programmkontext (hier nicht direkt verwendet)
         xz (array-like): x-Koordinaten der Zufallspunkte
         yz (array-like): y-Koordinaten der Zufallspunkte
-        T (int): Trefferanzahl (Punkte unter der Kurve)
+        T (int): Trefferanzahl (Punkte unter der Kurve, über alle N Punkte)
         w (str): "h" für B(x), "hs" für B_s(x) (nur für Labeling)
+        treffer (array-like | None): Treffer-Markierung je Punkt (None = alle Punkte einfarbig)
 
     Rückgabe:
         None
@@ -278,11 +280,27 @@ def plot_monte(ax, a, b, N,f,kma,xz,yz,T,w="h"):
         ax.plot(xp, _eval_y(f,xp), color="red", label="$B_s(x)$")
     else:
         ax.plot(xp, _eval_y(f,xp), color="red", label="$B(x)$")
-    ax.plot(xz, yz,
-            'o',
-            color="blue",
-            markersize=3,
-            label=f"Zufallspunkte mit {T} Treffern (N={N})")
+    # bei behaltener Stichprobe die Anzahl der gezeigten Punkte mit angeben
+    gezeigt = "" if len(xz) >= N else f", {len(xz)} gezeigt"
+    if treffer is None:
+        ax.plot(xz, yz,
+                'o',
+                color="blue",
+                markersize=3,
+                label=f"Zufallspunkte mit {T} Treffern (N={N}{gezeigt})")
+    else:
+        treffer = np.asarray(treffer, dtype=bool)
+        xz, yz = np.asarray(xz), np.asarray(yz)
+        ax.plot(xz[treffer], yz[treffer],
+                'o',
+                color="blue",
+                markersize=3,
+                label=f"Treffer: {T} (N={N}{gezeigt})")
+        ax.plot(xz[~treffer], yz[~treffer],
+                'o',
+                color="lightgray",
+                markersize=3,
+                label="Fehlschüsse")
     # Bearbeiten Koordinatensystem
     ax.set_xlabel("x")
     ax.set_ylabel("y")
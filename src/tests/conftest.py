@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Module liegen direkt unter src/ (Import wie in main.py: from core... / from config...)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,94 @@
+# ------------------------------------------------------------
+# Tests der Intervallarithmetik: Einschließungen müssen abgetastete Werte enthalten
+# ------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from core.intervall import (_ganzzahlige_potenz, _mod, _periodisch, _tan, intervall_funktion,
+                            intervall_betrag)
+
+
+def _intervalle(seed=0, anzahl=400, breite=3.0, zentrum=10.0):
+    # zufällige Intervalle [lo, hi] unterschiedlicher Breite (auch sehr schmale und > 2*pi)
+    rng = np.random.default_rng(seed)
+    lo = rng.uniform(-zentrum, zentrum, anzahl)
+    w = breite * rng.random(anzahl) ** 3
+    return lo, lo + w
+
+
+def _stichproben(lo, hi, k=257):
+    # k Punkte je Intervall inkl. beider Ränder, Form (anzahl, k)
+    t = np.linspace(0.0, 1.0, k)
+    return lo[:, None] + (hi - lo)[:, None] * t
+
+
+def _pruefe(ylo, yhi, y):
+    # jeder endliche Stichprobenwert muss in [ylo, yhi] seines Intervalls liegen
+    ok = np.isfinite(y)
+    assert np.all((ylo[:, None] <= y) | ~ok)
+    assert np.all((y <= yhi[:, None]) | ~ok)
+
+
+@pytest.mark.parametrize("fn, x_max, x_min", [(np.sin, np.pi / 2, -np.pi / 2), (np.cos, 0.0, np.pi)])
+def test_periodisch(fn, x_max, x_min):
+    lo, hi = _intervalle(breite=8.0)
+    ylo, yhi = _periodisch(fn, lo, hi, x_max, x_min)
+    _pruefe(ylo, yhi, fn(_stichproben(lo, hi)))
+
+
+def test_periodisch_extremum_genau_am_rand():
+    # Maximum von sin liegt genau auf dem rechten bzw. linken Rand
+    lo = np.array([0.0, np.pi / 2, -np.pi / 2])
+    hi = np.array([np.pi / 2, 2.0, 0.0])
+    ylo, yhi = _periodisch(np.sin, lo, hi, np.pi / 2, -np.pi / 2)
+    assert yhi[0] >= 1.0 and yhi[1] >= 1.0 and ylo[2] <= -1.0
+
+
+def test_tan():
+    lo, hi = _intervalle(breite=2.0)
+    ylo, yhi = _tan(lo, hi)
+    with np.errstate(all="ignore"):
+        _pruefe(ylo, yhi, np.tan(_stichproben(lo, hi)))
+    # Intervall über eine Polstelle -> keine Schranke
+    ylo, yhi = _tan(np.array([1.5]), np.array([1.7]))
+    assert ylo[0] == -np.inf and yhi[0] == np.inf
+
+
+@pytest.mark.parametrize("c", [1.0, 0.7, 2.5, -1.3])
+def test_mod(c):
+    lo, hi = _intervalle(breite=2.0)
+    ylo, yhi = _mod(lo, hi, c)
+    _pruefe(ylo, yhi, np.remainder(_stichproben(lo, hi), c))
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 4, 5, -1, -2, -3])
+def test_ganzzahlige_potenz(n):
+    lo, hi = _intervalle(zentrum=3.0)
+    ylo, yhi = _ganzzahlige_potenz(lo, hi, n)
+    with np.errstate(all="ignore"):
+        _pruefe(ylo, yhi, _stichproben(lo, hi) ** float(n))
+
+
+@pytest.mark.parametrize("expr", ["sin(3*x) - 0.2*x", "cos(x)**2", "tan(x/4)", "x % 0.7 + x**3",
+                                  "exp(-x**2) * sqrt(abs(x))", "log(abs(x) + 1) / (x**2 + 1)",
+                                  "arctan(x) - pi*x**-2", "x**0.5 + e"])
+def test_intervall_funktion(expr):
+    from config.parser import funktion_aus_ausdruck
+    f = funktion_aus_ausdruck(expr)
+    F = intervall_funktion(expr)
+    lo, hi = _intervalle(zentrum=4.0)
+    ylo, yhi = F(lo, hi)
+    with np.errstate(all="ignore"):
+        y = np.broadcast_to(np.asarray(f(_stichproben(lo, hi)), dtype=float), (lo.size, 257))
+    _pruefe(ylo, yhi, y)
+
+
+def test_intervall_betrag():
+    from config.parser import funktion_aus_ausdruck
+    H = intervall_betrag(intervall_funktion("sin(3*x)"), intervall_funktion("0.2*x"))
+    f = funktion_aus_ausdruck("abs(sin(3*x) - 0.2*x)")
+    lo, hi = _intervalle(zentrum=2.0, breite=0.5)
+    ylo, yhi = H(lo, hi)
+    assert np.all(ylo >= 0)
+    _pruefe(ylo, yhi, f(_stichproben(lo, hi)))
@@ -1,6 +1,7 @@
 from __future__ import annotations  # ermöglicht moderne Typangaben (z. B. str | None) auch mit Vorwärtsreferenzen
 from dataclasses import dataclass  # für einfache Datencontainer-Klassen (AppState)
 from pathlib import Path  # für saubere Dateinamen-/Pfadbehandlung
+import os  # Anzahl der CPU-Kerne (Monte-Carlo-Worker)
 import tkinter as tk
 from tkinter import filedialog, messagebox  # Standard-Dialoge für Datei wählen und Fehlermeldungen
 
@@ -240,6 +241,32 @@ class Controller:
             check_positive(kmi, "kmi")
             check_positive(wm, "wm")
 
+            # optional: Extrema-Verfahren der Riemann-Summen (0 = Abtasten, 1 = kritische Punkte, 2 = Intervallarithmetik)
+            if cfg.get("rm", 0) not in (0, 1, 2):
+                raise ValueError("rm muss 0 (Abtasten), 1 (kritische Punkte) oder 2 (Intervallarithmetik) sein")
+            # optional: Anzahl der Gauß-Knoten pro Teilintervall
+            check_positive(cfg.get("go", 5), "go")
+            # optional: Seed und Bit-Generator der Monte-Carlo-Verfahren
+            if "seed" in cfg and (not isinstance(cfg["seed"], int) or cfg["seed"] < 0):
+                raise ValueError("seed muss eine ganze Zahl >= 0 sein")
+            if str(cfg.get("bg", "pcg64")).lower() not in ("pcg64", "philox"):
+                raise ValueError("bg muss pcg64 oder philox sein")
+            # optional: Worker-Prozesse für Monte Carlo (0 = alle Kerne)
+            if not isinstance(cfg.get("prozesse", 1), int) or cfg.get("prozesse", 1) < 0:
+                raise ValueError("prozesse muss eine ganze Zahl >= 0 sein")
+            # optional: Stichprobenverfahren für Monte Carlo (Pseudo-Zufall oder verwürfelte QMC-Folge)
+            if str(cfg.get("mcv", "zufall")).lower() not in ("zufall", "sobol", "halton"):
+                raise ValueError("mcv muss zufall, sobol oder halton sein")
+            # optional: ymax der Monte-Carlo-Verfahren lokal nachmaximieren (0 = nein, 1 = ja)
+            if cfg.get("mref", 0) not in (0, 1):
+                raise ValueError("mref muss 0 oder 1 sein")
+            # optional: maximale Anzahl Monte-Carlo-Punkte, die für den Plot behalten werden
+            check_positive(cfg.get("mplot", 10000), "mplot")
+            # optional: Konfidenzniveau für die KI-gesteuerten Monte-Carlo-Suchen
+            ki = cfg.get("ki", 0.95)
+            if not isinstance(ki, (int, float)) or not 0 < ki < 1:
+                raise ValueError("ki muss zwischen 0 und 1 liegen")
+
         # Validierung durchführen, Fehler abfangen und anzeigen
         try:
             _validate_cfg_for_gui(self.s.cfg)  # <- ohne self.
@@ -298,6 +325,15 @@ class Controller:
         kma = int(cfg["kma"])
         kmi = int(cfg["kmi"])
         wm = int(cfg["wm"])
+        rm = int(cfg.get("rm", 0))  # optional: Extrema-Verfahren der Riemann-Summen
+        go = int(cfg.get("go", 5))  # optional: Gauß-Knoten pro Teilintervall
+        seed = cfg.get("seed")  # optional: Seed der Monte-Carlo-Verfahren (None = nicht reproduzierbar)
+        bg = cfg.get("bg", "pcg64")  # optional: Bit-Generator (pcg64 oder philox)
+        prozesse = int(cfg.get("prozesse", 1)) or (os.cpu_count() or 1)  # optional: Monte-Carlo-Worker (0 = alle Kerne)
+        mcv = str(cfg.get("mcv", "zufall")).lower()  # optional: Monte-Carlo-Stichprobe (zufall, sobol, halton)
+        mref = bool(cfg.get("mref", 0))  # optional: ymax lokal nachmaximieren
+        ki = float(cfg.get("ki", 0.95))  # optional: Konfidenzniveau der KI-Stoppregel
+        mplot = int(cfg.get("mplot", 10000))  # optional: behaltene Monte-Carlo-Punkte für den Plot
         # Funktionen bauen: h ist Betragsfunktion zwischen f und g, hs ist Betragsfunktion aus Splines
         from core.functions import betragsfunk,splinebetrag
         h = betragsfunk(f, g)
@@ -309,15 +345,25 @@ class Controller:
                 t.delete(item)
 
         # Methoden/Tools importieren (Berechnung, Fehler, Timing, Zähler)
-        from core.riemann import riemann_untersumme,riemann_obersumme,mittel_riemann,errunter,errober,err_mittel_riemann
-        from core.trapez import trapezregel,trapezerr
+        from core.riemann import riemann_summen,errunter,errober,err_mittel_riemann
+        from core.riemann import riemann_extrapoliert,err_riemann_extrapoliert
+        from core.trapez import trapezregel,trapezerr,trapezregel_em,trapezerr_em
         from core.simpson import simpsonregel,simpsonerr
-        from core.monte import geomonte,errmonte,mittel_monte,err_mittel_monte
+        from core.romberg import romberg,rombergerr
+        from core.adaptiv import adaptiv_gk
+        from core.gauss import gaussregel,gausserr
+        from core.clenshaw import clenshaw_curtis,clenshaw_curtis_err
+        from core.tanhsinh import tanh_sinh
+        from core.monte import geomonte,errmonte,replikat_monte,err_mittel_monte
+        from core.monte import mittelwert_monte,err_mittelwert_monte,geomonte_strata
+        from core.monte import errmonte_ki,err_mittel_monte_ki,TrefferPool
+        from core.functions import ymax_cache_leeren
         from core.analytisch import stammint
         from metrics.timer import timed_call
         from metrics.error import error
         from metrics.counter import CountedFunction
         from utils.validation import safe_func
+        from utils.zufall import erzeuge_rng, teile_rng
 
         # "safe_func" ersetzt problematische x=0 Werte (numerisch stabiler bei Grenzwert-Funktionen)
         h_safe = safe_func(h, 1e-12)
@@ -328,31 +374,93 @@ class Controller:
         hs_c = CountedFunction(hs_safe, name="hs")
         hs_c.reset()
 
+        # ------------------------------------------------------------
+        # Extrema-Verfahren der Riemann-Summen
+        # rm=0: Min/Max durch Abtasten mit kr Punkten pro Teilintervall
+        # rm=1: Min/Max über kritische Punkte (Nullstellen von f-g und der Ableitung)
+        # rm=2: garantierte Schranken über Intervallarithmetik (für h), hs wie rm=1 (exakt über Spline-Ableitung)
+        # ------------------------------------------------------------
+        ext_h, ext_hs = None, None
+        if rm in (1, 2):
+            from core.functions import kritische_punkte_spline
+            from core.riemann import extrema_kritisch
+            # Spline-Differenz ist stückweise kubisch -> kritische Punkte exakt
+            xk_hs, dtk1 = timed_call(kritische_punkte_spline, pl, a, b)
+            ext_hs = extrema_kritisch(hs_safe, xk_hs)
+            self.log(f"Kritische Punkte hs: {xk_hs.size} ({1000*dtk1:.3f} ms)")
+        if rm == 1:
+            from config.parser import ableitung
+            from core.functions import kritische_punkte
+            try:
+                df = ableitung(cfg["f_expr"])
+                dg = ableitung(cfg["g_expr"])
+            except ValueError as e:
+                # nicht ableitbarer Ausdruck -> h mit Abtastung (ext_h = None), hs bleibt exakt
+                self.log(f"Kritische Punkte h: keine Ableitung ({e}), Extrema durch Abtastung")
+            else:
+                d_safe = safe_func(lambda x: f(x) - g(x), 1e-12)
+                dd_safe = safe_func(lambda x: df(x) - dg(x), 1e-12)
+                # Kandidaten einmal bestimmen, alle Riemann-Zeilen nutzen sie gemeinsam
+                xk_h, dtk0 = timed_call(kritische_punkte, d_safe, dd_safe, a, b)
+                ext_h = extrema_kritisch(h_safe, xk_h)
+                self.log(f"Kritische Punkte h: {xk_h.size} ({1000*dtk0:.3f} ms)")
+        elif rm == 2:
+            from core.intervall import intervall_funktion, intervall_betrag
+            from core.riemann import extrema_intervall
+            ext_h = extrema_intervall(intervall_betrag(intervall_funktion(cfg["f_expr"]),
+                                                       intervall_funktion(cfg["g_expr"])))
+
+        # Unabhängige Zufallsströme je Monte-Carlo-Zeile (bei festem seed reproduzierbar,
+        # unabhängig von Reihenfolge und Anzahl der übrigen Methoden)
+        # ymax wird je Funktion und Intervall nur einmal pro Lauf bestimmt (Cache aus dem letzten Lauf verwerfen)
+        ymax_cache_leeren()
+        rng_mc = erzeuge_rng(seed, bg)
+        rng_geo_h, rng_geo_hs, rng_err_h, rng_err_hs, rng_mm_h, rng_mm_hs, rng_emm_h, rng_emm_hs = \
+            teile_rng(rng_mc, 8)
+        # weitere Ströme für die Mittelwert-Schätzer (je Schätzer, Funktion und fix/err einer)
+        rng_mw = iter(teile_rng(rng_mc, 12))
+        rng_st_h, rng_st_hs = teile_rng(rng_mc, 2)  # geschichtete Treffer-Methode
+        rng_ki_h, rng_ki_hs, rng_kim_h, rng_kim_hs = teile_rng(rng_mc, 4)  # KI-Stoppregel
+        if seed is not None:
+            self.log(f"Monte Carlo: seed={seed}, Bit-Generator {bg}")
+        if mcv != "zufall":
+            self.log(f"Monte Carlo: Quasi-Monte-Carlo mit verwürfelter {mcv.capitalize()}-Folge")
+
+        # ------------------------------------------------------------
+        # Randableitungen für die Euler-Maclaurin-Korrektur der Trapezregel (Ordnung 1 und 3)
+        # h: symbolische Ableitungen von f und g, hs: exakt über die Spline-Differenz
+        # ------------------------------------------------------------
+        from core.functions import betragsableitung, splinebetrag_ableitung
+        try:
+            from config.parser import ableitung
+            df1, dg1 = ableitung(cfg["f_expr"]), ableitung(cfg["g_expr"])
+            dh = tuple(betragsableitung(f, g, ableitung(cfg["f_expr"], o), ableitung(cfg["g_expr"], o), df1, dg1)
+                       for o in (1, 3))
+        except ValueError as e:
+            # nicht ableitbarer Ausdruck -> Trapez EM ohne Korrektur (= normale Trapezregel)
+            dh = ()
+            self.log(f"Trapez EM: keine Ableitung für h ({e})")
+        dhs = (splinebetrag_ableitung(pl, 1), splinebetrag_ableitung(pl, 3))
+
         # ------------------------------------------------------------
         # Riemann-Summen (fixes nr)
         # ------------------------------------------------------------
-        ruh, dt0 = timed_call(riemann_untersumme, nr, a, b, h_c, h_safe, kr)  # Untersumme h
+        # Unter-, Obersumme und Mittelwert teilen sich einen Abtastdurchlauf (gleiche Zeit/Calls)
+        (ruh, roh, rmh), dt0 = timed_call(riemann_summen, nr, a, b, h_c, h_safe, kr, ext=ext_h)  # U/O/Ø für h
         calls0 = h_c.calls
         h_c.reset()
 
-        roh, dt1 = timed_call(riemann_obersumme, nr, a, b, h_c, h_safe, kr)  # Obersumme h
-        calls1 = h_c.calls
-        h_c.reset()
-
-        rohs, dt2 = timed_call(riemann_obersumme, nr, a, b, hs_c,hs_safe , kr)  # Obersumme hs
-        calls2 = hs_c.calls
-        hs_c.reset()
-
-        ruhs, dt3 = timed_call(riemann_untersumme, nr, a, b, hs_c,hs_safe , kr)  # Untersumme hs
+        (ruhs, rohs, rmhs), dt3 = timed_call(riemann_summen, nr, a, b, hs_c, hs_safe, kr, ext=ext_hs)  # U/O/Ø für hs
         calls3 = hs_c.calls
         hs_c.reset()
 
-        rmh, dt4 = timed_call(mittel_riemann, nr, a, b, h_c, hs_safe , h_safe, kr, 0)  # Mittelwert os/us für h
-        calls4 = h_c.calls
+        # Riemann-Ø extrapoliert über die Stufen 1, 2, 4, ..., nr
+        (nex0, rexh), dt48 = timed_call(riemann_extrapoliert, nr, a, b, h_c, hs_safe, h_safe, kr, 0, ext=ext_h)
+        calls48 = h_c.calls
         h_c.reset()
 
-        rmhs, dt5 = timed_call(mittel_riemann, nr, a, b,  h_safe, hs_c,hs_safe, kr, 1)  # Mittelwert os/us für hs
-        calls5 = hs_c.calls
+        (nex1, rexhs), dt49 = timed_call(riemann_extrapoliert, nr, a, b, h_safe, hs_c, hs_safe, kr, 1, ext=ext_hs)
+        calls49 = hs_c.calls
         hs_c.reset()
         # ------------------------------------------------------------
         # Analytisch (Referenzwert, falls möglich)
@@ -367,30 +475,40 @@ class Controller:
         # ------------------------------------------------------------
         # Fehlergesteuerte n-Suche (erhöht n, bis err erreicht wird)
         # ------------------------------------------------------------
-        (ne0, fruh), dt6 = timed_call(errunter, err, h_c, hs_safe , a, b, h_safe,Ih, krs, kr, 0)
+        (ne0, fruh), dt6 = timed_call(errunter, err, h_c, hs_safe , a, b, h_safe,Ih, krs, kr, 0, ext=ext_h)
         calls6 = h_c.calls
         h_c.reset()
 
-        (ne1, fruhs), dt7 = timed_call(errunter, err,  h_safe, hs_c, a, b,hs_safe ,Ihs, krs, kr, 1)
+        (ne1, fruhs), dt7 = timed_call(errunter, err,  h_safe, hs_c, a, b,hs_safe ,Ihs, krs, kr, 1, ext=ext_hs)
         calls7 = hs_c.calls
         hs_c.reset()
 
-        (ne2, froh), dt8 = timed_call(errober, err, h_c, hs_safe , a, b, h_safe,Ih, krs, kr, 0)
+        (ne2, froh), dt8 = timed_call(errober, err, h_c, hs_safe , a, b, h_safe,Ih, krs, kr, 0, ext=ext_h)
         calls8 = h_c.calls
         h_c.reset()
 
-        (ne3, frohs), dt9 = timed_call(errober, err,  h_safe, hs_c, a, b,hs,Ihs, krs, kr, 1)
+        (ne3, frohs), dt9 = timed_call(errober, err,  h_safe, hs_c, a, b,hs,Ihs, krs, kr, 1, ext=ext_hs)
         calls9 = hs_c.calls
         hs_c.reset()
 
-        (ne4, fmh), dt10 = timed_call(err_mittel_riemann, err, a, b, h_c, hs_safe , h_safe,Ih, krs, kr, 0)
+        (ne4, fmh), dt10 = timed_call(err_mittel_riemann, err, a, b, h_c, hs_safe , h_safe,Ih, krs, kr, 0, ext=ext_h)
         calls10 = h_c.calls
         h_c.reset()
 
-        (ne5, fmhs), dt11 = timed_call(err_mittel_riemann, err, a, b,  h_safe, hs_c,hs_safe ,Ihs, krs, kr, 1)
+        (ne5, fmhs), dt11 = timed_call(err_mittel_riemann, err, a, b,  h_safe, hs_c,hs_safe ,Ihs, krs, kr, 1, ext=ext_hs)
         calls11 = hs_c.calls
         hs_c.reset()
 
+        (ne26, frexh), dt50 = timed_call(err_riemann_extrapoliert, err, a, b, h_c, hs_safe, h_safe, Ih, krs, kr, 0,
+                                         ext=ext_h)
+        calls50 = h_c.calls
+        h_c.reset()
+
+        (ne27, frexhs), dt51 = timed_call(err_riemann_extrapoliert, err, a, b, h_safe, hs_c, hs_safe, Ihs, krs, kr, 1,
+                                          ext=ext_hs)
+        calls51 = hs_c.calls
+        hs_c.reset()
+
         (ne6, seh), dt12 = timed_call(simpsonerr, h_c, hs_safe , err, a, b,Ih, ks, 0)
         calls12 = h_c.calls
         h_c.reset()
@@ -407,21 +525,154 @@ class Controller:
         calls15 = hs_c.calls
         hs_c.reset()
 
-        (ne10, meh,Zeh), dt16 = timed_call(errmonte, err, a, b, h_c, hs_safe ,kma, h_safe,Ih, km, 0)
-        calls16 = h_c.calls
+        (ne24, teemh), dt46 = timed_call(trapezerr_em, err, h_c, hs_safe, a, b, Ih, dh, dhs, kt, 0)
+        calls46 = h_c.calls
         h_c.reset()
 
-        (ne11, mehs,Zehs), dt17 = timed_call(errmonte, err, a, b,  h_safe, hs_c,kma,hs_safe,Ihs, km, 1)
-        calls17 = hs_c.calls
+        (ne25, teemhs), dt47 = timed_call(trapezerr_em, err, h_safe, hs_c, a, b, Ihs, dh, dhs, kt, 1)
+        calls47 = hs_c.calls
         hs_c.reset()
 
-        (ne12,mmeh),dta=timed_call(err_mittel_monte,err,a, b, h_c, hs_safe, kma, h_safe,wm,kmi,Ih, 0)
-        callsa = h_c.calls
+        (ne14, rbeh), dt30 = timed_call(rombergerr, err, h_c, hs_safe, a, b, Ih, 0)
+        calls30 = h_c.calls
+        h_c.reset()
+
+        (ne15, rbehs), dt31 = timed_call(rombergerr, err, h_safe, hs_c, a, b, Ihs, 1)
+        calls31 = hs_c.calls
+        hs_c.reset()
+
+        (ne18, geh), dt34 = timed_call(gausserr, err, h_c, hs_safe, a, b, Ih, kt, 0, go)
+        calls34 = h_c.calls
+        h_c.reset()
+
+        (ne19, gehs), dt35 = timed_call(gausserr, err, h_safe, hs_c, a, b, Ihs, kt, 1, go)
+        calls35 = hs_c.calls
+        hs_c.reset()
+
+        # Clenshaw-Curtis (stoppt über Abklingen der Tschebyschow-Koeffizienten, Ih/Ihs nur für die Fehlerspalten)
+        (ne20, cceh, ok20), dt38 = timed_call(clenshaw_curtis_err, err, h_c, hs_safe, a, b, 0)
+        calls38 = h_c.calls
+        h_c.reset()
+
+        (ne21, ccehs, ok21), dt39 = timed_call(clenshaw_curtis_err, err, h_safe, hs_c, a, b, 1)
+        calls39 = hs_c.calls
+        hs_c.reset()
+        # nmax erreicht, ohne dass die Fehlerschätzung err unterschritten hat -> melden und in der n-Spalte markieren
+        if not ok20:
+            self.log(f"Clenshaw-Curtis (h): err={err} bis Grad {ne20} nicht erreicht")
+            ne20 = f"{ne20} (max)"
+        if not ok21:
+            self.log(f"Clenshaw-Curtis (hs): err={err} bis Grad {ne21} nicht erreicht")
+            ne21 = f"{ne21} (max)"
+
+        # Tanh-Sinh wertet nie an den Rändern aus -> ungeschützte h/hs (ohne eps-Ersetzung), eigene Zähler
+        h_rc = CountedFunction(h, name="h")
+        hs_rc = CountedFunction(hs, name="hs")
+        (ne22, tseh, ok22), dt42 = timed_call(tanh_sinh, err, h_rc, hs, a, b, 0)
+        calls42 = h_rc.calls
+
+        (ne23, tsehs, ok23), dt43 = timed_call(tanh_sinh, err, h, hs_rc, a, b, 1)
+        calls43 = hs_rc.calls
+
+        # maxstufe erreicht, ohne dass err unterschritten wurde -> melden und markieren
+        if not ok22:
+            self.log(f"Tanh-Sinh (h): err={err} nach {ne22} Knoten nicht erreicht")
+            ne22 = f"{ne22} (max)"
+        if not ok23:
+            self.log(f"Tanh-Sinh (hs): err={err} nach {ne23} Knoten nicht erreicht")
+            ne23 = f"{ne23} (max)"
+
+        # adaptiv (stoppt über eigene Fehlerschätzung, Ih/Ihs nur für die Fehlerspalten)
+        (ne16, akh, ok16), dt32 = timed_call(adaptiv_gk, err, h_c, hs_safe, a, b, 0)
+        calls32 = h_c.calls
         h_c.reset()
 
-        (ne13,mmehs),dtb=timed_call(err_mittel_monte,err,a, b, h_safe, hs_c, kma, hs_safe,wm,kmi,Ihs, 1)
-        callsb = hs_c.calls
+        (ne17, akhs, ok17), dt33 = timed_call(adaptiv_gk, err, h_safe, hs_c, a, b, 1)
+        calls33 = hs_c.calls
         hs_c.reset()
+        # maxint erreicht, ohne dass die Fehlerschätzung err unterschritten hat -> melden und in der n-Spalte markieren
+        if not ok16:
+            self.log(f"Gauß-Kronrod adaptiv (h): err={err} nach {ne16} Teilintervallen nicht erreicht")
+            ne16 = f"{ne16} (max)"
+        if not ok17:
+            self.log(f"Gauß-Kronrod adaptiv (hs): err={err} nach {ne17} Teilintervallen nicht erreicht")
+            ne17 = f"{ne17} (max)"
+
+        # Treffer-Methoden: ein Prozess-Pool für alle Zeilen dieses Laufs (Worker starten erst beim ersten großen
+        # Auftrag und werden auch bei Fehlern beendet)
+        with TrefferPool(prozesse, (h_c, hs_c)) as pool:
+            (ne10, meh,Zeh), dt16 = timed_call(errmonte, err, a, b, h_c, hs_safe ,kma, h_safe,Ih, km, 0,
+                                                     rng=rng_err_h, pool=pool, verfahren=mcv, verfeinern=mref)
+            calls16 = h_c.calls
+            h_c.reset()
+
+            (ne11, mehs,Zehs), dt17 = timed_call(errmonte, err, a, b,  h_safe, hs_c,kma,hs_safe,Ihs, km, 1,
+                                                        rng=rng_err_hs, pool=pool, verfahren=mcv, verfeinern=mref)
+            calls17 = hs_c.calls
+            hs_c.reset()
+
+            (ne12,mmeh),dta=timed_call(err_mittel_monte,err,a, b, h_c, hs_safe, kma, h_safe,wm,kmi,Ih, 0,
+                                                rng=rng_emm_h, pool=pool, verfahren=mcv, verfeinern=mref)
+            callsa = h_c.calls
+            h_c.reset()
+
+            (ne13,mmehs),dtb=timed_call(err_mittel_monte,err,a, b, h_safe, hs_c, kma, hs_safe,wm,kmi,Ihs, 1,
+                                                  rng=rng_emm_hs, pool=pool, verfahren=mcv, verfeinern=mref)
+            callsb = hs_c.calls
+            hs_c.reset()
+
+            # Stoppregel über das Konfidenzintervall (ohne Referenzwert): N, Näherung, halbe KI-Breite
+            (ne28, mkih, hw_kih), dt54 = timed_call(errmonte_ki, err, a, b, h_c, hs_safe, kma, h_safe, km, 0, ki,
+                                                    rng=rng_ki_h, pool=pool, verfahren=mcv, verfeinern=mref)
+            calls54 = h_c.calls
+            h_c.reset()
+
+            (ne29, mkihs, hw_kihs), dt55 = timed_call(errmonte_ki, err, a, b, h_safe, hs_c, kma, hs_safe, km, 1, ki,
+                                                      rng=rng_ki_hs, pool=pool, verfahren=mcv, verfeinern=mref)
+            calls55 = hs_c.calls
+            hs_c.reset()
+
+            # Ø KI: bei QMC kommt das KI aus der Streuung der wm Replikate -> erst ab wm >= 2 möglich
+            ki_mittel = mcv == "zufall" or wm >= 2
+            if ki_mittel:
+                (ne30, mmkih, hw_mmkih), dt56 = timed_call(err_mittel_monte_ki, err, a, b, h_c, hs_safe, kma, h_safe,
+                                                           wm, kmi, 0, ki, rng=rng_kim_h, pool=pool, verfahren=mcv,
+                                                           verfeinern=mref)
+                calls56 = h_c.calls
+                h_c.reset()
+
+                (ne31, mmkihs, hw_mmkihs), dt57 = timed_call(err_mittel_monte_ki, err, a, b, h_safe, hs_c, kma, hs_safe,
+                                                             wm, kmi, 1, ki, rng=rng_kim_hs, pool=pool,
+                                                             verfahren=mcv, verfeinern=mref)
+                calls57 = hs_c.calls
+                hs_c.reset()
+            else:
+                self.log("Monte Ø KI: bei QMC werden mindestens 2 Läufe benötigt (wm >= 2), "
+                         "Zeile wird mit - angezeigt")
+
+            # Treffer-Methode mit festem N (für den Plot werden höchstens mplot Punkte behalten)
+            (mch,Zih,xzh,yzh,trh),dt24 = timed_call(geomonte,N, a, b, h_c, hs_safe ,kma, h_safe, 0,
+                                                         rng=rng_geo_h, verfahren=mcv, verfeinern=mref, behalten=mplot,
+                                                         pool=pool)
+            calls24 = h_c.calls
+            h_c.reset()
+
+            (mchs,Zihs,xzhs,yzhs,trhs), dt25 = timed_call(geomonte, N, a, b, h_safe, hs_c,kma,hs_safe , 1,
+                                                               rng=rng_geo_hs, verfahren=mcv, verfeinern=mref,
+                                                               behalten=mplot, pool=pool)
+            calls25 = hs_c.calls
+            hs_c.reset()
+
+            # Mittelwert über wm Läufe samt Standardfehler (bei QMC: randomisierte Replikate)
+            (mmh,se_mmh),dt26=timed_call(replikat_monte,N, a, b, h_c, hs_safe, kma, h_safe,wm, 0, rng=rng_mm_h,
+                                         pool=pool, verfahren=mcv, verfeinern=mref)
+            calls26 = h_c.calls
+            h_c.reset()
+
+            (mmhs,se_mmhs),dt27=timed_call(replikat_monte,N, a, b, h_safe, hs_c, kma, hs_safe,wm, 1, rng=rng_mm_hs,
+                                           pool=pool, verfahren=mcv, verfeinern=mref)
+            calls27 = hs_c.calls
+            hs_c.reset()
 
         # ------------------------------------------------------------
         # Fixe Simpson/Trapez/Monte Carlo (mit vorgegebenem ns/nt/N)
@@ -442,25 +693,70 @@ class Controller:
         calls23 = hs_c.calls
         hs_c.reset()
 
-        (mch,Zih,xzh,yzh),dt24 = timed_call(geomonte,N, a, b, h_c, hs_safe ,kma, h_safe, 0)
-        calls24 = h_c.calls
+        temh, dt44 = timed_call(trapezregel_em, nt, h_c, hs_safe, a, b, dh, dhs, 0)
+        calls44 = h_c.calls
+        h_c.reset()
+
+        temhs, dt45 = timed_call(trapezregel_em, nt, h_safe, hs_c, a, b, dh, dhs, 1)
+        calls45 = hs_c.calls
+        hs_c.reset()
+
+        (nro0, rbh), dt28 = timed_call(romberg, nt, h_c, hs_safe, a, b, 0)
+        calls28 = h_c.calls
         h_c.reset()
 
-        (mchs,Zihs,xzhs,yzhs), dt25 = timed_call(geomonte, N, a, b, h_safe, hs_c,kma,hs_safe , 1)
-        calls25 = hs_c.calls
+        (nro1, rbhs), dt29 = timed_call(romberg, nt, h_safe, hs_c, a, b, 1)
+        calls29 = hs_c.calls
         hs_c.reset()
 
-        mmh,dt26=timed_call(mittel_monte,N, a, b, h_c, hs_safe, kma, h_safe,wm, 0)
-        calls26 = h_c.calls
+        # Gauß-Legendre mit nt Teilintervallen zu je go Knoten
+        gh, dt36 = timed_call(gaussregel, nt, h_c, hs_safe, a, b, 0, go)
+        calls36 = h_c.calls
         h_c.reset()
 
-        mmhs,dt27=timed_call(mittel_monte,N, a, b, h_safe, hs_c, kma, hs_safe,wm, 1)
-        calls27 = hs_c.calls
+        ghs, dt37 = timed_call(gaussregel, nt, h_safe, hs_c, a, b, 1, go)
+        calls37 = hs_c.calls
         hs_c.reset()
 
+        # Clenshaw-Curtis mit nt+1 Tschebyschow-Punkten
+        cch, dt40 = timed_call(clenshaw_curtis, nt, h_c, hs_safe, a, b, 0)
+        calls40 = h_c.calls
+        h_c.reset()
+
+        cchs, dt41 = timed_call(clenshaw_curtis, nt, h_safe, hs_c, a, b, 1)
+        calls41 = hs_c.calls
+        hs_c.reset()
+
+        # Geschichtete Treffer-Methode: Hüllkurve aus den Maxima der nr Riemann-Teilintervalle (gleiches rm/ext)
+        (msth, Zsth, var_sth), dt52 = timed_call(geomonte_strata, N, a, b, h_c, hs_safe, h_safe, nr, 0, kr,
+                                                 rng=rng_st_h, verfahren=mcv, ext=ext_h)
+        calls52 = h_c.calls
+        h_c.reset()
+
+        (msths, Zsths, var_sths), dt53 = timed_call(geomonte_strata, N, a, b, h_safe, hs_c, hs_safe, nr, 1, kr,
+                                                    rng=rng_st_hs, verfahren=mcv, ext=ext_hs)
+        calls53 = hs_c.calls
+        hs_c.reset()
+
+        # Mittelwert-Monte-Carlo: Stichprobenmittel, antithetisch, Trapez-Interpolante (nt) als Kontrollvariate
+        # je Schätzer und Funktion: fix mit N und fehlergesteuert (Ergebnis, Varianz, Zeit, Aufrufe)
+        mw_namen = {"mittel": "MC Mittelwert", "antithetisch": "MC antithetisch", "kontrolle": "MC Kontrollvariate"}
+        mw, mw_err = {}, {}
+        for schaetzer in mw_namen:
+            for m, (fh, fhs, fc, Iref) in enumerate(((h_c, hs_safe, h_c, Ih), (h_safe, hs_c, hs_c, Ihs))):
+                (I_mw, var_mw), dt_mw = timed_call(mittelwert_monte, N, a, b, fh, fhs, m, schaetzer, nt,
+                                                   rng=next(rng_mw), verfahren=mcv)
+                mw[schaetzer, m] = (I_mw, var_mw, dt_mw, fc.calls)
+                fc.reset()
+                (n_mw, I_mw, var_mw), dt_mw = timed_call(err_mittelwert_monte, err, a, b, fh, fhs, Iref, km, m,
+                                                         schaetzer, nt, rng=next(rng_mw), verfahren=mcv)
+                mw_err[schaetzer, m] = (n_mw, I_mw, var_mw, dt_mw, fc.calls)
+                fc.reset()
+
         # Monte-Carlo-Punkte speichern, damit _draw_plots darauf zugreifen kann
-        self._mc_h = {"Zih": Zih, "xzh": xzh, "yzh": yzh}
-        self._mc_hs = {"Zihs": Zihs, "xzhs": xzhs, "yzhs": yzhs}
+        # (nur die höchstens mplot behaltenen Punkte samt Treffer-Markierung)
+        self._mc_h = {"Zih": Zih, "xzh": xzh, "yzh": yzh, "trh": trh}
+        self._mc_hs = {"Zihs": Zihs, "xzhs": xzhs, "yzhs": yzhs, "trhs": trhs}
 
         # ------------------------------------------------------------
         # Fehler berechnen (Vergleich zu analytischem Referenzwert)
@@ -469,19 +765,34 @@ class Controller:
         e_ruh = error(ruh, ruhs,Ih,Ihs, a, b,)
         e_roh = error(roh, rohs,Ih,Ihs, a, b,)
         e_rmh = error(rmh, rmhs,Ih,Ihs, a, b,)
+        e_rex = error(rexh, rexhs,Ih,Ihs, a, b,)
         e_th = error(th, ths,Ih,Ihs, a, b,)
+        e_tem = error(temh, temhs,Ih,Ihs, a, b,)
         e_sh = error(sh, shs,Ih,Ihs, a, b,)
+        e_rb = error(rbh, rbhs,Ih,Ihs, a, b,)
+        e_g = error(gh, ghs,Ih,Ihs, a, b,)
+        e_cc = error(cch, cchs,Ih,Ihs, a, b,)
         e_monte = error(mch, mchs,Ih,Ihs, a, b,)
         e_mmonte = error(mmh,mmhs,Ih,Ihs, a, b,)
+        e_mst = error(msth, msths,Ih,Ihs, a, b,)
 
         # für die err-Zeile
         e_fruh = error(fruh, fruhs,Ih,Ihs, a, b,)
         e_froh = error(froh, frohs,Ih,Ihs, a, b,)
         e_fmh = error(fmh, fmhs,Ih,Ihs, a, b,)
+        e_frex = error(frexh, frexhs,Ih,Ihs, a, b,)
         e_teh = error(teh, tehs,Ih,Ihs, a, b,)
+        e_teem = error(teemh, teemhs,Ih,Ihs, a, b,)
         e_seh = error(seh, sehs,Ih,Ihs, a, b,)
+        e_rbeh = error(rbeh, rbehs,Ih,Ihs, a, b,)
+        e_geh = error(geh, gehs,Ih,Ihs, a, b,)
+        e_cceh = error(cceh, ccehs,Ih,Ihs, a, b,)
+        e_tseh = error(tseh, tsehs,Ih,Ihs, a, b,)
+        e_ak = error(akh, akhs,Ih,Ihs, a, b,)
         e_meh2 = error(meh, mehs,Ih,Ihs, a, b,)
         e_mmeh = error(mmeh, mmehs,Ih,Ihs, a, b,)
+        e_mki = error(mkih, mkihs,Ih,Ihs, a, b,)
+        e_mmki = error(mmkih, mmkihs,Ih,Ihs, a, b,) if ki_mittel else None
 
 
         # Formatierung für GUI-Anzeige (Zahlen/Zeiten/Prozente schön darstellen)
@@ -496,32 +807,67 @@ class Controller:
                                      )
         self.w.tree_eval_func.insert("", "end",
                                      values=("Riemann O", nr, _fmt_num(roh), _fmt_abs(e_roh[0]), _fmt_pct(e_roh[2]),
-                                             _fmt_dt(dt1), calls1)
+                                             _fmt_dt(dt0), calls0)
                                      )
         self.w.tree_eval_func.insert("", "end",
                                      values=("Riemann Ø", nr, _fmt_num(rmh), _fmt_abs(e_rmh[0]), _fmt_pct(e_rmh[2]),
-                                             _fmt_dt(dt4), calls4)
+                                             _fmt_dt(dt0), calls0)
+                                     )
+        self.w.tree_eval_func.insert("", "end",
+                                     values=("Riemann Ø extrapoliert", nex0, _fmt_num(rexh), _fmt_abs(e_rex[0]),
+                                             _fmt_pct(e_rex[2]), _fmt_dt(dt48), calls48)
                                      )
         # Trapez / Simpson (fixe nt/ns)
         self.w.tree_eval_func.insert("", "end",
                                      values=("Trapez", nt, _fmt_num(th), _fmt_abs(e_th[0]), _fmt_pct(e_th[2]),
                                              _fmt_dt(dt22), calls22)
                                      )
+        self.w.tree_eval_func.insert("", "end",
+                                     values=("Trapez EM", nt, _fmt_num(temh), _fmt_abs(e_tem[0]), _fmt_pct(e_tem[2]),
+                                             _fmt_dt(dt44), calls44)
+                                     )
         self.w.tree_eval_func.insert("", "end",
                                      values=("Simpson", ns, _fmt_num(sh), _fmt_abs(e_sh[0]), _fmt_pct(e_sh[2]),
                                              _fmt_dt(dt20), calls20)
                                      )
+        self.w.tree_eval_func.insert("", "end",
+                                     values=("Romberg", nro0, _fmt_num(rbh), _fmt_abs(e_rb[0]), _fmt_pct(e_rb[2]),
+                                             _fmt_dt(dt28), calls28)
+                                     )
+        self.w.tree_eval_func.insert("", "end",
+                                     values=(f"Gauß-Legendre ({go})", nt, _fmt_num(gh), _fmt_abs(e_g[0]), _fmt_pct(e_g[2]),
+                                             _fmt_dt(dt36), calls36)
+                                     )
+        self.w.tree_eval_func.insert("", "end",
+                                     values=("Clenshaw-Curtis", nt, _fmt_num(cch), _fmt_abs(e_cc[0]), _fmt_pct(e_cc[2]),
+                                             _fmt_dt(dt40), calls40)
+                                     )
 
         # Monte Carlo (Anzeige: Treffer|N)
         self.w.tree_eval_func.insert("", "end",
                                      values=("Monte Carlo", f"{Zih}|{N}", _fmt_num(mch), _fmt_abs(e_monte[0]),
                                              _fmt_pct(e_monte[2]), _fmt_dt(dt24), calls24)
                                      )
-        # Monte Carlo (Anzeige: N)
+        # Monte Carlo mit stückweiser Hüllkurve (Anzeige: Treffer|N und Varianz)
+        self.w.tree_eval_func.insert("", "end",
+                                     values=("Monte Carlo geschichtet", f"{Zsth}|{N} σ²={var_sth:.1e}", _fmt_num(msth),
+                                             _fmt_abs(e_mst[0]), _fmt_pct(e_mst[2]), _fmt_dt(dt52), calls52)
+                                     )
+        # Monte Carlo (Anzeige: N ± Standardfehler)
         self.w.tree_eval_func.insert("", "end",
-                                     values=("Monte Carlo Ø", f"{N}", _fmt_num(mmh), _fmt_abs(e_mmonte[0]),
+                                     values=("Monte Carlo Ø", f"{N} ±{se_mmh:.1e}", _fmt_num(mmh), _fmt_abs(e_mmonte[0]),
                                              _fmt_pct(e_mmonte[2]), _fmt_dt(dt26), calls26)
                                      )
+        # Mittelwert-Monte-Carlo (Anzeige: N und Varianz des Schätzers)
+        for schaetzer, name in mw_namen.items():
+            I_mw, var_mw, dt_mw, calls_mw = mw[schaetzer, 0]
+            # Fehler direkt gegen den Referenzwert (absolut und in %)
+            e_abs = abs(I_mw - Ih)
+            e_pct = 100 * e_abs / abs(Ih) if Ih else 0.0
+            self.w.tree_eval_func.insert("", "end",
+                                         values=(name, f"{N} σ²={var_mw:.1e}", _fmt_num(I_mw), _fmt_abs(e_abs),
+                                                 _fmt_pct(e_pct), _fmt_dt(dt_mw), calls_mw)
+                                         )
 
         # Fehlergesteuerte n-Suche (h)
         self.w.tree_eval_func.insert("", "end",
@@ -536,14 +882,42 @@ class Controller:
                                      values=(f"Riemann Ø err={err}", ne4, _fmt_num(fmh), _fmt_abs(e_fmh[0]),
                                              _fmt_pct(e_fmh[2]), _fmt_dt(dt10), calls10)
                                      )
+        self.w.tree_eval_func.insert("", "end",
+                                     values=(f"Riemann Ø extrapoliert err={err}", ne26, _fmt_num(frexh),
+                                             _fmt_abs(e_frex[0]), _fmt_pct(e_frex[2]), _fmt_dt(dt50), calls50)
+                                     )
         self.w.tree_eval_func.insert("", "end",
                                      values=(f"Trapez err={err}", ne8, _fmt_num(teh), _fmt_abs(e_teh[0]),
                                              _fmt_pct(e_teh[2]), _fmt_dt(dt14), calls14)
                                      )
+        self.w.tree_eval_func.insert("", "end",
+                                     values=(f"Trapez EM err={err}", ne24, _fmt_num(teemh), _fmt_abs(e_teem[0]),
+                                             _fmt_pct(e_teem[2]), _fmt_dt(dt46), calls46)
+                                     )
         self.w.tree_eval_func.insert("", "end",
                                      values=(f"Simpson err={err}", ne6, _fmt_num(seh), _fmt_abs(e_seh[0]),
                                              _fmt_pct(e_seh[2]), _fmt_dt(dt12), calls12)
                                      )
+        self.w.tree_eval_func.insert("", "end",
+                                     values=(f"Romberg err={err}", ne14, _fmt_num(rbeh), _fmt_abs(e_rbeh[0]),
+                                             _fmt_pct(e_rbeh[2]), _fmt_dt(dt30), calls30)
+                                     )
+        self.w.tree_eval_func.insert("", "end",
+                                     values=(f"Gauß-Legendre err={err}", ne18, _fmt_num(geh), _fmt_abs(e_geh[0]),
+                                             _fmt_pct(e_geh[2]), _fmt_dt(dt34), calls34)
+                                     )
+        self.w.tree_eval_func.insert("", "end",
+                                     values=(f"Clenshaw-Curtis err={err}", ne20, _fmt_num(cceh), _fmt_abs(e_cceh[0]),
+                                             _fmt_pct(e_cceh[2]), _fmt_dt(dt38), calls38)
+                                     )
+        self.w.tree_eval_func.insert("", "end",
+                                     values=(f"Tanh-Sinh err={err}", ne22, _fmt_num(tseh), _fmt_abs(e_tseh[0]),
+                                             _fmt_pct(e_tseh[2]), _fmt_dt(dt42), calls42)
+                                     )
+        self.w.tree_eval_func.insert("", "end",
+                                     values=(f"Gauß-Kronrod adaptiv err={err}", ne16, _fmt_num(akh), _fmt_abs(e_ak[0]),
+                                             _fmt_pct(e_ak[2]), _fmt_dt(dt32), calls32)
+                                     )
         self.w.tree_eval_func.insert("", "end",
                                      values=(f"Monte err={err}", f"{Zeh}|{ne10}", _fmt_num(meh), _fmt_abs(e_meh2[0]),
                                              _fmt_pct(e_meh2[2]), _fmt_dt(dt16), calls16)
@@ -553,6 +927,25 @@ class Controller:
                                      values=(f"Monte Ø err={err}", f"{ne12}", _fmt_num(mmeh), _fmt_abs(e_mmeh[0]),
                                              _fmt_pct(e_mmeh[2]), _fmt_dt(dta), callsa)
                                      )
+        # KI-Stoppregel (Anzeige: N ± halbe KI-Breite)
+        self.w.tree_eval_func.insert("", "end",
+                                     values=(f"Monte KI err={err}", f"{ne28} ±{hw_kih:.1e}", _fmt_num(mkih),
+                                             _fmt_abs(e_mki[0]), _fmt_pct(e_mki[2]), _fmt_dt(dt54), calls54)
+                                     )
+        self.w.tree_eval_func.insert("", "end",
+                                     values=(f"Monte Ø KI err={err}", f"{ne30} ±{hw_mmkih:.1e}", _fmt_num(mmkih),
+                                             _fmt_abs(e_mmki[0]), _fmt_pct(e_mmki[2]), _fmt_dt(dt56), calls56)
+                                     if ki_mittel else (f"Monte Ø KI err={err}", "-", "-", "-", "-", "-", "-")
+                                     )
+        for schaetzer, name in mw_namen.items():
+            n_mw, I_mw, var_mw, dt_mw, calls_mw = mw_err[schaetzer, 0]
+            # Fehler direkt gegen den Referenzwert (absolut und in %)
+            e_abs = abs(I_mw - Ih)
+            e_pct = 100 * e_abs / abs(Ih) if Ih else 0.0
+            self.w.tree_eval_func.insert("", "end",
+                                         values=(f"{name} err={err}", f"{n_mw} σ²={var_mw:.1e}", _fmt_num(I_mw),
+                                                 _fmt_abs(e_abs), _fmt_pct(e_pct), _fmt_dt(dt_mw), calls_mw)
+                                         )
 
         # Referenzwert (analytisch) als letzte Zeile
         self.w.tree_eval_func.insert("", "end",
@@ -570,11 +963,15 @@ class Controller:
                                        )
         self.w.tree_eval_spline.insert("", "end",
                                        values=("Riemann O", nr, _fmt_num(rohs), _fmt_abs(e_roh[1]), _fmt_pct(e_roh[3]),
-                                               _fmt_dt(dt2), calls2)
+                                               _fmt_dt(dt3), calls3)
                                        )
         self.w.tree_eval_spline.insert("", "end",
                                        values=("Riemann Ø", nr, _fmt_num(rmhs), _fmt_abs(e_rmh[1]), _fmt_pct(e_rmh[3]),
-                                               _fmt_dt(dt5), calls5)
+                                               _fmt_dt(dt3), calls3)
+                                       )
+        self.w.tree_eval_spline.insert("", "end",
+                                       values=("Riemann Ø extrapoliert", nex1, _fmt_num(rexhs), _fmt_abs(e_rex[1]),
+                                               _fmt_pct(e_rex[3]), _fmt_dt(dt49), calls49)
                                        )
 
         # Trapez / Simpson (fixe nt/ns)
@@ -582,21 +979,53 @@ class Controller:
                                        values=("Trapez", nt, _fmt_num(ths), _fmt_abs(e_th[1]), _fmt_pct(e_th[3]),
                                                _fmt_dt(dt23), calls23)
                                        )
+        self.w.tree_eval_spline.insert("", "end",
+                                       values=("Trapez EM", nt, _fmt_num(temhs), _fmt_abs(e_tem[1]), _fmt_pct(e_tem[3]),
+                                               _fmt_dt(dt45), calls45)
+                                       )
         self.w.tree_eval_spline.insert("", "end",
                                        values=("Simpson", ns, _fmt_num(shs), _fmt_abs(e_sh[1]), _fmt_pct(e_sh[3]),
                                                _fmt_dt(dt21), calls21)
                                        )
+        self.w.tree_eval_spline.insert("", "end",
+                                       values=("Romberg", nro1, _fmt_num(rbhs), _fmt_abs(e_rb[1]), _fmt_pct(e_rb[3]),
+                                               _fmt_dt(dt29), calls29)
+                                       )
+        self.w.tree_eval_spline.insert("", "end",
+                                       values=(f"Gauß-Legendre ({go})", nt, _fmt_num(ghs), _fmt_abs(e_g[1]),
+                                               _fmt_pct(e_g[3]), _fmt_dt(dt37), calls37)
+                                       )
+        self.w.tree_eval_spline.insert("", "end",
+                                       values=("Clenshaw-Curtis", nt, _fmt_num(cchs), _fmt_abs(e_cc[1]),
+                                               _fmt_pct(e_cc[3]), _fmt_dt(dt41), calls41)
+                                       )
 
         # Monte Carlo
         self.w.tree_eval_spline.insert("", "end",
                                        values=("Monte Carlo ", f"{Zihs}|{N}", _fmt_num(mchs), _fmt_abs(e_monte[1]),
                                                _fmt_pct(e_monte[3]), _fmt_dt(dt25), calls25)
                                        )
-        # Monte Carlo (Anzeige: N)
+        # Monte Carlo mit stückweiser Hüllkurve (Anzeige: Treffer|N und Varianz)
         self.w.tree_eval_spline.insert("", "end",
-                                     values=("Monte Carlo Ø", f"{N}", _fmt_num(mmhs), _fmt_abs(e_mmonte[1]),
+                                       values=("Monte Carlo geschichtet", f"{Zsths}|{N} σ²={var_sths:.1e}",
+                                               _fmt_num(msths), _fmt_abs(e_mst[1]), _fmt_pct(e_mst[3]),
+                                               _fmt_dt(dt53), calls53)
+                                       )
+        # Monte Carlo (Anzeige: N ± Standardfehler)
+        self.w.tree_eval_spline.insert("", "end",
+                                     values=("Monte Carlo Ø", f"{N} ±{se_mmhs:.1e}", _fmt_num(mmhs), _fmt_abs(e_mmonte[1]),
                                              _fmt_pct(e_mmonte[3]), _fmt_dt(dt27), calls27)
                                      )
+        # Mittelwert-Monte-Carlo (Anzeige: N und Varianz des Schätzers)
+        for schaetzer, name in mw_namen.items():
+            I_mw, var_mw, dt_mw, calls_mw = mw[schaetzer, 1]
+            # Fehler direkt gegen den Referenzwert (absolut und in %)
+            e_abs = abs(I_mw - Ihs)
+            e_pct = 100 * e_abs / abs(Ihs) if Ihs else 0.0
+            self.w.tree_eval_spline.insert("", "end",
+                                           values=(name, f"{N} σ²={var_mw:.1e}", _fmt_num(I_mw), _fmt_abs(e_abs),
+                                                   _fmt_pct(e_pct), _fmt_dt(dt_mw), calls_mw)
+                                           )
 
         # Fehlergesteuerte n-Suche (hs)
         self.w.tree_eval_spline.insert("", "end",
@@ -611,14 +1040,42 @@ class Controller:
                                        values=(f"Riemann Ø err={err}", ne5, _fmt_num(fmhs), _fmt_abs(e_fmh[1]),
                                                _fmt_pct(e_fmh[3]), _fmt_dt(dt11), calls11)
                                        )
+        self.w.tree_eval_spline.insert("", "end",
+                                       values=(f"Riemann Ø extrapoliert err={err}", ne27, _fmt_num(frexhs),
+                                               _fmt_abs(e_frex[1]), _fmt_pct(e_frex[3]), _fmt_dt(dt51), calls51)
+                                       )
         self.w.tree_eval_spline.insert("", "end",
                                        values=(f"Trapez err={err}", ne9, _fmt_num(tehs), _fmt_abs(e_teh[1]),
                                                _fmt_pct(e_teh[3]), _fmt_dt(dt15), calls15)
                                        )
+        self.w.tree_eval_spline.insert("", "end",
+                                       values=(f"Trapez EM err={err}", ne25, _fmt_num(teemhs), _fmt_abs(e_teem[1]),
+                                               _fmt_pct(e_teem[3]), _fmt_dt(dt47), calls47)
+                                       )
         self.w.tree_eval_spline.insert("", "end",
                                        values=(f"Simpson err={err}", ne7, _fmt_num(sehs), _fmt_abs(e_seh[1]),
                                                _fmt_pct(e_seh[3]), _fmt_dt(dt13), calls13)
                                        )
+        self.w.tree_eval_spline.insert("", "end",
+                                       values=(f"Romberg err={err}", ne15, _fmt_num(rbehs), _fmt_abs(e_rbeh[1]),
+                                               _fmt_pct(e_rbeh[3]), _fmt_dt(dt31), calls31)
+                                       )
+        self.w.tree_eval_spline.insert("", "end",
+                                       values=(f"Gauß-Legendre err={err}", ne19, _fmt_num(gehs), _fmt_abs(e_geh[1]),
+                                               _fmt_pct(e_geh[3]), _fmt_dt(dt35), calls35)
+                                       )
+        self.w.tree_eval_spline.insert("", "end",
+                                       values=(f"Clenshaw-Curtis err={err}", ne21, _fmt_num(ccehs), _fmt_abs(e_cceh[1]),
+                                               _fmt_pct(e_cceh[3]), _fmt_dt(dt39), calls39)
+                                       )
+        self.w.tree_eval_spline.insert("", "end",
+                                       values=(f"Tanh-Sinh err={err}", ne23, _fmt_num(tsehs), _fmt_abs(e_tseh[1]),
+                                               _fmt_pct(e_tseh[3]), _fmt_dt(dt43), calls43)
+                                       )
+        self.w.tree_eval_spline.insert("", "end",
+                                       values=(f"Gauß-Kronrod adaptiv err={err}", ne17, _fmt_num(akhs),
+                                               _fmt_abs(e_ak[1]), _fmt_pct(e_ak[3]), _fmt_dt(dt33), calls33)
+                                       )
         self.w.tree_eval_spline.insert("", "end",
                                        values=(f"Monte err={err}", f"{Zehs}|{ne11}", _fmt_num(mehs), _fmt_abs(e_meh2[1]),
                                                _fmt_pct(e_meh2[3]), _fmt_dt(dt17), calls17)
@@ -627,6 +1084,25 @@ class Controller:
                                      values=(f"Monte Ø err={err}", f"{ne13}", _fmt_num(mmehs), _fmt_abs(e_mmeh[1]),
                                              _fmt_pct(e_mmeh[3]), _fmt_dt(dtb), callsb)
                                      )
+        # KI-Stoppregel (Anzeige: N ± halbe KI-Breite)
+        self.w.tree_eval_spline.insert("", "end",
+                                       values=(f"Monte KI err={err}", f"{ne29} ±{hw_kihs:.1e}", _fmt_num(mkihs),
+                                               _fmt_abs(e_mki[1]), _fmt_pct(e_mki[3]), _fmt_dt(dt55), calls55)
+                                       )
+        self.w.tree_eval_spline.insert("", "end",
+                                       values=(f"Monte Ø KI err={err}", f"{ne31} ±{hw_mmkihs:.1e}", _fmt_num(mmkihs),
+                                               _fmt_abs(e_mmki[1]), _fmt_pct(e_mmki[3]), _fmt_dt(dt57), calls57)
+                                       if ki_mittel else (f"Monte Ø KI err={err}", "-", "-", "-", "-", "-", "-")
+                                       )
+        for schaetzer, name in mw_namen.items():
+            n_mw, I_mw, var_mw, dt_mw, calls_mw = mw_err[schaetzer, 1]
+            # Fehler direkt gegen den Referenzwert (absolut und in %)
+            e_abs = abs(I_mw - Ihs)
+            e_pct = 100 * e_abs / abs(Ihs) if Ihs else 0.0
+            self.w.tree_eval_spline.insert("", "end",
+                                           values=(f"{name} err={err}", f"{n_mw} σ²={var_mw:.1e}", _fmt_num(I_mw),
+                                                   _fmt_abs(e_abs), _fmt_pct(e_pct), _fmt_dt(dt_mw), calls_mw)
+                                           )
         self.w.tree_eval_spline.insert("", "end",
                                        values=("Integralwert (Referenz)", "-", _fmt_num(Ihs), _fmt_abs(0.0), _fmt_pct(0.0),
                                                _fmt_dt(dt19), calls19)
@@ -756,12 +1232,13 @@ class Controller:
 
         # 13. Plot Monte Carlo h (inkl. Zufallspunkte und Trefferzahl)
         self.w.axes[12].set_title("Monte Carlo zu $B(x)$")
-        plot_monte(self.w.axes[12],a, b, N,h,kma,mc_h["xzh"],mc_h["yzh"],mc_h["Zih"])
+        plot_monte(self.w.axes[12],a, b, N,h,kma,mc_h["xzh"],mc_h["yzh"],mc_h["Zih"], treffer=mc_h["trh"])
         self.w.canvases[12].draw()
 
         # 14. Plot Monte Carlo hs
         self.w.axes[13].set_title("Monte Carlo zu $B_s(x)$")
-        plot_monte(self.w.axes[13],a, b, N,hs,kma,mc_hs["xzhs"],mc_hs["yzhs"],mc_hs["Zihs"], "hs")
+        plot_monte(self.w.axes[13],a, b, N,hs,kma,mc_hs["xzhs"],mc_hs["yzhs"],mc_hs["Zihs"], "hs",
+                   treffer=mc_hs["trhs"])
         self.w.canvases[13].draw()
 
     # ------------------------------------------------------------
@@ -0,0 +1,109 @@
+# ------------------------------------------------------------
+# Zufallszahlen-Generatoren für die Monte-Carlo-Verfahren
+# ------------------------------------------------------------
+
+import warnings  # Sobol warnt bei Blockgrößen, die keine Zweierpotenz sind (für die Summe unerheblich)
+import numpy as np  # Modul zur Arbeit mit Arrays und numerischen Operationen
+from scipy.stats import qmc  # Sobol- und Halton-Folgen
+
+# erlaubte Bit-Generatoren (PCG64: schnell, Standard; Philox: zählerbasiert, gut für viele parallele Ströme)
+_BITGEN = {"pcg64": np.random.PCG64, "philox": np.random.Philox}
+
+
+# Baut aus seed / SeedSequence / Generator einen np.random.Generator
+#
+# Motivation:
+# Die globalen np.random-Funktionen teilen einen Zustand für das ganze Programm,
+# Läufe sind damit nicht reproduzierbar und parallele Ströme nicht unabhängig.
+def erzeuge_rng(rng=None, bitgen="pcg64"):
+    """
+    Liefert einen np.random.Generator.
+
+    Verhalten:
+    - rng ist bereits ein Generator -> unverändert zurück (bitgen wird ignoriert)
+    - rng ist None -> frischer Generator aus System-Entropie (nicht reproduzierbar)
+    - rng ist int oder np.random.SeedSequence -> reproduzierbarer Generator mit dem Bit-Generator bitgen
+    """
+    if isinstance(rng, np.random.Generator):
+        return rng
+    name = str(bitgen).lower()
+    if name not in _BITGEN:
+        raise ValueError(f"Unbekannter Bit-Generator {bitgen!r} (erlaubt: {', '.join(_BITGEN)})")
+    if not isinstance(rng, np.random.SeedSequence):
+        rng = np.random.SeedSequence(rng)
+    return np.random.Generator(_BITGEN[name](rng))
+
+
+# Teilt einen Generator in n unabhängige Kind-Ströme auf
+#
+# Die Kinder entstehen über SeedSequence.spawn, überlappen sich also nicht und können
+# gefahrlos in verschiedenen Threads/Prozessen oder für verschiedene Methoden genutzt werden.
+def teile_rng(rng, n):
+    """
+    Erzeugt n unabhängige Generatoren aus rng (Generator, int, SeedSequence oder None).
+    Der Bit-Generator-Typ von rng wird für die Kinder übernommen.
+    """
+    rng = erzeuge_rng(rng)
+    return rng.spawn(int(n))
+
+
+# ------------------------------------------------------------
+# Punktquelle im Einheitsquadrat (Pseudo-Zufall oder Quasi-Monte-Carlo)
+# ------------------------------------------------------------
+
+# erlaubte Verfahren: "zufall" = Pseudo-Zufallszahlen, sonst verwürfelte (scrambled) QMC-Folgen
+_QMC = {"sobol": qmc.Sobol, "halton": qmc.Halton}
+
+
+class Stichprobe:
+    """
+    Liefert Punkte im Einheitsquadrat [0,1)^2 für die Treffer-Methode, aufgeteilt auf wm Replikate.
+
+    - "zufall": unabhängige Pseudo-Zufallspunkte aus einem Generator (Replikate teilen sich den Strom)
+    - "sobol" / "halton": je Replikat eine eigene verwürfelte QMC-Folge (eigener, per spawn abgeleiteter Strom).
+      Die Folgen laufen weiter, wiederholtes Ziehen liefert also die Fortsetzung (wichtig für die inkrementellen
+      Fehlersuchen). Die Streuung der Replikate dient als Fehlerschätzung.
+    """
+
+    def __init__(self, verfahren="zufall", rng=None, wm=1):
+        """
+        Initialisiert die Punktquelle.
+
+        Parameter:
+            verfahren (str): "zufall", "sobol" oder "halton"
+            rng (np.random.Generator | int | None): Zufallsgenerator oder Seed (siehe erzeuge_rng)
+            wm (int): Anzahl der Replikate
+
+        Rückgabe:
+            keine
+        """
+        self.verfahren = str(verfahren).lower()
+        if self.verfahren != "zufall" and self.verfahren not in _QMC:
+            raise ValueError(f"Unbekanntes Verfahren {verfahren!r} (erlaubt: zufall, {', '.join(_QMC)})")
+        self.rng = erzeuge_rng(rng)
+        self.folgen = None
+        if self.verfahren in _QMC:
+            self.folgen = [_QMC[self.verfahren](2, scramble=True, seed=r) for r in self.rng.spawn(int(wm))]
+
+    def ziehe(self, c0, c1, N):
+        """
+        Zieht die Punkte mit flachem Index c0 <= j < c1, Punkt j gehört zum Replikat j // N.
+
+        Parameter:
+            c0 (int): Erster flacher Index
+            c1 (int): Flacher Index hinter dem letzten Punkt
+            N (int): Anzahl der Punkte pro Replikat
+
+        Rückgabe:
+            np.ndarray: Punkte der Form (c1-c0, 2) in [0,1)^2
+        """
+        if self.folgen is None:
+            return self.rng.random((c1 - c0, 2))
+        teile = []
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            for i in range(c0 // N, (c1 - 1) // N + 1):
+                # Abschnitt von Replikat i innerhalb des Blocks
+                j0, j1 = max(c0, i * N), min(c1, (i + 1) * N)
+                teile.append(self.folgen[i].random(j1 - j0))
+        return np.concatenate(teile)